@@ -1,32 +1,113 @@
 import os
+import sys
 import tkinter as tk
 from tkinter import scrolledtext, messagebox, ttk
 import threading
 import datetime
 import time
+import random
 import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit
 from bs4 import BeautifulSoup
 import re
+import math
+import heapq
+import bisect
+import json
+import argparse
+import hashlib
+import functools
+import itertools
+import mmap
+import struct
+import sqlite3
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from types import MappingProxyType
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 # =============================
 # SentriGuide AI Configuration
 # =============================
 TREND_MICRO_HELP_CENTER = "https://helpcenter.trendmicro.com/en-us/"
+DEFAULT_HELP_CENTER_BASE_URL = "https://helpcenter.trendmicro.com"
+HELP_CENTER_BASE_URL = os.environ.get("SENTRIGUIDE_HELP_CENTER_URL", DEFAULT_HELP_CENTER_BASE_URL).rstrip("/")  # Site scraped for search results and articles
+HELP_CENTER_FIXTURES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "helpcenter")  # Pages served by the local stand-in
 SEARCH_KEYWORDS = ["antivirus", "security", "malware", "threat", "protection", "scan", "update", "firewall", "email", "endpoint", "renew", "renewal", "subscription", "activate", "activation", "license", "expire", "expiration", "payment", "billing"]
+SESSION_IDLE_TIMEOUT = 30 * 60  # Seconds before an idle conversation session is evicted
+MAX_SESSIONS = 1000  # Upper bound on concurrently tracked conversation sessions
+ANALYSIS_WORKERS = 8  # Thread pool size shared by concurrent analysis stages
+GUI_CONVERSATION_ID = "desktop"  # Conversation ID the desktop UI schedules its analyses under
+CHAT_REFRESH_MS = 250  # Interval at which the engineer chat picks up new messages
+UI_QUEUE_DRAIN_MS = 50  # Interval at which the main loop paints UI updates queued by worker threads
+UI_QUEUE_MAX_PENDING = 64  # Distinct queued UI updates kept before the oldest is dropped
+TRANSCRIPT_WINDOW_MESSAGES = 60  # Messages a chat transcript keeps rendered: the visible ones plus a scroll buffer
+TRANSCRIPT_SCROLL_STEP = 20  # Messages the rendered window moves by when scrolling reaches its edge
+
+# Help Center search cache (set SENTRIGUIDE_CACHE_PATH to an empty string to keep it in memory only)
+HELP_CENTER_CACHE_PATH = os.environ.get("SENTRIGUIDE_CACHE_PATH", os.path.join(os.path.expanduser("~"), ".sentriguide", "helpcenter_cache.sqlite3"))
+HELP_CENTER_CACHE_TTL = 6 * 60 * 60  # Seconds before cached search results are refreshed
+HELP_CENTER_CACHE_MEMORY_ENTRIES = 256  # Queries kept in the in-memory LRU
+HELP_CENTER_CACHE_DISK_ENTRIES = 5000  # Queries kept in the on-disk store
+ARTICLE_FETCH_WORKERS = 5  # Article pages fetched in parallel for general solutions
+ARTICLE_FETCH_DEADLINE = 4  # Seconds to wait for article pages before showing partial solutions
+ARTICLE_FETCH_LIMIT = 5  # Top search results whose pages are fetched; the rest show default bullets
+HELP_CENTER_OFFLINE = os.environ.get("SENTRIGUIDE_OFFLINE", "") == "1"  # Answer from the search cache and local guides only
+REPLAY_WORKERS = os.cpu_count() or 4  # Processes used to replay archived transcripts
+REPLAY_QUEUE_DEPTH = 4  # Conversations queued per replay worker
+
+# Screen size remembered from the last UI run (set SENTRIGUIDE_SCREEN_CACHE_PATH to an empty string to disable)
+SCREEN_CACHE_PATH = os.environ.get("SENTRIGUIDE_SCREEN_CACHE_PATH", os.path.join(os.path.expanduser("~"), ".sentriguide", "screen.json"))
+DEFAULT_SCREEN_SIZE = (1920, 1080)  # Assumed before any UI has measured the real screen
+
+# Help Center HTTP client
+HELP_CENTER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+HTTP_POOL_SIZE = 10  # Keep-alive connections per host (also the per-host concurrency limit)
+HTTP_TIMEOUT = 10  # Seconds per request attempt
+HTTP_MAX_RETRIES = 2  # Extra attempts after a connection error or retryable status
+HTTP_RETRY_BACKOFF = 0.5  # Base seconds for jittered exponential backoff
+HTTP_MAX_RETRY_AFTER = 5  # Cap in seconds on server-requested Retry-After delays
+HTTP_TIMING_SAMPLES = 500  # Recent requests kept for timing stats
+KNOWLEDGE_PACK_PATH = os.environ.get("SENTRIGUIDE_KNOWLEDGE_PACK", os.path.join(os.path.dirname(os.path.abspath(__file__)), "sentriguide_knowledge.sgkp"))
+KNOWLEDGE_TITLE_BOOST = 3  # Weight of a title term relative to a snippet term in local knowledge ranking
+
+# Long-conversation context compaction
+CONTEXT_RECENT_TURNS = 6  # Most recent turns kept verbatim
+CONTEXT_SEGMENT_TURNS = 8  # Older turns digested into each segment summary
+CONTEXT_MERGE_FANOUT = 4  # Same-level segments merged into one summary a level up
+CONTEXT_MAX_SEGMENTS = 12  # Segment summaries kept before the oldest are merged further
+CONTEXT_SEGMENT_CHARS = 240  # Size budget for each segment summary line
+CONTEXT_TURN_CHARS = 500  # Longest verbatim turn included in context
+
+# Optional LLM backend for resolution confidence (local model only when SENTRIGUIDE_LLM_URL is unset)
+LLM_API_URL = os.environ.get("SENTRIGUIDE_LLM_URL", "")  # Messages API endpoint, e.g. http://127.0.0.1:8765/v1/messages
+LLM_MODEL = os.environ.get("SENTRIGUIDE_LLM_MODEL", "")
+LLM_API_KEY = os.environ.get("SENTRIGUIDE_LLM_API_KEY", "")
+LLM_MAX_TOKENS = 300
+LLM_TIMEOUT = 30  # Seconds per LLM request
+LLM_CACHE_ENTRIES = 512  # Responses kept by the prompt cache
+LLM_CACHE_TTL = 10 * 60  # Seconds a cached response stays valid
 
 # =============================
 # Responsive UI Scaling System
 # =============================
-def get_screen_info():
-    """Get screen dimensions and calculate scaling factors"""
-    # Create temporary root to get screen info
-    temp_root = tk.Tk()
-    temp_root.withdraw()  # Hide the window
-
-    screen_width = temp_root.winfo_screenwidth()
-    screen_height = temp_root.winfo_screenheight()
-
-    temp_root.destroy()
+def get_screen_info(root=None):
+    """Get screen dimensions and calculate scaling factors
+
+    Measures the screen through `root` when one is given. Without a root the size
+    remembered from the last UI run is used (or DEFAULT_SCREEN_SIZE), so no
+    display is needed.
+    """
+    if root is not None:
+        screen_width = root.winfo_screenwidth()
+        screen_height = root.winfo_screenheight()
+        save_screen_size(screen_width, screen_height)
+    else:
+        screen_width, screen_height = load_screen_size()
 
     # Calculate scaling factors based on common resolutions
     # Base resolution: 1920x1080 (scale factor 1.0)
@@ -73,81 +154,140 @@ def calculate_font_size(base_size, scale_factor):
     scaled_size = int(base_size * scale_factor)
     return max(8, min(16, scaled_size))  # Clamp between 8 and 16
 
-# Get screen information and calculate scaling
-SCREEN_INFO = get_screen_info()
-SCALE_FACTOR = SCREEN_INFO['scale_factor']
-
-# Modern SentriGuide UI Theme with Dynamic Scaling
-SENTRIGUIDE_THEME = {
-    # Modern Color Palette - Material Design 3.0 Inspired
-    'primary': '#1565C0',        # Modern blue - trust & technology
-    'primary_light': '#42A5F5',  # Light blue accent
-    'primary_dark': '#0D47A1',   # Dark blue for contrast
-    'secondary': '#424242',      # Modern gray - professional
-    'secondary_light': '#757575', # Light gray for subtle elements
-    'accent': '#E91E63',         # Modern pink - attention & energy
-    'accent_light': '#F06292',   # Light pink for hover states
-    'success': '#2E7D32',        # Modern green - positive outcomes
-    'success_light': '#4CAF50',  # Light green for highlights
-    'warning': '#F57C00',        # Modern orange - caution
-    'warning_light': '#FF9800',  # Light orange for warnings
-    'danger': '#C62828',         # Modern red - urgent attention
-    'danger_light': '#F44336',   # Light red for alerts
-    'info': '#1976D2',           # Information blue
-    'info_light': '#2196F3',     # Light info blue
-
-    # Modern Background Colors
-    'bg_primary': '#FAFAFA',     # Pure white background
-    'bg_secondary': '#F5F5F5',   # Light gray background
-    'bg_surface': '#FFFFFF',     # Card/surface background
-    'bg_dark': '#212121',        # Dark theme background
-    'bg_gradient_start': '#1565C0',  # Gradient start color
-    'bg_gradient_end': '#1976D2',    # Gradient end color
-
-    # Modern Text Colors
-    'text_primary': '#212121',   # Primary text - high emphasis
-    'text_secondary': '#757575', # Secondary text - medium emphasis
-    'text_disabled': '#BDBDBD',  # Disabled text - low emphasis
-    'text_inverse': '#FFFFFF',   # Text on dark backgrounds
-    'text_accent': '#1565C0',    # Accent text color
-
-    # Modern Typography
-    'font_primary': 'Inter, Segoe UI, Arial, sans-serif',  # Modern font stack
-    'font_mono': 'JetBrains Mono, Consolas, monospace',   # Monospace font
-    'font_size': calculate_font_size(10, SCALE_FACTOR),
-    'font_size_small': calculate_font_size(9, SCALE_FACTOR),
-    'font_size_medium': calculate_font_size(11, SCALE_FACTOR),
-    'font_size_large': calculate_font_size(13, SCALE_FACTOR),
-    'font_size_header': calculate_font_size(16, SCALE_FACTOR),
-    'font_size_title': calculate_font_size(20, SCALE_FACTOR),
-    'font_size_display': calculate_font_size(24, SCALE_FACTOR),
-
-    # Modern Spacing System (8px grid)
-    'spacing_xs': max(2, int(4 * SCALE_FACTOR)),    # 4px
-    'spacing_sm': max(4, int(8 * SCALE_FACTOR)),    # 8px
-    'spacing_md': max(8, int(12 * SCALE_FACTOR)),   # 12px
-    'spacing_lg': max(12, int(16 * SCALE_FACTOR)),  # 16px
-    'spacing_xl': max(16, int(24 * SCALE_FACTOR)),  # 24px
-    'spacing_xxl': max(24, int(32 * SCALE_FACTOR)), # 32px
-
-    # Legacy padding support
-    'padding_small': max(4, int(8 * SCALE_FACTOR)),
-    'padding_medium': max(8, int(12 * SCALE_FACTOR)),
-    'padding_large': max(12, int(16 * SCALE_FACTOR)),
-
-    # Modern UI Elements
-    'border_radius': max(4, int(8 * SCALE_FACTOR)),  # Rounded corners
-    'border_radius_large': max(8, int(12 * SCALE_FACTOR)),  # Large rounded corners
-    'shadow_light': '#E0E0E0',   # Light shadow color
-    'shadow_dark': '#BDBDBD',    # Dark shadow color
-    'divider': '#E0E0E0',        # Divider line color
-
-    # Status Colors
-    'online': '#4CAF50',         # Online status
-    'offline': '#9E9E9E',        # Offline status
-    'busy': '#FF9800',           # Busy status
-    'away': '#FFC107',           # Away status
-}
+def load_screen_size():
+    """Return the (width, height) remembered from the last UI run on this display"""
+    if SCREEN_CACHE_PATH:
+        try:
+            with open(SCREEN_CACHE_PATH, encoding="utf-8") as cache_file:
+                cached = json.load(cache_file)
+            if cached.get("display") == os.environ.get("DISPLAY", ""):
+                return int(cached["screen_width"]), int(cached["screen_height"])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+    return DEFAULT_SCREEN_SIZE
+
+def save_screen_size(screen_width, screen_height):
+    """Remember the measured screen size for the next run"""
+    if not SCREEN_CACHE_PATH or load_screen_size() == (screen_width, screen_height):
+        return
+    try:
+        os.makedirs(os.path.dirname(SCREEN_CACHE_PATH), exist_ok=True)
+        with open(SCREEN_CACHE_PATH, "w", encoding="utf-8") as cache_file:
+            json.dump({"display": os.environ.get("DISPLAY", ""), "screen_width": screen_width, "screen_height": screen_height}, cache_file)
+    except OSError as e:
+        print(f"⚠️ Could not save screen size: {e}")
+
+def build_sentriguide_theme(scale_factor):
+    """Return the modern SentriGuide UI theme scaled for `scale_factor`"""
+    return {
+        # Modern Color Palette - Material Design 3.0 Inspired
+        'primary': '#1565C0',        # Modern blue - trust & technology
+        'primary_light': '#42A5F5',  # Light blue accent
+        'primary_dark': '#0D47A1',   # Dark blue for contrast
+        'secondary': '#424242',      # Modern gray - professional
+        'secondary_light': '#757575', # Light gray for subtle elements
+        'accent': '#E91E63',         # Modern pink - attention & energy
+        'accent_light': '#F06292',   # Light pink for hover states
+        'success': '#2E7D32',        # Modern green - positive outcomes
+        'success_light': '#4CAF50',  # Light green for highlights
+        'warning': '#F57C00',        # Modern orange - caution
+        'warning_light': '#FF9800',  # Light orange for warnings
+        'danger': '#C62828',         # Modern red - urgent attention
+        'danger_light': '#F44336',   # Light red for alerts
+        'info': '#1976D2',           # Information blue
+        'info_light': '#2196F3',     # Light info blue
+
+        # Modern Background Colors
+        'bg_primary': '#FAFAFA',     # Pure white background
+        'bg_secondary': '#F5F5F5',   # Light gray background
+        'bg_surface': '#FFFFFF',     # Card/surface background
+        'bg_dark': '#212121',        # Dark theme background
+        'bg_gradient_start': '#1565C0',  # Gradient start color
+        'bg_gradient_end': '#1976D2',    # Gradient end color
+
+        # Modern Text Colors
+        'text_primary': '#212121',   # Primary text - high emphasis
+        'text_secondary': '#757575', # Secondary text - medium emphasis
+        'text_disabled': '#BDBDBD',  # Disabled text - low emphasis
+        'text_inverse': '#FFFFFF',   # Text on dark backgrounds
+        'text_accent': '#1565C0',    # Accent text color
+
+        # Modern Typography
+        'font_primary': 'Inter, Segoe UI, Arial, sans-serif',  # Modern font stack
+        'font_mono': 'JetBrains Mono, Consolas, monospace',   # Monospace font
+        'font_size': calculate_font_size(10, scale_factor),
+        'font_size_small': calculate_font_size(9, scale_factor),
+        'font_size_medium': calculate_font_size(11, scale_factor),
+        'font_size_large': calculate_font_size(13, scale_factor),
+        'font_size_header': calculate_font_size(16, scale_factor),
+        'font_size_title': calculate_font_size(20, scale_factor),
+        'font_size_display': calculate_font_size(24, scale_factor),
+
+        # Modern Spacing System (8px grid)
+        'spacing_xs': max(2, int(4 * scale_factor)),    # 4px
+        'spacing_sm': max(4, int(8 * scale_factor)),    # 8px
+        'spacing_md': max(8, int(12 * scale_factor)),   # 12px
+        'spacing_lg': max(12, int(16 * scale_factor)),  # 16px
+        'spacing_xl': max(16, int(24 * scale_factor)),  # 24px
+        'spacing_xxl': max(24, int(32 * scale_factor)), # 32px
+
+        # Legacy padding support
+        'padding_small': max(4, int(8 * scale_factor)),
+        'padding_medium': max(8, int(12 * scale_factor)),
+        'padding_large': max(12, int(16 * scale_factor)),
+
+        # Modern UI Elements
+        'border_radius': max(4, int(8 * scale_factor)),  # Rounded corners
+        'border_radius_large': max(8, int(12 * scale_factor)),  # Large rounded corners
+        'shadow_light': '#E0E0E0',   # Light shadow color
+        'shadow_dark': '#BDBDBD',    # Dark shadow color
+        'divider': '#E0E0E0',        # Divider line color
+
+        # Status Colors
+        'online': '#4CAF50',         # Online status
+        'offline': '#9E9E9E',        # Offline status
+        'busy': '#FF9800',           # Busy status
+        'away': '#FFC107',           # Away status
+    }
+
+# SCREEN_INFO, SCALE_FACTOR and SENTRIGUIDE_THEME are resolved on first UI use rather than at
+# import, so analysis-only imports never start Tk. Every function that reads them calls
+# ensure_ui_scaling() first, passing the window it builds so the real screen is measured;
+# module attribute access without a window falls back to the remembered screen size.
+_LAZY_UI_SCALING = ('SCREEN_INFO', 'SCALE_FACTOR', 'SENTRIGUIDE_THEME')
+_ui_scaling_measured = False
+_ui_scaling_lock = threading.Lock()
+
+def ensure_ui_scaling(root=None):
+    """Resolve SCREEN_INFO, SCALE_FACTOR and SENTRIGUIDE_THEME; returns SCREEN_INFO
+
+    `root` may be any Tk widget; the screen is measured through it. Resolves once
+    without a root, and once more the first time a widget is passed. The theme dict
+    is updated in place so references to it stay valid.
+    """
+    global SCREEN_INFO, SCALE_FACTOR, SENTRIGUIDE_THEME, _ui_scaling_measured
+
+    if _ui_scaling_measured:
+        return SCREEN_INFO  # Already measured through a window; nothing can change it
+
+    with _ui_scaling_lock:
+        resolved = 'SCREEN_INFO' in globals()
+        if not resolved or (root is not None and not _ui_scaling_measured):
+            SCREEN_INFO = get_screen_info(root)
+            SCALE_FACTOR = SCREEN_INFO['scale_factor']
+            if resolved:
+                SENTRIGUIDE_THEME.update(build_sentriguide_theme(SCALE_FACTOR))
+            else:
+                SENTRIGUIDE_THEME = build_sentriguide_theme(SCALE_FACTOR)
+            _ui_scaling_measured = root is not None
+        return SCREEN_INFO
+
+def __getattr__(name):
+    """Resolve the UI scaling globals the first time they are read from outside the module"""
+    if name in _LAZY_UI_SCALING:
+        ensure_ui_scaling()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Global state
 conversation_history = []
@@ -155,9 +295,8 @@ conversation_summary = ""
 customer_sentiment = {"emotion": "neutral", "urgency": "medium", "satisfaction": 70}
 resolution_confidence = 0
 knowledge_suggestions = []
+knowledge_generation = 0  # Bumped per Help Center search so late article updates can't overwrite newer results
 solution_history = []  # Track past solutions provided to customers
-anthropic_client = None
-is_processing = False
 conversation_ended = False
 ended_conversation_display = []
 
@@ -197,14 +336,415 @@ session_metrics = {
     "customer_satisfaction_trend": []
 }
 
+# =============================
+# UI Update Queue
+# =============================
+class UIUpdateQueue:
+    """Bounded queue that marshals UI updates from worker threads onto the Tk main loop
+
+    Updates are keyed by panel; posting a key that is already pending replaces
+    it, so only the latest content of each panel is painted. Until attach() is
+    called there is no main loop and updates run immediately.
+    """
+
+    def __init__(self, max_pending=UI_QUEUE_MAX_PENDING, drain_ms=UI_QUEUE_DRAIN_MS):
+        self.max_pending = max_pending
+        self.drain_ms = drain_ms
+        self.posted = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.painted = 0
+        self._pending = OrderedDict()  # key -> (function, args)
+        self._lock = threading.Lock()
+        self._root = None
+        self._main_thread = None
+
+    def attach(self, root):
+        """Start draining on `root`'s main loop; call from the thread that runs it"""
+        self._root = root
+        self._main_thread = threading.current_thread()
+        root.after(self.drain_ms, self._drain_loop)
+
+    def on_main_thread(self):
+        """Whether UI updates can run right here (on the main loop, or with no UI attached)"""
+        return self._main_thread is None or threading.current_thread() is self._main_thread
+
+    def post(self, key, function, *args):
+        """Queue function(*args) for the main loop, replacing any pending update with the same key"""
+        with self._lock:
+            self.posted += 1
+            if key in self._pending:
+                self.coalesced += 1
+            elif len(self._pending) >= self.max_pending:
+                self._pending.popitem(last=False)
+                self.dropped += 1
+            self._pending[key] = (function, args)
+
+    def drain(self):
+        """Run every pending update; returns how many ran"""
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+
+        for function, args in pending:
+            try:
+                function(*args)
+            except Exception as e:
+                print(f"UI update error in {function.__name__}: {str(e)}")
+        self.painted += len(pending)
+        return len(pending)
+
+    def stats(self):
+        with self._lock:
+            return {"posted": self.posted, "coalesced": self.coalesced, "dropped": self.dropped,
+                    "painted": self.painted, "pending": len(self._pending)}
+
+    def _drain_loop(self):
+        self.drain()
+        self._root.after(self.drain_ms, self._drain_loop)
+
+ui_updates = UIUpdateQueue()
+
+def on_ui_thread(key=None):
+    """Decorator for functions that touch Tk widgets: calls from worker threads are
+    queued on ui_updates under `key` (default: the function name) instead of running there"""
+    def decorate(function):
+        queue_key = key or function.__name__
+
+        @functools.wraps(function)
+        def wrapper(*args):
+            if ui_updates.on_main_thread():
+                return function(*args)
+            ui_updates.post(queue_key, function, *args)
+        return wrapper
+    return decorate
+
+def render_panel(panel, segments):
+    """Show (text, tag) segments in a read-only Text panel, touching only what changed
+
+    Returns False without touching the widget when the segments match the last
+    render. Otherwise the longest unchanged run of leading segments is kept and
+    only the rest is replaced, using the Tk index recorded at the end of each
+    segment so emoji and other wide characters cannot skew positions.
+    """
+    segments = tuple(segments)
+    previous = getattr(panel, 'rendered_segments', ())
+    if segments == previous:
+        return False
+
+    keep = 0
+    for old_segment, new_segment in zip(previous, segments):
+        if old_segment != new_segment:
+            break
+        keep += 1
+
+    segment_ends = panel.segment_ends[:keep] if keep else []
+    panel.config(state=tk.NORMAL)
+    panel.delete(segment_ends[-1] if keep else 1.0, tk.END)
+    for text, tag in segments[keep:]:
+        if tag:
+            panel.insert(tk.END, text, tag)
+        else:
+            panel.insert(tk.END, text)
+        segment_ends.append(panel.index("end-1c"))
+    panel.config(state=tk.DISABLED)
+
+    panel.rendered_segments = segments
+    panel.segment_ends = segment_ends
+    return True
+
 # =============================
 # No Authentication Required - Web-based Mode
 # =============================
 def setup_system():
     """Setup system without requiring API keys"""
     print("✅ SentriGuide AI initialized (Web-based mode)")
+
+    start = time.perf_counter()
+    knowledge_index = get_knowledge_index()
+    print(f"📚 Local knowledge index ready: {len(knowledge_index)} articles, {len(knowledge_index.postings)} terms ({(time.perf_counter() - start) * 1000:.1f}ms)")
     return True
 
+# =============================
+# Help Center HTTP Client
+# =============================
+class HelpCenterHTTPClient:
+    """Thread-safe pooled HTTP client for Help Center scraping with keep-alive, retries and timing stats"""
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, pool_size=HTTP_POOL_SIZE, max_retries=HTTP_MAX_RETRIES, backoff=HTTP_RETRY_BACKOFF,
+                 timeout=HTTP_TIMEOUT, headers=None, timing_samples=HTTP_TIMING_SAMPLES):
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(headers or HELP_CENTER_HEADERS)
+
+        # pool_maxsize caps keep-alive connections per host; pool_block makes it a hard limit under load
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, pool_block=True, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._lock = threading.Lock()
+        self._timings = deque(maxlen=timing_samples)
+        self.requests_sent = 0
+        self.retries = 0
+        self.failures = 0
+
+    def get(self, url, timeout=None, **kwargs):
+        """GET a URL, retrying connection errors and retryable statuses with jittered backoff"""
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            response = None
+            try:
+                response = self.session.get(url, timeout=timeout or self.timeout, **kwargs)
+                error = None
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+
+            with self._lock:
+                self.requests_sent += 1
+
+            retryable = error is not None or response.status_code in self.RETRY_STATUSES
+            if not retryable or attempt >= self.max_retries:
+                break
+
+            attempt += 1
+            with self._lock:
+                self.retries += 1
+            time.sleep(self._retry_delay(attempt, response))
+
+        self._record(url, start, response, error, attempt)
+        if error is not None:
+            raise error
+        return response
+
+    def _retry_delay(self, attempt, response):
+        """Full-jitter exponential backoff, honouring a numeric Retry-After header"""
+        delay = random.uniform(0, self.backoff * (2 ** (attempt - 1)))
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, min(float(retry_after), HTTP_MAX_RETRY_AFTER))
+        return delay
+
+    def _record(self, url, start, response, error, attempt):
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            if error is not None or response.status_code >= 400:
+                self.failures += 1
+            self._timings.append({
+                "host": urlsplit(url).netloc,
+                "status": response.status_code if response is not None else None,
+                "error": type(error).__name__ if error is not None else None,
+                "attempts": attempt + 1,
+                "elapsed_ms": round(elapsed_ms, 1)
+            })
+
+    def recent_timings(self):
+        """Return the most recent per-request timing records, oldest first"""
+        with self._lock:
+            return list(self._timings)
+
+    def stats(self):
+        """Return request counters and latency percentiles over the recent timing window"""
+        with self._lock:
+            elapsed = sorted(entry["elapsed_ms"] for entry in self._timings)
+            stats = {
+                "requests_sent": self.requests_sent,
+                "retries": self.retries,
+                "failures": self.failures,
+                "pool_size": self.pool_size,
+                "samples": len(elapsed)
+            }
+        if elapsed:
+            stats["p50_ms"] = elapsed[len(elapsed) // 2]
+            stats["p95_ms"] = elapsed[min(len(elapsed) - 1, int(len(elapsed) * 0.95))]
+            stats["max_ms"] = elapsed[-1]
+        return stats
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+def get_http_client():
+    """Return the shared Help Center HTTP client, creating it on first use"""
+    global _http_client
+
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = HelpCenterHTTPClient()
+        return _http_client
+
+def set_http_client(client):
+    """Install the Help Center HTTP client; anything with get(url) returning a response will do"""
+    global _http_client
+
+    with _http_client_lock:
+        _http_client = client
+
+# =============================
+# Help Center Search Cache
+# =============================
+def normalize_search_query(query):
+    """Normalize a search query so equivalent queries share one cache entry"""
+    words = re.findall(r"[a-z0-9]+", query.lower())
+    return " ".join(sorted(set(words)))
+
+class HelpCenterCache:
+    """Two-level Help Center search cache: in-memory LRU in front of a SQLite store
+
+    Entries are keyed by Help Center site and normalized query, so results from a
+    local stand-in never answer searches against the live site. Entries expire
+    after `ttl` seconds. The memory level holds at most `max_memory_entries`
+    queries and the disk level at most `max_disk_entries`, evicting the least
+    recently used first. Pass path=None for a memory-only cache.
+    """
+
+    def __init__(self, path=HELP_CENTER_CACHE_PATH, ttl=HELP_CENTER_CACHE_TTL,
+                 max_memory_entries=HELP_CENTER_CACHE_MEMORY_ENTRIES, max_disk_entries=HELP_CENTER_CACHE_DISK_ENTRIES):
+        self.path = path
+        self.ttl = ttl
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()  # (site, normalized query) -> (stored_at, articles)
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def get(self, query, site=""):
+        """Return cached articles for a query on a Help Center site, or None on a miss"""
+        key = (site, normalize_search_query(query))
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if now - entry[0] < self.ttl:
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    return list(entry[1])
+                del self._memory[key]
+
+            entry = self._disk_get(key, now)
+            if entry is not None:
+                self._memory_put(key, entry)
+                self.disk_hits += 1
+                return list(entry[1])
+
+            self.misses += 1
+            return None
+
+    def put(self, query, articles, site=""):
+        """Store search results for a query on a Help Center site in both cache levels"""
+        key = (site, normalize_search_query(query))
+        entry = (time.time(), list(articles))
+
+        with self._lock:
+            self._memory_put(key, entry)
+            self._disk_put(key, entry)
+
+    def clear(self):
+        """Remove every cached entry from both levels"""
+        with self._lock:
+            self._memory.clear()
+            connection = self._disk()
+            if connection:
+                with connection:
+                    connection.execute("DELETE FROM search_cache")
+
+    def stats(self):
+        """Return hit/miss counters and entry counts"""
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            connection = self._disk()
+            disk_entries = connection.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0] if connection else 0
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "disk_entries": disk_entries
+            }
+
+    def _memory_put(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _disk(self):
+        """Open the SQLite store on first use; disables the disk level if it cannot be opened"""
+        if self._connection is None and self.path:
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                connection = sqlite3.connect(self.path, check_same_thread=False)
+                columns = [row[1] for row in connection.execute("PRAGMA table_info(search_cache)")]
+                if columns and "site" not in columns:
+                    connection.execute("DROP TABLE search_cache")  # Cache from before entries were keyed by site
+                connection.execute("""CREATE TABLE IF NOT EXISTS search_cache (
+                    site TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    articles TEXT NOT NULL,
+                    stored_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (site, query)
+                )""")
+                connection.execute("CREATE INDEX IF NOT EXISTS search_cache_last_access ON search_cache (last_access)")
+                connection.commit()
+                self._connection = connection
+            except Exception as e:
+                print(f"Help Center cache disabled on disk: {str(e)}")
+                self.path = None
+        return self._connection
+
+    def _disk_get(self, key, now):
+        connection = self._disk()
+        if not connection:
+            return None
+
+        try:
+            row = connection.execute("SELECT articles, stored_at FROM search_cache WHERE site = ? AND query = ?", key).fetchone()
+            if row is None:
+                return None
+
+            with connection:
+                if now - row[1] >= self.ttl:
+                    connection.execute("DELETE FROM search_cache WHERE site = ? AND query = ?", key)
+                    return None
+                connection.execute("UPDATE search_cache SET last_access = ? WHERE site = ? AND query = ?", (now,) + key)
+            return row[1], json.loads(row[0])
+        except Exception as e:
+            print(f"Help Center cache read error: {str(e)}")
+            return None
+
+    def _disk_put(self, key, entry):
+        connection = self._disk()
+        if not connection:
+            return
+
+        try:
+            with connection:
+                connection.execute("INSERT OR REPLACE INTO search_cache (site, query, articles, stored_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                                   key + (json.dumps(entry[1]), entry[0], entry[0]))
+                overflow = connection.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0] - self.max_disk_entries
+                if overflow > 0:
+                    connection.execute("DELETE FROM search_cache WHERE rowid IN (SELECT rowid FROM search_cache ORDER BY last_access LIMIT ?)", (overflow,))
+        except Exception as e:
+            print(f"Help Center cache write error: {str(e)}")
+
+help_center_cache = HelpCenterCache()
+
 # =============================
 # Trend Micro Help Center Integration
 # =============================
@@ -215,15 +755,18 @@ def fetch_trend_micro_articles(query="security"):
     if query == "fallback":
         return get_fallback_articles()
 
+    cached_articles = help_center_cache.get(query, site=HELP_CENTER_BASE_URL)
+    if cached_articles is not None:
+        return cached_articles
+
+    if HELP_CENTER_OFFLINE:
+        return get_fallback_articles()
+
     try:
         # Search URL for official Trend Micro Help Center
-        search_url = f"https://helpcenter.trendmicro.com/en-us/search?q={query}"
-
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        search_url = f"{HELP_CENTER_BASE_URL}/en-us/search?q={query}"
 
-        response = requests.get(search_url, headers=headers, timeout=10)
+        response = get_http_client().get(search_url)
 
         if response.status_code == 200:
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -244,12 +787,12 @@ def fetch_trend_micro_articles(query="security"):
 
                     # Make sure link is complete
                     if link and not link.startswith('http'):
-                        link = f"https://helpcenter.trendmicro.com{link}"
+                        link = f"{HELP_CENTER_BASE_URL}{link}"
 
                     if len(title) > 10 and len(title) < 200:
                         articles.append({
                             'title': title,
-                            'link': link or 'https://helpcenter.trendmicro.com/en-us/',
+                            'link': link or f"{HELP_CENTER_BASE_URL}/en-us/",
                             'snippet': title[:150]
                         })
 
@@ -262,6 +805,7 @@ def fetch_trend_micro_articles(query="security"):
                     unique_articles.append(article)
 
             if unique_articles:
+                help_center_cache.put(query, unique_articles[:5], site=HELP_CENTER_BASE_URL)
                 return unique_articles[:5]  # Return top 5 results
 
     except Exception as e:
@@ -270,1490 +814,1202 @@ def fetch_trend_micro_articles(query="security"):
     # Fallback: return comprehensive Trend Micro help topics from official help center
     return get_fallback_articles()
 
+def set_help_center_base_url(url):
+    """Point Help Center scraping at another site, such as a LocalHelpCenterServer"""
+    global HELP_CENTER_BASE_URL
+    HELP_CENTER_BASE_URL = url.rstrip("/")
+
+class LocalHelpCenterServer:
+    """Local stand-in for the Help Center that serves recorded HTML fixtures, for offline benchmarks and load tests
+
+    /en-us/search returns search.html; /en-us/article/<slug> returns article-<slug>.html
+    when present, else article.html. `latency` delays every response, a seeded
+    `error_rate` fraction of requests get a 503, and pages are padded to at least
+    `page_size` bytes.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, fixtures_path=HELP_CENTER_FIXTURES_PATH, latency=0.0, error_rate=0.0, page_size=0, seed=None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.page_size = page_size
+        self.fixtures = {}
+        for name in os.listdir(fixtures_path):
+            if name.endswith(".html"):
+                with open(os.path.join(fixtures_path, name), "rb") as fixture:
+                    self.fixtures[name] = fixture.read()
+        self.requests_served = 0
+        self.errors_served = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, as the live site allows
+            disable_nagle_algorithm = True  # Headers and body go out in separate writes
+
+            def do_GET(self):
+                page = server.page_for(urlsplit(self.path).path)
+                if server.latency:
+                    time.sleep(server.latency)
+                with server._lock:
+                    server.requests_served += 1
+                    failed = server.error_rate and server._random.random() < server.error_rate
+                    if failed:
+                        server.errors_served += 1
+
+                if failed:
+                    self.send_error(503)
+                    return
+                if page is None:
+                    self.send_error(404)
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(page)))
+                self.end_headers()
+                self.wfile.write(page)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def page_for(self, path):
+        """Return the padded fixture bytes for a request path, or None if there is no such page"""
+        path = path.rstrip("/")
+        if path == "/en-us/search":
+            page = self.fixtures.get("search.html")
+        elif path.startswith("/en-us/article/"):
+            slug = path.rsplit("/", 1)[-1]
+            page = self.fixtures.get(f"article-{slug}.html") or self.fixtures.get("article.html")
+        else:
+            page = None
+
+        if page is not None and len(page) < self.page_size:
+            padding = self.page_size - len(page) - len(b"<!--  -->\n")
+            page += b"<!-- " + b"x" * max(0, padding) + b" -->\n"
+        return page
+
+    def stats(self):
+        with self._lock:
+            return {"requests_served": self.requests_served, "errors_served": self.errors_served}
+
+    def start(self):
+        """Serve requests on a background thread; returns self"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="sentriguide-helpcenter-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
 def get_fallback_articles():
-    """Return comprehensive fallback Trend Micro help articles"""
-    return [
-        {
-            'title': 'How to Renew Your Trend Micro Product',
-            'link': 'https://helpcenter.trendmicro.com/en-us/how-to-renew/',
-            'snippet': '''DETAILED RENEWAL GUIDE FOR CUSTOMERS:
-
-📋 PREPARATION (Share with Customer):
-• Have your activation code ready
-• Ensure stable internet connection
-• Have payment method available
-• Know your Trend Micro account credentials
-
-🔄 METHOD 1: Using Activation Code
-1. Open your Trend Micro product
-2. Look for "Renew" or "Enter Activation Code" option
-3. Enter your activation code in the designated field
-4. Click "Submit" or "Activate"
-5. Follow on-screen instructions to complete renewal
-6. Confirm subscription details and proceed to payment
-7. Wait for confirmation email
-
-🌐 METHOD 2: Through Trend Micro Account Portal
-1. Visit https://account.trendmicro.com
-2. Sign in with your account credentials
-3. Navigate to "Licenses" or "Subscriptions" tab
-4. Locate the subscription you want to renew
-5. Click "Renew Now" button
-6. If you see "Manage Subscription", auto-renewal is already enabled
-7. Follow the secure checkout process
-8. Complete payment and save confirmation
-
-⚠️ SPECIAL SCENARIOS:
-• Best Buy purchases: Direct customer to call 1-888-237-8289
-• ISP bundled subscriptions: Contact internet service provider
-• Corporate licenses: Refer to IT administrator
-
-🔧 TROUBLESHOOTING STEPS:
-• Error messages during renewal: Clear browser cache, try different browser
-• Payment issues: Verify card details, try alternative payment method
-• Activation code problems: Check for typos, ensure code hasn't expired
-• Account access issues: Use password reset option
-• Still having issues: Escalate to Trend Micro Support Team
-
-✅ POST-RENEWAL VERIFICATION:
-1. Check that subscription shows as "Active" in account portal
-2. Verify new expiration date
-3. Ensure real-time protection is running
-4. Save renewal confirmation for records'''
-        },
-        {
-            'title': 'Installing and Activating Trend Micro Products',
-            'link': 'https://helpcenter.trendmicro.com/en-us/installation/',
-            'snippet': '''COMPREHENSIVE INSTALLATION GUIDE FOR CUSTOMERS:
-
-📋 PRE-INSTALLATION REQUIREMENTS:
-• Windows 10/11 (32-bit or 64-bit) or macOS 10.15+
-• Minimum 1.5 GB free disk space
-• Stable internet connection for download and activation
-• Administrator privileges on the computer
-• Valid Trend Micro license or activation code
-
-💻 STEP-BY-STEP INSTALLATION PROCESS:
-
-1️⃣ DOWNLOAD THE INSTALLER:
-   • Visit https://account.trendmicro.com
-   • Sign in with your Trend Micro account credentials
-   • Navigate to the "Downloads" tab
-   • Select "Maximum Security" or your product
-   • Click "Download to this Device"
-   • Save the installer file to your desktop
-
-2️⃣ RUN THE INSTALLATION:
-   • Right-click the downloaded installer file
-   • Select "Run as Administrator" (Windows) or double-click (Mac)
-   • Click "Yes" if prompted by User Account Control
-   • Follow the installation wizard prompts
-   • Accept the license agreement
-   • Choose installation directory (default recommended)
-
-3️⃣ PRODUCT ACTIVATION:
-   • Enter your activation code when prompted
-   • Or sign in with your Trend Micro account
-   • Wait for online activation to complete
-   • Restart computer if prompted
-
-4️⃣ INITIAL SETUP:
-   • Complete the product setup wizard
-   • Configure scan settings (recommended: use defaults)
-   • Enable real-time protection
-   • Set up automatic updates
-   • Create recovery tools if offered
-
-✅ POST-INSTALLATION VERIFICATION:
-   • Check that Trend Micro icon appears in system tray
-   • Verify "Protection Status: Secured" in main interface
-   • Run initial system scan to ensure everything works
-   • Confirm automatic updates are enabled
-
-🔧 COMMON INSTALLATION ISSUES & SOLUTIONS:
-   • "Installation failed" error: Uninstall competing antivirus first
-   • "Activation failed" error: Check internet connection, verify code
-   • "Insufficient space" error: Free up disk space, clear temp files
-   • Installation freezes: Disable Windows Defender temporarily during install
-   • Permission errors: Ensure running installer as Administrator
-
-📱 MOBILE DEVICE INSTALLATION:
-   • Android: Download from Google Play Store
-   • iOS: Download from Apple App Store
-   • Search for "Trend Micro Mobile Security"
-   • Sign in with same Trend Micro account for license sync
-
-🆘 IF INSTALLATION CONTINUES TO FAIL:
-   • Use Trend Micro Diagnostic Toolkit to clean previous installations
-   • Temporarily disable Windows Firewall during installation
-   • Contact Trend Micro Support with error codes/screenshots'''
-        },
-        {
-            'title': 'Troubleshooting Common Issues',
-            'link': 'https://helpcenter.trendmicro.com/en-us/troubleshooting/',
-            'snippet': 'Solutions for common problems including installation errors, scanning issues, and performance problems.'
-        },
-        {
-            'title': 'Configuring Real-time Protection',
-            'link': 'https://helpcenter.trendmicro.com/en-us/protection-settings/',
-            'snippet': 'Learn how to configure and optimize real-time protection settings for maximum security.'
-        },
-        {
-            'title': 'Managing Quarantined Files',
-            'link': 'https://helpcenter.trendmicro.com/en-us/quarantine/',
-            'snippet': 'How to review, restore, or permanently delete files in quarantine to manage detected threats.'
-        },
-        {
-            'title': 'Email Security Configuration',
-            'link': 'https://helpcenter.trendmicro.com/en-us/email-security/',
-            'snippet': 'Configure email protection settings to block spam, phishing, and malicious attachments.'
-        },
-        {
-            'title': 'Web Protection and Browsing Safety',
-            'link': 'https://helpcenter.trendmicro.com/en-us/web-protection/',
-            'snippet': 'Enable web filtering and safe browsing features to protect against malicious websites.'
-        },
-        {
-            'title': 'Firewall Settings and Network Protection',
-            'link': 'https://helpcenter.trendmicro.com/en-us/firewall/',
-            'snippet': 'Configure firewall rules and network protection to secure your internet connection.'
-        },
-        {
-            'title': 'Performance Optimization Tips',
-            'link': 'https://helpcenter.trendmicro.com/en-us/performance/',
-            'snippet': 'Optimize Trend Micro settings to minimize system impact while maintaining security.'
-        },
-        {
-            'title': 'Virus and Malware Removal Guide',
-            'link': 'https://helpcenter.trendmicro.com/en-us/malware-removal/',
-            'snippet': 'Step-by-step instructions for removing detected threats and cleaning infected systems.'
-        },
-        {
-            'title': 'Scheduled Scan Configuration',
-            'link': 'https://helpcenter.trendmicro.com/en-us/scheduled-scans/',
-            'snippet': 'Set up automated scans to regularly check your system for threats and vulnerabilities.'
-        },
-        {
-            'title': 'Mobile Device Protection Setup',
-            'link': 'https://helpcenter.trendmicro.com/en-us/mobile-security/',
-            'snippet': 'Protect your mobile devices with Trend Micro Mobile Security features and settings.'
-        },
-        {
-            'title': 'Password Manager Configuration',
-            'link': 'https://helpcenter.trendmicro.com/en-us/password-manager/',
-            'snippet': 'Set up and use the built-in password manager to secure your online accounts.'
-        },
-        {
-            'title': 'Privacy and Data Protection',
-            'link': 'https://helpcenter.trendmicro.com/en-us/privacy-protection/',
-            'snippet': 'Configure privacy settings and data protection features to safeguard personal information.'
-        },
-        {
-            'title': 'Parental Controls Setup',
-            'link': 'https://helpcenter.trendmicro.com/en-us/parental-controls/',
-            'snippet': 'Configure parental controls to protect children online and manage screen time.'
-        },
-        {
-            'title': 'Backup and Restore Settings',
-            'link': 'https://helpcenter.trendmicro.com/en-us/backup-restore/',
-            'snippet': 'Backup your Trend Micro settings and restore configurations after reinstallation.'
-        },
-        {
-            'title': 'Enterprise and Business Solutions',
-            'link': 'https://helpcenter.trendmicro.com/en-us/business/',
-            'snippet': 'Deployment and management guides for Trend Micro business and enterprise products.'
-        },
-        {
-            'title': 'Technical Support Resources',
-            'link': 'https://helpcenter.trendmicro.com/en-us/support/',
-            'snippet': 'Access diagnostic tools, log collection, and contact information for technical support.'
-        },
-        {
-            'title': 'License Management and Transfer',
-            'link': 'https://helpcenter.trendmicro.com/en-us/license-management/',
-            'snippet': 'Manage your licenses, transfer them between devices, and resolve activation issues.'
-        },
-        {
-            'title': 'Cloud Security Best Practices',
-            'link': 'https://helpcenter.trendmicro.com/en-us/cloud-security/',
-            'snippet': 'Secure cloud services and protect data stored in cloud environments with Trend Micro.'
-        },
-        {
-            'title': 'Password Manager Setup and Import Guide',
-            'link': 'https://helpcenter.trendmicro.com/en-us/password-manager/',
-            'snippet': '''COMPREHENSIVE PASSWORD MANAGER GUIDE:
-
-🔐 SETTING UP PASSWORD MANAGER:
-• Open Trend Micro Maximum Security or ID Protection
-• Navigate to "Password Manager" section
-• Click "Get Started" or "Enable Password Manager"
-• Create a master password (remember this - it cannot be recovered!)
-• Confirm master password and security questions
-• Enable browser extension when prompted
-
-📥 IMPORTING PASSWORDS FROM OTHER MANAGERS:
-1️⃣ FROM CHROME/EDGE BROWSER:
-   • Open Password Manager → Settings → Import
-   • Select "Browser" as source
-   • Choose Chrome/Edge from dropdown
-   • Click "Import Now" - passwords will sync automatically
-
-2️⃣ FROM OTHER PASSWORD MANAGERS:
-   • Export passwords from old manager as CSV file
-   • In Trend Micro: Settings → Import → "CSV File"
-   • Select exported CSV file
-   • Map fields if needed (username, password, website)
-   • Click "Import" to transfer all passwords
-
-3️⃣ MANUAL ENTRY:
-   • Click "Add New" in Password Manager
-   • Enter website URL, username, password
-   • Add notes if needed
-   • Save entry
-
-🛡️ SECURITY FEATURES:
-• Password Generator: Create strong, unique passwords
-• Auto-Fill: Automatically fill login forms
-• Secure Notes: Store sensitive information safely
-• Security Audit: Check for weak/reused passwords
-• Dark Web Monitoring: Alert if passwords are compromised
-
-🔧 TROUBLESHOOTING COMMON ISSUES:
-• Import failed: Check CSV format, ensure no special characters
-• Auto-fill not working: Enable browser extension, check permissions
-• Forgot master password: Cannot be recovered - will need to reset (loses all data)
-• Sync issues: Sign out and back into Trend Micro account
-• Browser extension missing: Reinstall from Trend Micro dashboard'''
-        },
-        {
-            'title': 'ID Protection and Privacy Setup',
-            'link': 'https://helpcenter.trendmicro.com/en-us/id-protection/',
-            'snippet': '''COMPLETE ID PROTECTION SETUP GUIDE:
-
-🛡️ IDENTITY PROTECTION FEATURES:
-• Social Security Number monitoring
-• Credit report monitoring
-• Dark web monitoring for personal data
-• Identity theft insurance coverage
-• Personal information cleanup
-• Identity restoration services
-
-📋 INITIAL SETUP PROCESS:
-1. Open Trend Micro ID Protection
-2. Complete identity verification with SSN and personal details
-3. Connect bank accounts and credit cards for monitoring
-4. Set up alerts for suspicious activity
-5. Enable dark web monitoring
-6. Configure privacy settings
-
-🔍 MONITORING SERVICES:
-• Credit Score Tracking: Monthly updates and alerts
-• Bank Account Monitoring: Unusual transaction alerts
-• Social Media Scanning: Check for unauthorized use of personal info
-• Public Records Monitoring: Track when your info appears online
-• Data Breach Notifications: Immediate alerts if your data is found
-
-⚠️ IDENTITY THEFT RESPONSE:
-• Immediate notification of suspicious activity
-• Step-by-step guidance for reporting theft
-• Access to identity restoration specialists
-• Help with freezing credit reports
-• Assistance with fraud alerts and credit disputes
-
-🔧 PRIVACY TOOLS:
-• Personal Data Removal: Remove info from data broker sites
-• Social Media Privacy Checkup: Secure your online profiles
-• Email Monitoring: Track if email appears in breaches
-• Phone Number Protection: Monitor for unauthorized use
-
-💡 BEST PRACTICES:
-• Review alerts promptly and take recommended actions
-• Keep personal information updated in your profile
-• Use strong, unique passwords for all accounts
-• Enable two-factor authentication where possible
-• Regularly check credit reports and bank statements'''
-        },
-        {
-            'title': 'VPN and Secure Connection Setup',
-            'link': 'https://helpcenter.trendmicro.com/en-us/vpn/',
-            'snippet': '''TREND MICRO VPN SETUP AND USAGE:
-
-🌐 VPN BENEFITS:
-• Hide your IP address and location
-• Encrypt internet traffic on public Wi-Fi
-• Access geo-restricted content safely
-• Protect against online tracking
-• Secure browsing on untrusted networks
-
-⚙️ VPN SETUP PROCESS:
-1. Open Trend Micro Maximum Security
-2. Navigate to "Privacy" or "VPN" section
-3. Click "Enable VPN" or "Get Started"
-4. Choose server location (or use "Auto-Select")
-5. Click "Connect" to establish secure connection
-6. Verify connection with green "Connected" status
-
-🗺️ SERVER LOCATIONS:
-• United States (multiple cities)
-• United Kingdom • Germany • Japan
-• Canada • Australia • Netherlands
-• Auto-Select: Chooses fastest available server
-• Specialized servers for streaming and gaming
-
-📱 MOBILE VPN SETUP:
-• Download Trend Micro Mobile Security app
-• Sign in with your Trend Micro account
-• Tap "VPN" → "Enable VPN"
-• Allow VPN configuration when prompted
-• Select server location and connect
-
-🔧 TROUBLESHOOTING VPN ISSUES:
-• Connection fails: Try different server location
-• Slow speeds: Use Auto-Select or nearest server
-• Can't access local sites: Disconnect VPN temporarily
-• Mobile VPN not working: Check app permissions
-• Netflix/streaming blocked: Try different server region
-
-💡 OPTIMAL USAGE TIPS:
-• Use VPN on public Wi-Fi networks always
-• Disconnect when using banking apps (some block VPN)
-• Choose nearest server location for best speed
-• Enable "Auto-Connect" for automatic protection
-• Monitor data usage on mobile devices'''
-        },
-        {
-            'title': 'Email Security and Anti-Spam Configuration',
-            'link': 'https://helpcenter.trendmicro.com/en-us/email-security/',
-            'snippet': '''EMAIL SECURITY COMPREHENSIVE SETUP:
-
-📧 EMAIL PROTECTION FEATURES:
-• Spam filtering and blocking
-• Phishing email detection
-• Malicious attachment scanning
-• Link protection and URL filtering
-• Email encryption capabilities
-• Anti-spoofing protection
-
-⚙️ OUTLOOK INTEGRATION SETUP:
-1. Install Trend Micro Maximum Security
-2. Open Outlook → File → Options → Add-ins
-3. Verify "Trend Micro Email Security" is enabled
-4. Configure scan settings in Trend Micro main interface
-5. Set spam sensitivity level (Low/Medium/High)
-6. Enable real-time email scanning
-
-🛡️ ANTI-SPAM CONFIGURATION:
-• Spam Sensitivity: Adjust based on false positive rate
-• Whitelist: Add trusted senders to never block
-• Blacklist: Block specific domains or email addresses
-• Quarantine: Review blocked emails before deletion
-• Custom Rules: Create advanced filtering criteria
-
-🔍 PHISHING PROTECTION:
-• Automatic suspicious link scanning
-• Warning messages for potential phishing
-• Safe browser redirection for protected links
-• Real-time URL reputation checking
-• Email header analysis for spoofing detection
-
-📎 ATTACHMENT SCANNING:
-• Real-time malware detection in attachments
-• Quarantine suspicious files automatically
-• Safe file type allowlists
-• Password-protected archive scanning
-• Cloud-based threat intelligence integration
-
-🔧 TROUBLESHOOTING EMAIL ISSUES:
-• Legitimate emails in spam: Add sender to whitelist
-• Outlook integration not working: Reinstall Trend Micro
-• Email scanning slow: Adjust real-time scan settings
-• Missing email toolbar: Enable Trend Micro add-in in Outlook
-• False phishing warnings: Report false positive to support'''
-        },
-        {
-            'title': 'Parental Controls and Family Protection',
-            'link': 'https://helpcenter.trendmicro.com/en-us/parental-controls/',
-            'snippet': '''COMPREHENSIVE PARENTAL CONTROLS SETUP:
-
-👨‍👩‍👧‍👦 FAMILY PROTECTION FEATURES:
-• Content filtering by age-appropriate categories
-• Screen time management and schedules
-• App usage monitoring and restrictions
-• Location tracking and geofencing alerts
-• Social media activity monitoring
-• Cyberbullying detection and alerts
-
-⚙️ INITIAL SETUP PROCESS:
-1. Open Trend Micro Family → Create family account
-2. Add child profiles with names and ages
-3. Install Trend Micro Mobile Security on child devices
-4. Configure content filtering levels by age group
-5. Set screen time limits and schedules
-6. Enable location tracking with child consent
-
-🕐 SCREEN TIME MANAGEMENT:
-• Daily time limits for device usage
-• Scheduled "bedtime" hours with device lockdown
-• App-specific time restrictions
-• Homework mode: Block entertainment apps during study time
-• Weekend vs weekday different schedules
-• Instant pause/resume device access
-
-🌐 CONTENT FILTERING OPTIONS:
-• Age-based preset filters (Young Child, Tween, Teen)
-• Custom category blocking (Social Media, Gaming, Adult Content)
-• Website whitelist/blacklist management
-• Safe search enforcement on search engines
-• YouTube restricted mode activation
-• Social media platform monitoring
-
-📱 MOBILE DEVICE CONTROLS:
-• App installation approval requirements
-• In-app purchase restrictions
-• Contact management and stranger blocking
-• Text message monitoring for inappropriate content
-• Call log tracking and unknown number alerts
-• Emergency contact always-available settings
-
-🔧 TROUBLESHOOTING FAMILY ISSUES:
-• Child bypassing controls: Enable strict enforcement mode
-• Legitimate sites blocked: Add to whitelist or adjust filter level
-• Location not updating: Check GPS permissions on child device
-• App blocks not working: Verify Mobile Security is installed and active
-• Schedule conflicts: Review overlapping time restrictions'''
-        },
-        {
-            'title': 'Cashback Claims and Refund Requests',
-            'link': 'https://helpcenter.trendmicro.com/en-us/billing-refunds/',
-            'snippet': '''COMPREHENSIVE BILLING AND REFUND GUIDE:
-
-💰 CASHBACK CLAIM PROCESS:
-• Cashback offers are typically promotional and time-limited
-• Check original purchase email or promotional materials for cashback terms
-• Visit the retailer's cashback portal (Best Buy, Amazon, etc.)
-• Submit cashback claim within specified timeframe (usually 30-90 days)
-• Provide proof of purchase (receipt, order confirmation)
-• Track claim status through retailer's cashback system
-
-📋 REFUND REQUEST PROCESS:
-1️⃣ DIRECT TREND MICRO PURCHASES:
-   • Visit https://account.trendmicro.com
-   • Sign in to your account
-   • Go to "Billing" or "Subscriptions" section
-   • Click "Request Refund" or "Cancel Subscription"
-   • Select refund reason from dropdown
-   • Submit refund request with order details
-
-2️⃣ RETAIL STORE PURCHASES:
-   • Return to original point of purchase (Best Buy, Amazon, etc.)
-   • Bring receipt and activation code/packaging
-   • Follow retailer's return policy (usually 15-30 days)
-   • Contact retailer customer service for assistance
-
-3️⃣ DIGITAL MARKETPLACE PURCHASES:
-   • App Store: Request refund through Apple Support
-   • Google Play: Use Google Play refund process
-   • Microsoft Store: Contact Microsoft support
-   • Steam/Epic: Follow digital platform refund policies
-
-⏰ REFUND TIMEFRAMES:
-• Trend Micro Direct: 30-day money-back guarantee
-• Retail stores: Varies by retailer (typically 15-30 days)
-• Digital platforms: 14-48 hours for digital refunds
-• Processing time: 5-10 business days after approval
-
-💳 BILLING DISPUTE RESOLUTION:
-• Unauthorized charges: Contact Trend Micro billing support immediately
-• Duplicate charges: Provide transaction IDs for investigation
-• Auto-renewal disputes: Show cancellation attempts/proof
-• Proration requests: Explain downgrade/service change needs
-
-📞 BILLING SUPPORT CONTACTS:
-• Trend Micro Billing: 1-855-891-0011 (US/Canada)
-• Live Chat: Available 24/7 through account portal
-• Email Support: billing@trendmicro.com
-• International: Check region-specific contact numbers
-
-🔧 COMMON BILLING ISSUES:
-• Can't find purchase: Check email, account history, credit card statements
-• Refund not processed: Allow 10 business days, then contact support
-• Auto-renewal unexpected: Disable in account settings for future
-• Wrong product purchased: Exchange may be possible within 30 days
-• Payment method failed: Update card info in account billing section
-
-📝 REQUIRED INFORMATION FOR SUPPORT:
-• Order number or transaction ID
-• Email address used for purchase
-• Last 4 digits of payment method
-• Approximate purchase date
-• Reason for refund request'''
-        },
-        {
-            'title': 'Billing Account Management and Payment Issues',
-            'link': 'https://helpcenter.trendmicro.com/en-us/billing-management/',
-            'snippet': '''COMPLETE BILLING ACCOUNT MANAGEMENT:
-
-💳 PAYMENT METHOD MANAGEMENT:
-• Update credit card information before expiration
-• Add backup payment methods for auto-renewal
-• Remove old or expired payment methods
-• Set up automatic payment notifications
-• Configure billing address and tax information
-
-🔄 SUBSCRIPTION MANAGEMENT:
-• View current subscription status and expiration
-• Manage auto-renewal settings (enable/disable)
-• Upgrade or downgrade subscription plans
-• Transfer licenses between devices
-• Monitor device usage against license limits
-
-📧 BILLING NOTIFICATIONS:
-• Renewal reminders (30, 15, 7 days before expiration)
-• Payment confirmation emails
-• Failed payment alerts and retry attempts
-• Receipt and invoice downloads
-• Promotional offer notifications
-
-🛠️ PAYMENT TROUBLESHOOTING:
-• "Payment failed" errors: Check card expiration, available balance
-• "Invalid payment method": Verify billing address matches bank records
-• International payment issues: Contact bank about international transactions
-• Declined transactions: Ensure card allows online/international purchases
-• Currency conversion problems: Check if card supports foreign transactions
-
-📊 BILLING HISTORY ACCESS:
-• Download invoices and receipts from account portal
-• View payment history for tax/expense reporting
-• Track refunds and credits applied to account
-• Monitor subscription changes and modifications
-• Export billing data for accounting purposes
-
-🔒 BILLING SECURITY:
-• Use secure payment methods (avoid debit cards for subscriptions)
-• Monitor credit card statements for Trend Micro charges
-• Report unauthorized charges immediately
-• Enable two-factor authentication on account
-• Never share account credentials or payment information
-
-💡 BILLING BEST PRACTICES:
-• Set calendar reminders before auto-renewal dates
-• Keep payment methods updated to avoid service interruption
-• Review charges monthly for accuracy
-• Download receipts immediately after purchase
-• Contact support before charges if canceling subscription'''
-        },
-        {
-            'title': 'Subscription Cancellation and Service Management',
-            'link': 'https://helpcenter.trendmicro.com/en-us/cancel-subscription/',
-            'snippet': '''SUBSCRIPTION CANCELLATION COMPREHENSIVE GUIDE:
-
-❌ CANCELLATION PROCESS:
-1. Sign in to https://account.trendmicro.com
-2. Navigate to "Subscriptions" or "My Products"
-3. Find active subscription to cancel
-4. Click "Manage Subscription" or "Cancel"
-5. Select cancellation reason (required)
-6. Confirm cancellation and save changes
-7. Receive cancellation confirmation email
-
-⏰ CANCELLATION TIMING:
-• Cancel anytime during subscription period
-• Service continues until current period expires
-• No prorated refunds for partial months (check specific terms)
-• Auto-renewal stops immediately upon cancellation
-• Reactivation possible before expiration date
-
-🔄 ALTERNATIVE OPTIONS BEFORE CANCELING:
-• Pause subscription: Temporary hold for up to 6 months
-• Downgrade plan: Switch to lower-tier service
-• Transfer to family member: Change account ownership
-• Seasonal suspension: For temporary travel/non-use
-• Contact retention team: May offer discounts or incentives
-
-📱 MOBILE SUBSCRIPTION CANCELLATION:
-• App Store subscriptions: Cancel through iOS Settings → Subscriptions
-• Google Play subscriptions: Cancel through Play Store → Subscriptions
-• Direct mobile billing: Use account portal cancellation process
-
-💰 POST-CANCELLATION CONSIDERATIONS:
-• Download software installers before expiration
-• Export password manager data and settings
-• Save important security reports and history
-• Note expiration date for potential renewal
-• Consider data backup before service ends
-
-🔧 CANCELLATION TROUBLESHOOTING:
-• "Cancel" button missing: May be retail/partner subscription - contact seller
-• Cancellation not processed: Clear browser cache, try different browser
-• Still charged after cancellation: Verify cancellation email, contact billing
-• Want to cancel immediately: Request refund separately from cancellation
-• Multiple subscriptions: Cancel each subscription individually
-
-🆘 EMERGENCY CANCELLATION:
-• Contact billing support for immediate assistance: 1-855-891-0011
-• Use live chat for urgent cancellation needs
-• Email billing@trendmicro.com with "URGENT CANCELLATION" in subject
-• Dispute charges with bank if other methods fail
-• Request manager escalation for complex situations
-
-📋 CANCELLATION CHECKLIST:
-✓ Export important data (passwords, reports, settings)
-✓ Note current subscription expiration date
-✓ Save cancellation confirmation email
-✓ Remove auto-renewal from payment method if desired
-✓ Consider alternative security solution before expiration
-✓ Update password manager with new security software plans'''
-        },
-        {
-            'title': 'Installation Error Troubleshooting Guide',
-            'link': 'https://helpcenter.trendmicro.com/en-us/installation-errors/',
-            'snippet': '''COMPREHENSIVE INSTALLATION ERROR SOLUTIONS:
-
-❌ COMMON INSTALLATION ERRORS:
-
-🔧 ERROR: "Installation Failed" or "Setup Error"
-• Close all running programs and antivirus software
-• Run installer as Administrator (right-click → "Run as administrator")
-• Temporarily disable Windows Defender Real-time protection
-• Clear Windows temp files: %temp% and delete all contents
-• Download fresh installer from account portal
-• Restart computer and try installation again
-
-🔧 ERROR: "Another version already installed"
-• Uninstall previous Trend Micro products completely
-• Use Trend Micro Diagnostic Toolkit to remove remnants
-• Clear registry entries with official uninstaller
-• Restart computer before installing new version
-• Run Windows Registry cleaner if issues persist
-
-🔧 ERROR: "Insufficient privileges" or "Access denied"
-• Right-click installer → "Run as administrator"
-• Disable User Account Control temporarily
-• Log in with administrator account
-• Check folder permissions for installation directory
-• Ensure account has administrative rights
-
-🔧 ERROR: "Installation package corrupt" or "Cannot access installer"
-• Download installer again from trusted source
-• Verify file integrity and size
-• Disable antivirus during download
-• Try downloading on different network/computer
-• Use different browser or clear browser cache
-
-💻 SYSTEM COMPATIBILITY ISSUES:
-• Windows version not supported: Check system requirements
-• Insufficient disk space: Free up at least 2GB space
-• Missing system updates: Install latest Windows updates
-• Conflicting software: Uninstall competing antivirus products
-• Architecture mismatch: Ensure 32-bit/64-bit compatibility
-
-🌐 NETWORK AND DOWNLOAD ISSUES:
-• Slow/interrupted download: Use stable internet connection
-• Firewall blocking: Add Trend Micro to firewall exceptions
-• Proxy settings: Configure proxy in installer if needed
-• VPN interference: Temporarily disconnect VPN during installation
-• Corporate network: Contact IT for installation permissions
-
-🔄 POST-INSTALLATION ACTIVATION ERRORS:
-• "Activation failed": Check internet connection and try again
-• "Invalid activation code": Verify code spelling and expiration
-• "Code already used": Contact support for new activation code
-• "Server unavailable": Wait and retry, or try different time
-• "Region mismatch": Ensure code matches your geographic region
-
-🛠️ ADVANCED TROUBLESHOOTING STEPS:
-1. Boot in Safe Mode and attempt installation
-2. Create new Windows user account with admin rights
-3. Use Windows System File Checker: sfc /scannow
-4. Check Windows Event Viewer for detailed error messages
-5. Disable startup programs that may interfere
-6. Update device drivers, especially network and storage
-
-📞 ESCALATION PROCEDURES:
-• Collect installation logs from %temp% folder
-• Note exact error messages and error codes
-• Document system specifications and OS version
-• Contact Trend Micro Technical Support: 1-888-762-8736
-• Use remote assistance tools if offered by support team'''
-        },
-        {
-            'title': 'Application Error and Crash Troubleshooting',
-            'link': 'https://helpcenter.trendmicro.com/en-us/app-errors/',
-            'snippet': '''COMPLETE APPLICATION ERROR RESOLUTION:
-
-💥 APPLICATION CRASHES AND FREEZES:
-
-🔧 ERROR: "Application has stopped working" or Sudden Crashes
-• Update Trend Micro to latest version
-• Restart Trend Micro services: Services.msc → Trend Micro services → Restart
-• Run Windows Memory Diagnostic to check RAM
-• Check for corrupted system files: sfc /scannow
-• Disable conflicting software (other security tools)
-• Reset Trend Micro settings to default
-
-🔧 ERROR: Application Won't Start or "Failed to launch"
-• Check if Trend Micro services are running
-• Verify product license is active and not expired
-• Run Trend Micro as Administrator
-• Temporarily disable Windows Firewall
-• Check for Windows updates and install
-• Reinstall Trend Micro if issues persist
-
-🔧 ERROR: Interface Freezes or Becomes Unresponsive
-• Force close Trend Micro: Ctrl+Alt+Del → Task Manager → End Process
-• Clear Trend Micro cache and temporary files
-• Disable unnecessary Windows visual effects
-• Check available system memory and close other programs
-• Update graphics drivers
-• Restart computer and relaunch application
-
-🌐 WEBSITE AND WEB PROTECTION ERRORS:
-
-🔧 ERROR: "Website blocked incorrectly" or False Positives
-• Add website to Web Reputation exceptions
-• Adjust Web Reputation sensitivity level
-• Clear browser cache and cookies
-• Disable Web Reputation temporarily for testing
-• Report false positive to Trend Micro support
-• Check if website is actually malicious using online scanners
-
-🔧 ERROR: "Cannot access websites" or Connection Issues
-• Check if Web Reputation is blocking access
-• Verify internet connection without Trend Micro
-• Flush DNS cache: ipconfig /flushdns
-• Reset browser settings to default
-• Disable proxy settings in browser
-• Try accessing websites in incognito/private mode
-
-🔧 ERROR: Browser Integration Not Working
-• Reinstall browser extensions/add-ons
-• Check browser compatibility with Trend Micro version
-• Enable browser add-ons if disabled
-• Update browser to latest version
-• Clear browser cache and restart browser
-• Run browser as administrator
-
-📧 EMAIL AND SCANNING ERRORS:
-
-🔧 ERROR: "Scan failed" or "Cannot complete scan"
-• Check available disk space (need at least 1GB free)
-• Close other resource-intensive programs
-• Exclude scanning of very large files temporarily
-• Update virus definition files
-• Run scan in Safe Mode if persistent
-• Check for file system errors: chkdsk /f
-
-🔧 ERROR: Email Integration Problems
-• Verify Outlook version compatibility
-• Reinstall Trend Micro Email Security add-in
-• Check if Outlook is running in administrator mode
-• Disable other email security add-ins
-• Repair Microsoft Office installation
-• Reset Outlook profile if necessary
-
-🔄 UPDATE AND SYNCHRONIZATION ERRORS:
-
-🔧 ERROR: "Update failed" or "Cannot download updates"
-• Check internet connection stability
-• Verify Windows date and time settings
-• Clear Trend Micro update cache
-• Temporarily disable firewall during update
-• Try manual update download from website
-• Contact ISP if persistent connectivity issues
-
-🔧 ERROR: "Sync error" or Cloud Synchronization Issues
-• Verify Trend Micro account credentials
-• Check account subscription status
-• Clear sync cache and restart synchronization
-• Ensure stable internet connection
-• Try logging out and back into account
-• Contact support if account shows as suspended
-
-🆘 CRITICAL ERROR RECOVERY:
-• Safe Mode troubleshooting steps
-• System restore to point before issues began
-• Complete uninstall and fresh installation
-• Contact Technical Support with error logs
-• Remote assistance session setup if needed'''
-        },
-        {
-            'title': 'Website and Connectivity Technical Issues',
-            'link': 'https://helpcenter.trendmicro.com/en-us/connectivity-issues/',
-            'snippet': '''WEBSITE AND CONNECTIVITY TROUBLESHOOTING:
-
-🌐 TREND MICRO WEBSITE ACCESS ISSUES:
-
-🔧 ERROR: "Cannot access account.trendmicro.com"
-• Clear browser cache and cookies completely
-• Try different browser (Chrome, Firefox, Edge)
-• Disable browser extensions temporarily
-• Check if corporate firewall is blocking access
-• Try accessing from different network (mobile hotspot)
-• Use incognito/private browsing mode
-
-🔧 ERROR: "Page won't load" or "Connection timeout"
-• Check internet connection with other websites
-• Flush DNS cache: ipconfig /flushdns (Windows) or sudo dscacheutil -flushcache (Mac)
-• Change DNS servers to 8.8.8.8 and 8.8.4.4 (Google DNS)
-• Disable VPN if connected
-• Try accessing website using IP address instead of domain
-• Contact ISP if issues persist across multiple sites
-
-🔧 ERROR: "Login failed" or "Session expired"
-• Verify username and password accuracy
-• Check Caps Lock and ensure correct keyboard layout
-• Clear cookies for trendmicro.com domain
-• Disable password manager auto-fill temporarily
-• Try password reset if login consistently fails
-• Check if account is locked due to multiple failed attempts
-
-🔒 SSL AND SECURITY CERTIFICATE ERRORS:
-
-🔧 ERROR: "Your connection is not private" or SSL Certificate Error
-• Check system date and time settings (must be accurate)
-• Clear browser SSL state: Settings → Advanced → Clear browsing data
-• Add security exception for trendmicro.com if trusted
-• Update browser to latest version
-• Disable antivirus SSL scanning temporarily
-• Try accessing via https:// explicitly
-
-🔧 ERROR: "Certificate has expired" or "Certificate not trusted"
-• Update Windows certificates: Windows Update
-• Clear certificate cache in browser
-• Import Trend Micro root certificates manually
-• Check if corporate network has certificate filtering
-• Try accessing from personal network instead of corporate
-
-📱 MOBILE APP CONNECTIVITY ISSUES:
-
-🔧 ERROR: Mobile app won't connect or sync
-• Check mobile data/WiFi connection
-• Force close and restart Trend Micro mobile app
-• Clear app cache: Settings → Apps → Trend Micro → Storage → Clear Cache
-• Update mobile app to latest version
-• Sign out and back into Trend Micro account
-• Restart mobile device
-
-🔧 ERROR: "Server unavailable" or "Network error"
-• Switch between WiFi and mobile data
-• Check if mobile carrier blocks certain connections
-• Disable mobile VPN if connected
-• Allow Trend Micro through mobile firewall/security apps
-• Check mobile date and time settings
-• Reinstall mobile app if persistent
-
-🔄 ACCOUNT PORTAL AND WEB INTERFACE ISSUES:
-
-🔧 ERROR: Dashboard not loading or "Internal server error"
-• Wait 15-30 minutes and try again (may be temporary server issue)
-• Try accessing specific sections directly via bookmarks
-• Disable ad blockers and privacy extensions
-• Clear all browser data for trendmicro.com
-• Try different device or network
-• Contact support if error persists over 2 hours
-
-🔧 ERROR: Features missing or "Access denied"
-• Verify subscription includes requested features
-• Check if account has proper permissions
-• Log out completely and log back in
-• Clear browser session data
-• Try accessing from account owner's login
-• Contact billing if features should be available
-
-🛠️ ADVANCED NETWORK TROUBLESHOOTING:
-
-• Network trace: tracert account.trendmicro.com
-• DNS lookup test: nslookup account.trendmicro.com
-• Port connectivity test: telnet account.trendmicro.com 443
-• Disable Windows firewall temporarily for testing
-• Check router/modem firewall settings
-• Test with ethernet cable instead of WiFi
-• Contact network administrator for corporate environments
-
-📞 ESCALATION FOR CONNECTIVITY ISSUES:
-• Document specific error messages and codes
-• Note time of day when issues occur
-• Test from multiple devices and networks
-• Collect network diagnostic information
-• Contact ISP to verify no service issues
-• Report to Trend Micro if widespread connectivity problems'''
-        },
-        {
-            'title': 'Account Portal Access and Login Issues',
-            'link': 'https://helpcenter.trendmicro.com/en-us/account-access/',
-            'snippet': '''COMPREHENSIVE ACCOUNT PORTAL TROUBLESHOOTING:
-
-🔐 LOGIN AND AUTHENTICATION ISSUES:
-
-🔧 ERROR: "Invalid username or password" or Login Failed
-• Verify email address spelling and format
-• Check password for correct case sensitivity
-• Ensure Caps Lock is OFF and correct keyboard layout
-• Try typing password manually (don't copy/paste)
-• Clear browser saved passwords and try again
-• Use password reset if multiple attempts fail
-
-🔧 ERROR: "Account locked" or "Too many failed attempts"
-• Wait 30 minutes before attempting login again
-• Use "Forgot Password" to reset and unlock account
-• Contact support if lockout persists after reset
-• Check for automated login attempts or malware
-• Verify account hasn't been compromised
-
-🔧 ERROR: "Account not found" or "Email not recognized"
-• Double-check email address spelling
-• Try alternative email addresses you may have used
-• Check if account was created with phone number instead
-• Look for original purchase/activation emails for correct account
-• Contact support with proof of purchase if account missing
-
-🔄 PASSWORD RESET AND RECOVERY:
-
-🔧 PASSWORD RESET PROCESS:
-1. Visit https://account.trendmicro.com
-2. Click "Forgot your password?" link
-3. Enter email address associated with account
-4. Check email inbox AND spam folder for reset link
-5. Click reset link within 24 hours (expires)
-6. Create new password meeting requirements
-7. Log in with new password immediately
-
-🔧 ERROR: "Password reset email not received"
-• Check spam/junk folder thoroughly
-• Verify email address spelling when requesting reset
-• Wait up to 15 minutes for email delivery
-• Add noreply@trendmicro.com to contacts/whitelist
-• Try requesting reset from different browser/device
-• Contact support if email still not received after 30 minutes
-
-🔧 ERROR: "Reset link expired" or "Invalid reset link"
-• Request new password reset (links expire in 24 hours)
-• Use link from most recent reset email only
-• Don't click link multiple times
-• Clear browser cache before clicking reset link
-• Try opening link in incognito/private browser window
-
-🌐 ACCOUNT PORTAL NAVIGATION ISSUES:
-
-🔧 ERROR: Dashboard blank or not loading completely
-• Clear browser cache and cookies for trendmicro.com
-• Disable browser extensions (ad blockers, privacy tools)
-• Try different browser (Chrome, Firefox, Edge, Safari)
-• Check if JavaScript is enabled in browser settings
-• Disable VPN or proxy connections temporarily
-• Try accessing from different network
-
-🔧 ERROR: "Session expired" or Frequent logouts
-• Enable cookies for trendmicro.com domain
-• Clear existing cookies and log in fresh
-• Check browser privacy settings aren't too restrictive
-• Disable "Clear cookies on exit" browser setting
-• Stay active in portal (don't leave idle too long)
-• Contact support if sessions expire within minutes
-
-🔧 ERROR: Missing features or "Access denied" messages
-• Verify subscription is active and not expired
-• Check if account has proper license level for feature
-• Log out completely and log back in
-• Clear browser session data
-• Try accessing feature from main dashboard
-• Contact billing to verify subscription includes feature
-
-📱 MOBILE ACCOUNT ACCESS:
-
-🔧 MOBILE BROWSER ISSUES:
-• Use mobile browser in desktop mode for full portal
-• Clear mobile browser cache and cookies
-• Try Trend Micro mobile app instead of browser
-• Switch between WiFi and mobile data
-• Update mobile browser to latest version
-• Use different mobile browser if available
-
-🔧 MOBILE APP ACCOUNT ISSUES:
-• Force close and restart Trend Micro mobile app
-• Update mobile app to latest version
-• Clear app cache and data in device settings
-• Sign out and back into account within app
-• Reinstall mobile app if persistent issues
-• Check mobile device date/time settings
-
-👥 MULTIPLE ACCOUNT ISSUES:
-
-🔧 ERROR: "Multiple accounts found" or Account confusion
-• Identify which email was used for original purchase
-• Check credit card statements for billing email
-• Try all possible email addresses you might have used
-• Look for activation emails in old email accounts
-• Contact support with proof of purchase to merge accounts
-• Use most recent/active account going forward
-
-🔧 FAMILY/SHARED ACCOUNT ACCESS:
-• Verify you're using correct family member credentials
-• Check if main account holder restricted your access
-• Contact primary account holder for permission changes
-• Don't share login credentials between family members
-• Set up separate accounts if appropriate
-
-🆘 ACCOUNT RECOVERY AND ESCALATION:
-
-📞 WHEN TO CONTACT SUPPORT:
-• Account completely inaccessible after all troubleshooting
-• Suspicious account activity or potential compromise
-• Need to merge multiple accounts with same email
-• Billing/subscription shows but can't access features
-• Account shows suspended/terminated unexpectedly
-
-📋 INFORMATION TO PROVIDE SUPPORT:
-• Email address(es) associated with account
-• Approximate account creation date
-• Last successful login date/time
-• Order number or transaction ID from original purchase
-• Last 4 digits of payment method used
-• Detailed description of error messages
-• Screenshots of error screens if possible
-
-🔒 ACCOUNT SECURITY BEST PRACTICES:
-• Use unique, strong password (12+ characters)
-• Enable two-factor authentication if available
-• Don't share account credentials with others
-• Log out when using public/shared computers
-• Monitor account activity regularly
-• Update password if security breach suspected'''
-        },
-        {
-            'title': 'Account Management and Profile Issues',
-            'link': 'https://helpcenter.trendmicro.com/en-us/account-management/',
-            'snippet': '''COMPLETE ACCOUNT MANAGEMENT TROUBLESHOOTING:
-
-👤 PROFILE AND PERSONAL INFORMATION:
-
-🔧 ERROR: "Cannot update profile" or Profile changes not saving
-• Clear browser cache and cookies completely
-• Try updating one field at a time instead of all at once
-• Ensure all required fields are filled out correctly
-• Check for special characters that might not be accepted
-• Use different browser or incognito mode
-• Contact support if profile changes critical for service
-
-🔧 ERROR: "Invalid email format" or Email update issues
-• Verify new email address is spelled correctly
-• Ensure email format includes @ and proper domain
-• Check that new email isn't already associated with another account
-• Complete email verification process if required
-• Use different email provider if format issues persist
-
-🔧 ERROR: "Phone number invalid" or SMS verification problems
-• Enter phone number with proper country code format
-• Remove dashes, spaces, or special characters
-• Verify mobile number can receive SMS messages
-• Check if phone number already used on another account
-• Try landline number if mobile SMS not working
-• Contact support for manual verification if needed
-
-🏠 ADDRESS AND BILLING INFORMATION:
-
-🔧 ERROR: "Billing address mismatch" or Payment failures
-• Ensure address exactly matches credit card billing address
-• Include apartment/unit numbers in correct fields
-• Use same format as on bank/credit card statements
-• Verify zip/postal code is correct for country
-• Contact bank if address format requirements unclear
-
-🔧 ERROR: "Country/region cannot be changed" or Location restrictions
-• Contact support for legitimate country changes (moved residence)
-• Some subscription types may be region-locked
-• May need to cancel and repurchase if moving countries
-• Check if VPN is affecting detected location
-• Provide proof of residence change if required
-
-🔐 SECURITY AND PRIVACY SETTINGS:
-
-🔧 TWO-FACTOR AUTHENTICATION ISSUES:
-• Verify mobile number can receive SMS codes
-• Check if authentication app (Google Authenticator) is synced
-• Keep backup codes in secure location
-• Contact support immediately if locked out due to 2FA
-• Don't disable 2FA unless absolutely necessary
-
-🔧 PRIVACY AND NOTIFICATION SETTINGS:
-• Review email notification preferences regularly
-• Opt out of marketing emails if desired (won't affect service)
-• Check spam folder for important account notifications
-• Update communication preferences after email changes
-• Set mobile push notification preferences in app
-
-📊 SUBSCRIPTION AND DEVICE MANAGEMENT:
-
-🔧 ERROR: "Device limit exceeded" or Cannot add new device
-• Remove old/unused devices from account first
-• Check device list for duplicates or renamed devices
-• Verify subscription allows additional devices
-• Upgrade subscription if more devices needed
-• Contact support if device count appears incorrect
-
-🔧 DEVICE MANAGEMENT ISSUES:
-• Refresh device list if recently removed devices still showing
-• Rename devices with clear, identifiable names
-• Remove devices before selling/disposing of hardware
-• Transfer licenses between devices if moving to new computer
-• Check device status and last sync times regularly
-
-💳 PAYMENT METHOD AND BILLING:
-
-🔧 ERROR: "Payment method declined" or Billing failures
-• Verify credit card hasn't expired
-• Check available credit limit/account balance
-• Ensure billing address matches card exactly
-• Try different payment method if primary fails
-• Contact bank about international transaction blocks
-• Update payment method before auto-renewal date
-
-🔧 RECURRING BILLING MANAGEMENT:
-• Review auto-renewal settings before each billing cycle
-• Update payment methods proactively before expiration
-• Set calendar reminders for subscription renewals
-• Monitor credit card statements for Trend Micro charges
-• Contact billing support for payment disputes immediately
-
-👨‍👩‍👧‍👦 FAMILY AND SHARED ACCOUNTS:
-
-🔧 FAMILY ACCOUNT SETUP AND MANAGEMENT:
-• Designate primary account holder for billing/administration
-• Set up individual profiles for each family member
-• Configure appropriate permissions for child accounts
-• Review family sharing settings and restrictions
-• Monitor usage across all family devices regularly
-
-🔧 SHARED ACCOUNT ACCESS ISSUES:
-• Don't share login credentials between users
-• Set up separate sub-accounts if available
-• Use family sharing features instead of credential sharing
-• Contact support for guidance on multi-user setups
-• Consider individual accounts for business/professional use
-
-🔄 ACCOUNT TRANSFER AND MIGRATION:
-
-🔧 TRANSFERRING ACCOUNT TO NEW EMAIL:
-• Update email address in account settings first
-• Verify new email address access before changing
-• Update email in all Trend Micro products/apps
-• Check that old email won't be reused by others
-• Keep record of account transfer date/confirmation
-
-🔧 ACCOUNT CLOSURE AND DATA EXPORT:
-• Export important data before closing account
-• Download password manager data and security reports
-• Cancel recurring billing before account closure
-• Contact support for complete account deletion
-• Allow 30-90 days for complete data removal from systems
-
-🆘 ESCALATION AND ADVANCED SUPPORT:
-
-📞 WHEN TO CONTACT ACCOUNT SUPPORT:
-• Critical account access issues affecting service
-• Billing disputes or unauthorized charges
-• Account compromise or security concerns
-• Complex family/business account configurations
-• Account transfer between users/organizations
-
-📋 ACCOUNT SUPPORT CONTACT INFORMATION:
-• General Account Support: 1-888-762-8736
-• Billing Support: 1-855-891-0011
-• Live Chat: Available through account portal
-• Email Support: accountsupport@trendmicro.com
-• Business/Enterprise: Contact dedicated business support team'''
-        },
-        {
-            'title': 'Resolution Guard - Case Closure Quality Control',
-            'link': 'https://helpcenter.trendmicro.com/en-us/resolution-guard/',
-            'snippet': '''COMPREHENSIVE RESOLUTION GUARD FRAMEWORK:
-
-✅ CASE CLOSURE READINESS ASSESSMENT:
-
-🎯 RESOLUTION CONFIDENCE SCORING (0-100):
-• 90-100: HIGH CONFIDENCE - Safe to close
-  - Customer explicitly confirms satisfaction
-  - All requested actions completed successfully
-  - No follow-up questions or concerns raised
-  - Clear understanding demonstrated by customer
-
-• 70-89: MEDIUM CONFIDENCE - Requires verification
-  - Solution provided but no clear confirmation from customer
-  - Customer responded positively but not explicitly satisfied
-  - Minor follow-up items may exist
-  - Consider proactive follow-up before closure
-
-• 0-69: LOW CONFIDENCE - DO NOT CLOSE
-  - Customer has not confirmed resolution
-  - Additional questions or concerns raised
-  - Solution only partially implemented
-  - Customer expressed confusion or frustration
-
-📋 MANDATORY PRE-CLOSURE CHECKLIST:
-
-☑️ CUSTOMER CONFIRMATION REQUIREMENTS:
-• Customer explicitly states issue is resolved
-• Customer confirms they can successfully perform the action
-• Customer indicates no additional assistance needed
-• Customer expresses satisfaction with support provided
-
-☑️ TECHNICAL VALIDATION REQUIREMENTS:
-• All troubleshooting steps completed successfully
-• Customer confirmed successful testing of solution
-• No error messages or technical issues remain
-• Follow-up verification completed where applicable
-
-☑️ DOCUMENTATION REQUIREMENTS:
-• Complete record of troubleshooting steps taken
-• Customer responses and confirmations documented
-• Final resolution clearly documented for future reference
-• Any escalation paths or alternative solutions noted
-
-🚫 PREMATURE CLOSURE PREVENTION:
-
-⚠️ RED FLAGS - NEVER CLOSE WHEN:
-• Customer says "I'll try this later" without confirming success
-• Customer stops responding mid-conversation
-• Multiple solutions provided but none confirmed working
-• Customer asks follow-up questions about the solution
-• Technical error messages still present
-• Customer expresses frustration or dissatisfaction
-
-⚠️ YELLOW FLAGS - VERIFY BEFORE CLOSING:
-• Customer says "okay" or "thanks" without specific confirmation
-• Solution provided recently without time for testing
-• Complex multi-step solution may need verification
-• Previous similar cases required follow-up
-• Customer is new to technology or product
-
-✅ GREEN SIGNALS - SAFE TO CLOSE:
-• "Yes, that fixed it completely"
-• "Everything is working perfectly now"
-• "Thank you, my issue is resolved"
-• "I can now [specific action] without problems"
-• Customer demonstrates successful completion
-
-🔄 FOLLOW-UP AND QUALITY ASSURANCE:
-
-📞 PROACTIVE FOLLOW-UP SCENARIOS:
-• Complex technical solutions (follow up in 24-48 hours)
-• Installation or configuration changes (verify after 1 week)
-• Account or billing changes (confirm next billing cycle)
-• Security-related fixes (ensure continued protection)
-• First-time customers (extra verification for satisfaction)
-
-📊 RESOLUTION QUALITY METRICS:
-• Customer satisfaction score confirmation
-• Time to resolution tracking
-• First contact resolution rate
-• Escalation avoidance rate
-• Follow-up requirement analysis
-
-💬 CUSTOMER COMMUNICATION BEST PRACTICES:
-
-🎯 CONFIRMATION QUESTIONS TO ASK:
-• "Can you confirm that [specific issue] is now working correctly?"
-• "Are you able to [specific action] without any errors?"
-• "Is there anything else I can help you with regarding this issue?"
-• "How would you rate your satisfaction with this resolution?"
-• "Do you feel confident using [solution] going forward?"
-
-📝 CLOSURE COMMUNICATION TEMPLATE:
-"Before I close this case, I want to confirm:
-1. Your [specific issue] has been resolved
-2. You can successfully [specific action]
-3. You have no additional questions
-4. You're satisfied with the support provided
-
-Please confirm each point so I can properly close your case with confidence."
-
-🔧 CASE REOPENING PROCEDURES:
-
-⏰ AUTOMATIC REOPENING TRIGGERS:
-• Customer contacts within 48 hours with same issue
-• Related error reports detected within 1 week
-• Solution verification fails during follow-up
-• Customer satisfaction score below threshold
-
-📋 REOPENING REQUIREMENTS:
-• Reference original case number and solution provided
-• Document what aspect of solution failed or was incomplete
-• Identify if issue is continuation or new related problem
-• Assign appropriate priority based on business impact
-
-🆘 ESCALATION CRITERIA:
-
-🔺 IMMEDIATE ESCALATION REQUIRED:
-• Customer explicitly requests manager/supervisor
-• Resolution attempts exceed 3 different approaches
-• Technical issue beyond current knowledge/tools
-• Customer reports urgent business impact
-• Potential security or compliance concerns
-
-📈 QUALITY IMPROVEMENT PROCESS:
-• Analyze patterns in premature closures
-• Identify training needs for support staff
-• Update knowledge base based on resolution gaps
-• Monitor customer feedback and satisfaction trends
-• Implement process improvements based on metrics'''
-        },
-        {
-            'title': 'Case Closure Confidence Analysis',
-            'link': 'https://helpcenter.trendmicro.com/en-us/case-closure-confidence/',
-            'snippet': '''ADVANCED CASE CLOSURE CONFIDENCE ASSESSMENT:
-
-🧠 AI-POWERED CONFIDENCE ANALYSIS:
-
-📊 CONVERSATION ANALYSIS FACTORS:
-• Customer language sentiment and tone progression
-• Frequency and nature of follow-up questions
-• Explicit confirmation vs. implicit acceptance
-• Time elapsed between solution and response
-• Customer expertise level and technical understanding
-
-🔍 CONFIDENCE INDICATORS BY CATEGORY:
-
-💚 HIGH CONFIDENCE INDICATORS (Score: 85-100):
-• "Perfect! That solved everything."
-• "It's working exactly as expected now."
-• "Thank you so much, you've been incredibly helpful."
-• Customer provides detailed confirmation of successful testing
-• Customer asks about unrelated topics (indicates current issue resolved)
-
-🟡 MEDIUM CONFIDENCE INDICATORS (Score: 60-84):
-• "Okay, I'll try that."
-• "That seems to have worked."
-• "I think that fixed it."
-• Brief acknowledgment without detailed confirmation
-• Customer responds quickly without testing time
-
-🔴 LOW CONFIDENCE INDICATORS (Score: 0-59):
-• "I'll let you know if it doesn't work."
-• "I'm still not sure what happened."
-• "What if this happens again?"
-• Customer asking clarifying questions about the solution
-• Silence after solution provided
-
-📈 RESOLUTION TRAJECTORY ANALYSIS:
-
-⬆️ POSITIVE TRAJECTORY SIGNS:
-• Customer frustration decreasing over time
-• Questions becoming more specific and actionable
-• Customer showing understanding of solution steps
-• Positive language increasing in recent messages
-• Customer taking ownership of solution implementation
-
-⬇️ NEGATIVE TRAJECTORY SIGNS:
-• Customer frustration maintaining or increasing
-• Repeated questions about same concepts
-• Customer expressing doubt about solution viability
-• Negative language persisting in conversation
-• Customer delegating to others instead of implementing
-
-🎯 CONTEXTUAL CONFIDENCE MODIFIERS:
-
-📞 COMMUNICATION CHANNEL FACTORS:
-• Phone: Higher confidence due to real-time verification
-• Chat: Medium confidence, good for quick confirmations
-• Email: Lower baseline confidence, requires explicit confirmation
-• Self-service: Lowest confidence, needs follow-up verification
-
-⏰ TIMING FACTORS:
-• Immediate response to solution: Lower confidence (insufficient testing time)
-• 15-30 minutes after solution: Optimal confidence window
-• Hours later: Higher confidence if positive
-• Days later: Highest confidence for complex solutions
-
-👤 CUSTOMER TYPE MODIFIERS:
-• Technical users: Higher confidence with technical confirmations
-• Business users: Medium confidence, need practical confirmations
-• Home users: Lower baseline, need simple language confirmations
-• First-time users: Lowest baseline, require extra verification
-
-🔄 DYNAMIC CONFIDENCE SCORING:
-
-📋 REAL-TIME ASSESSMENT ALGORITHM:
-1. Baseline confidence: 50 points
-2. Add/subtract based on customer language sentiment
-3. Modify based on solution complexity and customer expertise
-4. Adjust for communication channel and timing
-5. Factor in conversation trajectory and resolution pattern
-
-⚡ CONFIDENCE SCORE TRIGGERS:
-• Score 85+: Approve for closure with standard follow-up
-• Score 70-84: Require additional confirmation before closure
-• Score 55-69: Mandatory verification call/email before closure
-• Score <55: Do not close, continue troubleshooting or escalate
-
-🛡️ QUALITY SAFEGUARDS:
-
-🔒 AUTOMATED CLOSURE PREVENTION:
-• Block closure if confidence score below threshold
-• Require supervisor override for low-confidence closures
-• Flag cases with declining confidence trajectories
-• Alert for unusual closure patterns or timing
-
-📊 CONFIDENCE CALIBRATION:
-• Regular review of confidence scores vs. actual outcomes
-• Adjustment of scoring algorithms based on reopening rates
-• Training data improvement from successful resolutions
-• Feedback loop integration from customer satisfaction surveys
-
-🎖️ BEST PRACTICES FOR HIGH-CONFIDENCE CLOSURES:
-
-✅ PROACTIVE VERIFICATION TECHNIQUES:
-• Ask specific action-based confirmation questions
-• Request customer to demonstrate solution working
-• Provide clear success criteria for customer to verify
-• Offer specific timeframe for testing before closure
-• Set expectations for follow-up communication
-
-📝 DOCUMENTATION EXCELLENCE:
-• Record exact customer confirmation language
-• Document all verification steps completed
-• Note any remaining concerns or follow-up items
-• Include confidence score rationale in case notes
-• Prepare handoff information for potential reopening
-
-🔮 PREDICTIVE CLOSURE SUCCESS:
-• Historical pattern analysis for similar issues
-• Customer behavior profiling for closure preferences
-• Solution complexity correlation with success rates
-• Follow-up requirement prediction based on case characteristics'''
+    """Return the shared, read-only tuple of comprehensive fallback Trend Micro help articles"""
+    return get_fallback_corpus().articles
+
+def get_fallback_article(title):
+    """Return the read-only fallback article with the given title, or None"""
+    return get_fallback_corpus().by_title.get(title)
+
+# =============================
+# Knowledge Pack Format
+# =============================
+# A knowledge pack is a little-endian binary file:
+#   header  "SGKP", format version (u16), reserved (u16), article count (u32)
+#   index   one entry per article: (offset u64, length u32) for title, link and snippet
+#   data    UTF-8 field bytes referenced by the index
+KNOWLEDGE_PACK_MAGIC = b"SGKP"
+KNOWLEDGE_PACK_VERSION = 1
+KNOWLEDGE_PACK_FIELDS = ('title', 'link', 'snippet')
+_PACK_HEADER = struct.Struct("<4sHHI")
+_PACK_ENTRY = struct.Struct("<" + "QI" * len(KNOWLEDGE_PACK_FIELDS))
+
+def build_knowledge_pack(path, articles):
+    """Write articles to a knowledge pack file, replacing it atomically"""
+    encoded = [[str(article[field]).encode('utf-8') for field in KNOWLEDGE_PACK_FIELDS] for article in articles]
+
+    offset = _PACK_HEADER.size + _PACK_ENTRY.size * len(encoded)
+    index = bytearray()
+    for fields in encoded:
+        entry = []
+        for data in fields:
+            entry += [offset, len(data)]
+            offset += len(data)
+        index += _PACK_ENTRY.pack(*entry)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as pack_file:
+        pack_file.write(_PACK_HEADER.pack(KNOWLEDGE_PACK_MAGIC, KNOWLEDGE_PACK_VERSION, 0, len(encoded)))
+        pack_file.write(index)
+        for fields in encoded:
+            for data in fields:
+                pack_file.write(data)
+    os.replace(temp_path, path)
+    return len(encoded)
+
+class KnowledgePack:
+    """Read-only, memory-mapped knowledge pack; field bytes stay in the page cache until decoded"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as pack_file:
+            self._map = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if len(self._map) < _PACK_HEADER.size:
+                raise ValueError("file is too short")
+            magic, version, _, count = _PACK_HEADER.unpack_from(self._map, 0)
+            if magic != KNOWLEDGE_PACK_MAGIC:
+                raise ValueError("not a SentriGuide knowledge pack")
+            if version != KNOWLEDGE_PACK_VERSION:
+                raise ValueError(f"unsupported knowledge pack version {version}")
+            index_end = _PACK_HEADER.size + _PACK_ENTRY.size * count
+            if index_end > len(self._map):
+                raise ValueError("index is truncated")
+            # Check every field up front so a short file falls back here rather than failing on first read
+            for entry in _PACK_ENTRY.iter_unpack(self._map[_PACK_HEADER.size:index_end]):
+                for slot in range(0, len(entry), 2):
+                    if entry[slot] + entry[slot + 1] > len(self._map):
+                        raise ValueError("index is truncated")
+        except Exception:
+            self._map.close()
+            raise
+
+        self.version = version
+        self.articles = tuple(PackedArticle(self, i) for i in range(count))
+
+    def __len__(self):
+        return len(self.articles)
+
+    def read_field(self, position, field):
+        """Decode one field of the article at `position`"""
+        slot = KNOWLEDGE_PACK_FIELDS.index(field)
+        entry = _PACK_ENTRY.unpack_from(self._map, _PACK_HEADER.size + _PACK_ENTRY.size * position)
+        offset, length = entry[2 * slot], entry[2 * slot + 1]
+        if offset + length > len(self._map):
+            raise ValueError(f"article {position} {field} runs past the end of the pack")
+        return self._map[offset:offset + length].decode('utf-8')
+
+    def close(self):
+        """Unmap the pack; its articles must not be read afterwards"""
+        self._map.close()
+
+class PackedArticle(Mapping):
+    """Read-only article backed by a knowledge pack, decoding each field on first access"""
+
+    __slots__ = ('_pack', '_position', '_fields')
+
+    def __init__(self, pack, position):
+        self._pack = pack
+        self._position = position
+        self._fields = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._fields[key]
+        except KeyError:
+            if key not in KNOWLEDGE_PACK_FIELDS:
+                raise
+        value = self._fields[key] = self._pack.read_field(self._position, key)
+        return value
+
+    def __iter__(self):
+        return iter(KNOWLEDGE_PACK_FIELDS)
+
+    def __len__(self):
+        return len(KNOWLEDGE_PACK_FIELDS)
+
+    def peek(self, key):
+        """Decode a field without keeping the decoded copy"""
+        return self._fields.get(key) or self._pack.read_field(self._position, key)
+
+def peek_article_field(article, key):
+    """Read an article field, without pinning a decoded copy when the article is packed"""
+    return article.peek(key) if isinstance(article, PackedArticle) else article[key]
+
+def load_fallback_articles(path=None):
+    """Load fallback articles from the knowledge pack, or from the bundled literals if there is none"""
+    path = KNOWLEDGE_PACK_PATH if path is None else path
+    if path and os.path.exists(path):
+        try:
+            pack = KnowledgePack(path)
+            print(f"📦 Loaded knowledge pack: {len(pack)} articles from {path}")
+            return pack.articles
+        except Exception as e:
+            print(f"Knowledge pack unusable, using built-in articles: {str(e)}")
+
+    from SentriGuide_Articles import FALLBACK_ARTICLES
+    return FALLBACK_ARTICLES
+
+# =============================
+# Local Knowledge Index
+# =============================
+# Title terms that identify each knowledge category's articles in the fallback corpus
+FALLBACK_CATEGORY_TERMS = MappingProxyType({
+    'resolution_guard': ('resolution', 'case closure', 'quality', 'confidence'),
+    'account_website': ('account', 'portal', 'login', 'website', 'access'),
+    'technical_error': ('error', 'troubleshooting', 'installation', 'technical'),
+    'renewal': ('renew',),
+    'installation': ('install',),
+    'id_protection': ('password', 'privacy', 'identity', 'data'),
+    'web_protection': ('web', 'firewall', 'protection', 'parental'),
+    'billing': ('billing', 'refund', 'cashback', 'payment', 'cancel')
+})
+
+class FallbackCorpus:
+    """Immutable fallback article corpus shared by every caller, with title and category lookup tables"""
+
+    def __init__(self, articles, category_terms=FALLBACK_CATEGORY_TERMS):
+        # Packed articles are already read-only and stay lazily decoded
+        self.articles = tuple(article if isinstance(article, PackedArticle) else MappingProxyType(dict(article)) for article in articles)
+        self.by_title = MappingProxyType({article['title']: article for article in self.articles})
+        self.by_category = MappingProxyType({
+            category: tuple(article for article in self.articles if any(term in article['title'].lower() for term in terms))
+            for category, terms in category_terms.items()
+        })
+
+    def __len__(self):
+        return len(self.articles)
+
+_fallback_corpus = None
+_fallback_corpus_lock = threading.Lock()
+
+def get_fallback_corpus():
+    """Return the shared fallback corpus, loading it on first use"""
+    global _fallback_corpus
+
+    with _fallback_corpus_lock:
+        if _fallback_corpus is None:
+            _fallback_corpus = FallbackCorpus(load_fallback_articles())
+        return _fallback_corpus
+
+KNOWLEDGE_STOPWORDS = frozenset("a an and are as at be by can do for from how i in is it my of on or the to with you your".split())
+
+def stem_term(word):
+    """Light suffix stripping so 'renewal', 'renewing' and 'renews' share a posting list"""
+    for suffix in ("ations", "ation", "ings", "ing", "als", "al", "ers", "er", "ed", "es", "s"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[:-len(suffix)]
+    return word
+
+def tokenize_terms(text):
+    """Split text into lowercase, stemmed index terms without stopwords"""
+    return tuple(stem_term(word) for word in re.findall(r"[a-z0-9]+", text.lower()) if word not in KNOWLEDGE_STOPWORDS)
+
+@functools.lru_cache(maxsize=1024)
+def tokenize_query(text):
+    """Memoised tokenize_terms for short query strings that repeat across messages"""
+    return tokenize_terms(text)
+
+class KnowledgeIndex:
+    """Inverted index over articles ranked with BM25, with titles weighted above snippet bodies"""
+
+    def __init__(self, articles, title_boost=KNOWLEDGE_TITLE_BOOST, k1=1.2, b=0.75):
+        self.articles = articles
+        self.k1 = k1
+        self.postings = {}
+
+        lengths = []
+        for doc_id, article in enumerate(articles):
+            frequencies = {}
+            for term in tokenize_terms(article['title']):
+                frequencies[term] = frequencies.get(term, 0) + title_boost
+            for term in tokenize_terms(peek_article_field(article, 'snippet')):
+                frequencies[term] = frequencies.get(term, 0) + 1
+            for term, frequency in frequencies.items():
+                self.postings.setdefault(term, []).append((doc_id, frequency))
+            lengths.append(sum(frequencies.values()))
+
+        # Precompute each document's length normalisation and each term's IDF once
+        average_length = sum(lengths) / len(lengths) if lengths else 0
+        self.length_norms = [k1 * (1 - b + b * length / average_length) if average_length else k1 for length in lengths]
+        total = len(articles)
+        self.idf = {term: math.log(1 + (total - len(docs) + 0.5) / (len(docs) + 0.5)) for term, docs in self.postings.items()}
+
+    def __len__(self):
+        return len(self.articles)
+
+    def search_scores(self, query, limit=3, context=()):
+        """Return up to `limit` (score, doc_id) pairs, best first
+
+        `query` is a string or list of terms from the customer; `context` terms
+        (e.g. a category's vocabulary) count at half weight so they steer rather
+        than outrank what the customer actually asked about.
+        """
+        weights = {}
+        for terms, weight in ((context, 0.5), (query, 1.0)):
+            if not isinstance(terms, str):
+                terms = " ".join(terms)
+            for term in tokenize_query(terms):
+                weights[term] = weight
+
+        scores = {}
+        for term, weight in weights.items():
+            idf = self.idf.get(term)
+            if idf is None:
+                continue
+            idf *= weight
+            for doc_id, frequency in self.postings[term]:
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + self.length_norms[doc_id])
+
+        # Ranked on the negated score so ties keep corpus order and results are stable
+        best = heapq.nsmallest(limit, ((-score, doc_id) for doc_id, score in scores.items()))
+        return [(-negated_score, doc_id) for negated_score, doc_id in best]
+
+    def search(self, query, limit=3, context=()):
+        """Return up to `limit` articles matching a query, most relevant first"""
+        return [self.articles[doc_id] for _, doc_id in self.search_scores(query, limit, context)]
+
+_knowledge_index = None
+_knowledge_index_lock = threading.Lock()
+
+def get_knowledge_index():
+    """Return the index over the built-in fallback articles, building it on first use"""
+    global _knowledge_index
+
+    with _knowledge_index_lock:
+        if _knowledge_index is None:
+            _knowledge_index = KnowledgeIndex(get_fallback_articles())
+        return _knowledge_index
+
+# =============================
+# Phrase Matching
+# =============================
+class PhraseMatcher:
+    """Aho–Corasick automaton that finds every registered phrase in a single pass over the text
+
+    Cost depends on the length of the text and the number of matches, not on how
+    many phrases are registered. Call compile() after the last add() before
+    sharing a matcher between threads.
+    """
+
+    def __init__(self, phrases=()):
+        self.phrases = []
+        self._goto = [{}]
+        self._fail = [0]
+        self._terminal = [()]
+        self._output = [()]
+        self._compiled = True
+        for phrase, category, weight in phrases:
+            self.add(phrase, category, weight)
+
+    def add(self, phrase, category, weight=1):
+        """Register a phrase; the same phrase may be registered under several categories"""
+        state = 0
+        for char in phrase:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._terminal.append(())
+            state = next_state
+        self._terminal[state] += (len(self.phrases),)
+        self.phrases.append((phrase, category, weight))
+        self._compiled = False
+
+    def compile(self):
+        """Build failure links breadth-first; called automatically before the first search"""
+        self._output = list(self._terminal)
+        queue = deque(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+        self._compiled = True
+
+    def find(self, text):
+        """Return (phrase, category, weight) for every registered phrase occurring in text, in registration order
+
+        Each phrase is reported once no matter how often it occurs, matching `phrase in text`.
+        """
+        if not self._compiled:
+            self.compile()
+
+        goto, fail, output = self._goto, self._fail, self._output
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return [self.phrases[index] for index in sorted(found)]
+
+# Weighted emotion phrases; the order of emotions and phrases is the order indicators are reported in
+SENTIMENT_PATTERNS = {
+    'frustrated': (
+        ('this is ridiculous', 3), ('this is stupid', 3), ('this is terrible', 3),
+        ('not working', 2), ('still not', 2), ('keep getting', 2), ('tried everything', 2),
+        ('waste of time', 3), ('sick of this', 3), ('fed up', 3), ('had enough', 3),
+        ('frustrated', 2), ('annoying', 2), ('horrible', 2), ('awful', 2), ('terrible', 2),
+        ('angry', 2), ('mad', 2), ('upset', 2), ('irritated', 2), ('furious', 3),
+        ('useless', 2), ('broken', 2), ('garbage', 3), ('worst', 2), ('hate', 3)
+    ),
+    'satisfied': (
+        ('thank you', 2), ('thanks', 2), ('appreciate', 2), ('helpful', 2), ('great', 2),
+        ('excellent', 2), ('perfect', 2), ('amazing', 2), ('wonderful', 2), ('fantastic', 2),
+        ('works perfectly', 3), ('fixed it', 2), ('solved', 2), ('resolved', 2),
+        ('good', 1), ('better', 1), ('working now', 2), ('that worked', 2),
+        ('happy', 2), ('pleased', 2), ('satisfied', 2), ('love', 2)
+    ),
+    'urgent': (
+        ('urgent', 2), ('emergency', 3), ('critical', 2), ('asap', 2), ('immediately', 2),
+        ('right now', 2), ('can\'t wait', 2), ('need help now', 3), ('broken down', 2),
+        ('not working at all', 3), ('completely broken', 3), ('dead', 2), ('crashed', 2),
+        ('lost everything', 3), ('virus', 2), ('hacked', 3), ('breach', 3), ('compromised', 3)
+    ),
+    'confused': (
+        ('don\'t understand', 2), ('confused', 2), ('unclear', 2), ('what does', 1),
+        ('how do i', 1), ('what is', 1), ('explain', 1), ('not sure', 1), ('help me understand', 2),
+        ('i don\'t know', 2), ('what\'s the difference', 1), ('which one', 1), ('where do i', 1),
+        ('step by step', 1), ('walk me through', 2), ('show me how', 2)
+    ),
+    'worried': (
+        ('worried', 2), ('concerned', 2), ('afraid', 2), ('scared', 2), ('nervous', 2),
+        ('what if', 1), ('might happen', 1), ('could this', 1), ('is this normal', 1),
+        ('should i be', 1), ('is it safe', 2), ('will i lose', 2), ('am i protected', 2)
+    ),
+    'impatient': (
+        ('how long', 1), ('still waiting', 2), ('been hours', 2), ('taking forever', 2),
+        ('when will', 1), ('how much longer', 2), ('this is slow', 2), ('hurry up', 3),
+        ('speed this up', 2), ('taking too long', 2), ('why so slow', 2)
+    )
+}
+
+# Phrases that only feed urgency and message-context flags
+SENTIMENT_CONTEXT_PHRASES = {
+    'high_urgency': ('asap', 'emergency', 'critical', 'immediately', 'right now', 'urgent', 'can\'t wait', 'need help now'),
+    'medium_urgency': ('soon', 'quickly', 'when will', 'how long', 'need this fixed', 'time sensitive'),
+    'business_context': ('work', 'business', 'office', 'meeting', 'deadline', 'presentation'),
+    'time_hint': ('when', 'time', 'soon', 'quick'),
+    'technical': ('log', 'error', 'code', 'configuration', 'registry', 'firewall'),
+    'formal': ('please', 'kindly', 'would you')
+}
+
+def compile_phrase_matcher(phrases_by_category):
+    """Compile {category: phrases} into a PhraseMatcher; phrases are strings or (phrase, weight) pairs"""
+    matcher = PhraseMatcher()
+    for category, phrases in phrases_by_category.items():
+        for phrase in phrases:
+            if isinstance(phrase, tuple):
+                matcher.add(phrase[0], category, phrase[1])
+            else:
+                matcher.add(phrase, category)
+    matcher.compile()
+    return matcher
+
+SENTIMENT_MATCHER = compile_phrase_matcher({**SENTIMENT_PATTERNS, **SENTIMENT_CONTEXT_PHRASES})
+
+# =============================
+# Conversation Context Compaction
+# =============================
+class HistoryFollower:
+    """Base for state folded from a conversation history one appended message at a time"""
+
+    def reset(self):
+        """Forget every consumed message"""
+        self._history = None
+        self._last_message = None
+        self.consumed = 0
+
+    def add(self, message):
+        """Fold one appended message into the state"""
+        raise NotImplementedError
+
+    def sync(self, history):
+        """Consume the messages appended to `history` since the last sync
+
+        Starts over if a different list is passed, or if the list was cleared or
+        rewritten, which is detected by the last consumed message no longer
+        being in its old position.
+        """
+        if (history is not self._history or len(history) < self.consumed
+                or (self.consumed and history[self.consumed - 1] is not self._last_message)):
+            self.reset()
+            self._history = history
+
+        for message in itertools.islice(history, self.consumed, None):
+            self.add(message)
+            self._last_message = message
+            self.consumed += 1
+
+def conversation_role_label(role):
+    """Label used for a message role in compacted conversation text"""
+    return "CUSTOMER" if role == "customer" else "ENGINEER" if role == "engineer" else "SYSTEM"
+
+class ConversationSegment:
+    """Fixed-size digest of a contiguous run of conversation turns"""
+
+    __slots__ = ('level', 'first_turn', 'last_turn', 'customer_turns', 'engineer_turns', 'topics', 'key_lines')
+
+    def __init__(self, level, first_turn, last_turn, customer_turns=0, engineer_turns=0, topics=None, key_lines=None):
+        self.level = level
+        self.first_turn = first_turn
+        self.last_turn = last_turn
+        self.customer_turns = customer_turns
+        self.engineer_turns = engineer_turns
+        self.topics = topics or {}
+        self.key_lines = key_lines or {}  # role -> (salience, text) of the most informative line
+
+    @classmethod
+    def from_turns(cls, first_turn, turns):
+        """Digest raw turns into a level-0 segment"""
+        segment = cls(0, first_turn, first_turn + len(turns) - 1)
+        for message in turns:
+            role = message['role']
+            if role == 'customer':
+                segment.customer_turns += 1
+            elif role == 'engineer':
+                segment.engineer_turns += 1
+
+            # Topics are the knowledge categories a turn mentions, or its general keywords if none
+            hits = classify_knowledge_terms(message['content'])
+            general_terms = hits.pop('general')
+            topics = [category.replace('_', ' ') for category, terms in hits.items() if terms] or general_terms
+            for topic in topics:
+                segment.topics[topic] = segment.topics.get(topic, 0) + 1
+            salience = len(topics)
+            # Later lines win ties so the digest leans towards where the segment ended up
+            if role in ('customer', 'engineer') and salience >= segment.key_lines.get(role, (-1, ""))[0]:
+                segment.key_lines[role] = (salience, message['content'][:CONTEXT_SEGMENT_CHARS])
+        segment.topics = segment.top_topics()
+        return segment
+
+    @classmethod
+    def merge(cls, segments, level):
+        """Merge adjacent segments, oldest first, into one higher-level segment"""
+        merged = cls(level, segments[0].first_turn, segments[-1].last_turn)
+        for segment in segments:
+            merged.customer_turns += segment.customer_turns
+            merged.engineer_turns += segment.engineer_turns
+            for topic, count in segment.topics.items():
+                merged.topics[topic] = merged.topics.get(topic, 0) + count
+            for role, line in segment.key_lines.items():
+                if line[0] >= merged.key_lines.get(role, (-1, ""))[0]:
+                    merged.key_lines[role] = line
+        merged.topics = merged.top_topics()
+        return merged
+
+    def top_topics(self, limit=5):
+        return dict(sorted(self.topics.items(), key=lambda item: -item[1])[:limit])
+
+    def summary(self):
+        """Render the digest as one bounded line of text"""
+        topics = ", ".join(self.topics) or "general discussion"
+        text = f"Turns {self.first_turn}-{self.last_turn} ({self.customer_turns} customer, {self.engineer_turns} engineer) | topics: {topics}"
+        for role in ('customer', 'engineer'):
+            if role in self.key_lines:
+                text += f" | {role}: \"{self.key_lines[role][1][:CONTEXT_SEGMENT_CHARS // 2]}\""
+        return text[:CONTEXT_SEGMENT_CHARS * 2]
+
+class ConversationCompactor(HistoryFollower):
+    """Rolling conversation context: recent turns verbatim, older turns compacted hierarchically
+
+    Every CONTEXT_SEGMENT_TURNS turns that leave the recent window become a segment
+    digest. Whenever CONTEXT_MERGE_FANOUT neighbouring segments share a level they
+    are merged one level up, and the oldest segments are merged further once
+    CONTEXT_MAX_SEGMENTS is exceeded, so the context stays bounded for any length.
+    """
+
+    def __init__(self, recent_turns=None, segment_turns=None, fanout=None, max_segments=None):
+        self.recent_turns = recent_turns or CONTEXT_RECENT_TURNS
+        self.segment_turns = segment_turns or CONTEXT_SEGMENT_TURNS
+        self.fanout = fanout or CONTEXT_MERGE_FANOUT
+        self.max_segments = max_segments or CONTEXT_MAX_SEGMENTS
+        self._lock = threading.RLock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            super().reset()
+            self.segments = []
+            self.pending = []  # Turns that left the recent window but don't fill a segment yet
+            self.recent = deque()
+
+    def sync(self, history):
+        with self._lock:
+            super().sync(history)
+
+    def add(self, message):
+        self.recent.append(message)
+        if len(self.recent) <= self.recent_turns:
+            return
+
+        self.pending.append(self.recent.popleft())
+        if len(self.pending) < self.segment_turns:
+            return
+
+        first_turn = self.consumed - self.recent_turns - len(self.pending) + 2
+        self.segments.append(ConversationSegment.from_turns(first_turn, self.pending))
+        self.pending = []
+        self._compact()
+
+    def _compact(self):
+        segments = self.segments
+        while len(segments) >= self.fanout and len({segment.level for segment in segments[-self.fanout:]}) == 1:
+            level = segments[-1].level
+            segments[-self.fanout:] = [ConversationSegment.merge(segments[-self.fanout:], level + 1)]
+
+        while len(segments) > self.max_segments:
+            segments[:2] = [ConversationSegment.merge(segments[:2], max(segments[0].level, segments[1].level) + 1)]
+
+    def context(self, header="RECENT CONVERSATION"):
+        """Return bounded conversation text: compacted earlier turns, then recent turns verbatim"""
+        with self._lock:
+            text = ""
+            earlier = list(self.segments)
+            if self.pending:
+                first_turn = self.consumed - len(self.recent) - len(self.pending) + 1
+                earlier.append(ConversationSegment.from_turns(first_turn, self.pending))
+            if earlier:
+                text += "EARLIER CONVERSATION (compacted):\n"
+                for segment in earlier:
+                    text += f"• {segment.summary()}\n"
+                text += "\n"
+
+            text += f"{header}:\n"
+            for message in self.recent:
+                content = message['content']
+                if len(content) > CONTEXT_TURN_CHARS:
+                    content = content[:CONTEXT_TURN_CHARS] + "..."
+                text += f"{conversation_role_label(message['role'])}: {content}\n"
+            return text
+
+def build_conversation_context(history):
+    """Build compacted conversation context for a history in one shot"""
+    compactor = ConversationCompactor()
+    compactor.sync(history)
+    return compactor.context()
+
+# =============================
+# Resolution Confidence Model
+# =============================
+# Phrases that signal how far a conversation is from a confirmed resolution
+RESOLUTION_SIGNAL_PHRASES = {
+    'confirmation': ("that worked", "it works", "it's working", "working now", "works now", "works perfectly", "fixed it", "that fixed", "is fixed",
+                     "resolved", "solved", "all good", "all set", "problem is gone", "no more errors", "everything is working", "perfect, thanks"),
+    'unresolved': ("still not", "still getting", "still having", "still the same", "same problem", "same error", "doesn't work", "didn't work",
+                   "does not work", "did not work", "not working", "not fixed", "won't", "can't", "again", "another error", "keeps happening"),
+    'deferred': ("try this later", "try it later", "try later", "i'll try", "i will try", "will check", "check later", "get back to you", "let you know"),
+    'steps': ("step", "click", "open", "select", "go to", "install", "restart", "run a", "update", "navigate", "enter", "try"),
+    'verification': ("can you confirm", "could you confirm", "is it working", "is everything working", "did that work", "did that help",
+                     "anything else", "does that resolve", "working correctly")
+}
+
+RESOLUTION_MATCHER = compile_phrase_matcher(RESOLUTION_SIGNAL_PHRASES)
+
+# Logistic model weights per feature; features are 0/1 flags except sentiment_trend, which is in [-1, 1]
+RESOLUTION_MODEL_BIAS = -0.5
+RESOLUTION_MODEL_WEIGHTS = {
+    'confirmed': 2.6,
+    'still_broken': -2.2,
+    'open_question': -0.8,
+    'awaiting_engineer': -0.4,
+    'steps_provided': 0.6,
+    'verification_asked': 0.4,
+    'deferred': -1.6,
+    'sentiment_trend': 0.9,
+    'satisfied': 0.9,
+    'negative_emotion': -0.9,
+    'uncertain_emotion': -0.5,
+    'early_conversation': -0.8,
+    'extended_conversation': -0.4
+}
+
+RESOLUTION_RISK_FACTORS = {
+    'still_broken': "Customer still reports the problem",
+    'open_question': "Customer has an unanswered question",
+    'awaiting_engineer': "Customer's latest message has not been answered",
+    'deferred': "Customer plans to try the fix later without confirming",
+    'negative_emotion': "Customer is frustrated or under pressure",
+    'uncertain_emotion': "Customer is confused or worried about the solution",
+    'extended_conversation': "Extended conversation - risk of repeat contact"
+}
+
+class ResolutionConfidenceModel:
+    """Local logistic model scoring how safely a case can be closed, from conversation features"""
+
+    def __init__(self, weights=None, bias=RESOLUTION_MODEL_BIAS):
+        self.weights = weights or RESOLUTION_MODEL_WEIGHTS
+        self.bias = bias
+
+    def features(self, history, customer_emotion):
+        """Extract the model's features from a conversation"""
+        customer_messages = [msg['content'] for msg in history[-12:] if msg['role'] == 'customer']
+        engineer_messages = [msg['content'] for msg in history[-12:] if msg['role'] == 'engineer']
+        last_customer = customer_messages[-1].lower() if customer_messages else ""
+        last_engineer = engineer_messages[-1].lower() if engineer_messages else ""
+
+        recent_signals = {category for message in customer_messages[-2:] for _, category, _ in RESOLUTION_MATCHER.find(message.lower())}
+        last_signals = {category for _, category, _ in RESOLUTION_MATCHER.find(last_customer)}
+        engineer_signals = {category for message in engineer_messages for _, category, _ in RESOLUTION_MATCHER.find(message.lower())}
+
+        # Sentiment trend from the opening customer message to the latest one
+        trend = 0.0
+        first_customer = next((msg for msg in history if msg['role'] == 'customer'), None)
+        latest_customer = next((msg for msg in reversed(history) if msg['role'] == 'customer'), None)
+        if first_customer is not latest_customer:
+            first_satisfaction = score_customer_sentiment(first_customer['content'])['satisfaction']
+            last_satisfaction = score_customer_sentiment(latest_customer['content'])['satisfaction']
+            trend = max(-1.0, min(1.0, (last_satisfaction - first_satisfaction) / 50))
+
+        confirmed = 'confirmation' in recent_signals and 'unresolved' not in last_signals
+        return {
+            'confirmed': float(confirmed),
+            'still_broken': float('unresolved' in last_signals),
+            'open_question': float('?' in last_customer),
+            'awaiting_engineer': float(bool(history) and history[-1]['role'] == 'customer' and not confirmed),
+            'steps_provided': float('steps' in engineer_signals),
+            'verification_asked': float('verification' in {category for _, category, _ in RESOLUTION_MATCHER.find(last_engineer)}),
+            'deferred': float('deferred' in last_signals),
+            'sentiment_trend': trend,
+            'satisfied': float(customer_emotion == 'satisfied'),
+            'negative_emotion': float(customer_emotion in ('frustrated', 'urgent', 'impatient')),
+            'uncertain_emotion': float(customer_emotion in ('confused', 'worried')),
+            'early_conversation': float(len(history) < 4),
+            'extended_conversation': float(len(history) > 20)
         }
-    ]
+
+    def predict(self, features):
+        """Return the confidence score (0-100) for a feature dict"""
+        logit = self.bias + sum(self.weights.get(name, 0.0) * value for name, value in features.items())
+        return round(100 / (1 + math.exp(-logit)))
+
+    def analyze(self, history, customer_emotion):
+        """Score a conversation; returns (score, analysis) in the CONFIDENCE_SCORE/RESOLUTION_STATUS format"""
+        features = self.features(history, customer_emotion)
+        score = self.predict(features)
+
+        if score >= 80:
+            status = "RESOLVED"
+        elif features['deferred'] or (features['confirmed'] and features['still_broken']):
+            status = "NEEDS_FOLLOW_UP"
+        elif score >= 55:
+            status = "PARTIALLY_RESOLVED"
+        else:
+            status = "NOT_RESOLVED"
+
+        risks = [text for name, text in RESOLUTION_RISK_FACTORS.items() if features[name]]
+        if features['sentiment_trend'] < -0.2:
+            risks.append("Customer satisfaction is falling")
+        if not features['confirmed']:
+            risks.append("No explicit confirmation that the solution works")
+        if not features['steps_provided']:
+            risks.append("No troubleshooting steps provided yet")
+
+        if score >= 90:
+            recommendation = "Safe to close - the customer confirmed the fix. Offer further help, then close."
+        elif score >= 70:
+            recommendation = "Ask the customer to explicitly confirm the issue is fixed before closing."
+        else:
+            recommendation = f"Do not close - continue troubleshooting. Address first: {risks[0] if risks else 'confirm the issue is fixed'}."
+
+        contributions = sorted(((self.weights.get(name, 0.0) * value, name) for name, value in features.items() if value), key=lambda item: -abs(item[0]))
+        signals = ", ".join(f"{name} ({weight:+.1f})" for weight, name in contributions[:5]) or "none"
+
+        analysis = f"""CONFIDENCE_SCORE: {score}
+RESOLUTION_STATUS: {status}
+RISK_FACTORS: {'; '.join(risks) if risks else 'None detected'}
+RECOMMENDATION: {recommendation}
+KEY_SIGNALS: {signals}"""
+        return score, analysis
+
+resolution_model = ResolutionConfidenceModel()
 
 # =============================
-# Core SentriGuide AI Functions
+# LLM Backends
 # =============================
-def update_conversation_summary():
-    """Challenge 1: Context Management - Summarize long conversations"""
-    global conversation_summary, is_processing
+class LLMBackend:
+    """Interface for language model backends: complete(prompt) returns the response text"""
 
-    if is_processing or len(conversation_history) < 2:
-        return
+    name = "llm"
 
-    is_processing = True
-    update_status("Analyzing conversation context...")
+    def complete(self, prompt, max_tokens=LLM_MAX_TOKENS):
+        raise NotImplementedError
 
-    try:
-        # Simple rule-based analysis
-        total_messages = len(conversation_history)
-        customer_messages = [msg for msg in conversation_history if msg['role'] == 'customer']
-        engineer_messages = [msg for msg in conversation_history if msg['role'] == 'engineer']
-
-        # Identify main issue from first customer message
-        main_issue = "General inquiry"
-        if customer_messages:
-            first_msg = customer_messages[0]['content'].lower()
-            if any(word in first_msg for word in ['virus', 'malware', 'infected']):
-                main_issue = "Malware/Virus concern"
-            elif any(word in first_msg for word in ['slow', 'performance', 'speed']):
-                main_issue = "Performance issue"
-            elif any(word in first_msg for word in ['email', 'spam', 'phishing']):
-                main_issue = "Email security"
-            elif any(word in first_msg for word in ['update', 'install', 'download']):
-                main_issue = "Software update/installation"
+    def stream(self, prompt, max_tokens=LLM_MAX_TOKENS):
+        """Yield the response text in chunks as it is generated; backends without streaming yield it whole"""
+        yield self.complete(prompt, max_tokens)
+
+    def stats(self):
+        return {}
+
+class MessagesAPIBackend(LLMBackend):
+    """Backend for an HTTP service speaking the messages API (POST {"model", "max_tokens", "messages"})"""
+
+    name = "messages-api"
+
+    def __init__(self, url=LLM_API_URL, model=LLM_MODEL, api_key=LLM_API_KEY, timeout=LLM_TIMEOUT):
+        self.url = url
+        self.model = model
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({"content-type": "application/json", "anthropic-version": "2023-06-01"})
+        if api_key:
+            self.session.headers["x-api-key"] = api_key
+
+        self._lock = threading.Lock()
+        self.requests_sent = 0
+        self.failures = 0
+        self.total_latency_ms = 0.0
+        self.streams = 0
+        self.total_first_token_ms = 0.0
+
+    def complete(self, prompt, max_tokens=LLM_MAX_TOKENS):
+        payload = {"model": self.model, "max_tokens": max_tokens, "messages": [{"role": "user", "content": prompt}]}
+        start = time.perf_counter()
+        try:
+            response = self.session.post(self.url, json=payload, timeout=self.timeout)
+            response.raise_for_status()
+            text = "".join(block.get("text", "") for block in response.json().get("content", []) if block.get("type", "text") == "text")
+        except Exception:
+            with self._lock:
+                self.failures += 1
+            raise
+        finally:
+            with self._lock:
+                self.requests_sent += 1
+                self.total_latency_ms += (time.perf_counter() - start) * 1000
+        return text
+
+    def stream(self, prompt, max_tokens=LLM_MAX_TOKENS):
+        """Stream text deltas from the server-sent events of a streaming messages request"""
+        payload = {"model": self.model, "max_tokens": max_tokens, "stream": True, "messages": [{"role": "user", "content": prompt}]}
+        start = time.perf_counter()
+        first_token_ms = None
+        try:
+            with self.session.post(self.url, json=payload, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                response.encoding = "utf-8"
+                # chunk_size=None hands over each event as it arrives instead of waiting to fill a buffer
+                for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+                    event = json.loads(line[5:])
+                    if event.get("type") == "content_block_delta" and event["delta"].get("type") == "text_delta":
+                        if first_token_ms is None:
+                            first_token_ms = (time.perf_counter() - start) * 1000
+                        yield event["delta"]["text"]
+                    elif event.get("type") == "error":
+                        raise RuntimeError(event.get("error", {}).get("message", "stream error"))
+                    elif event.get("type") == "message_stop":
+                        break
+        except Exception:
+            with self._lock:
+                self.failures += 1
+            raise
+        finally:
+            with self._lock:
+                self.requests_sent += 1
+                self.total_latency_ms += (time.perf_counter() - start) * 1000
+                if first_token_ms is not None:
+                    self.streams += 1
+                    self.total_first_token_ms += first_token_ms
+
+    def stats(self):
+        with self._lock:
+            return {
+                "requests_sent": self.requests_sent,
+                "failures": self.failures,
+                "avg_latency_ms": round(self.total_latency_ms / self.requests_sent, 1) if self.requests_sent else 0.0,
+                "avg_first_token_ms": round(self.total_first_token_ms / self.streams, 1) if self.streams else 0.0
+            }
+
+class CachingLLMBackend(LLMBackend):
+    """Wraps a backend with a content-hash response cache and coalescing of identical in-flight prompts"""
+
+    def __init__(self, backend, max_entries=LLM_CACHE_ENTRIES, ttl=LLM_CACHE_TTL):
+        self.backend = backend
+        self.name = f"cached-{backend.name}"
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()  # key -> (stored_at, text)
+        self._in_flight = {}  # key -> Future shared by concurrent identical prompts
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.misses = 0
+
+    @staticmethod
+    def cache_key(prompt, max_tokens, model=""):
+        return hashlib.sha256(f"{model}\0{max_tokens}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def _claim(self, prompt, max_tokens):
+        """Look a prompt up; returns (key, cached_text, future, owner)
+
+        cached_text is set on a cache hit. Otherwise `future` resolves to the
+        response, and `owner` says whether this caller must produce it.
+        """
+        key = self.cache_key(prompt, max_tokens, getattr(self.backend, "model", ""))
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return key, entry[1], None, False
+
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return key, None, future, False
+
+            future = self._in_flight[key] = Future()
+            self.misses += 1
+            return key, None, future, True
+
+    def _settle(self, key, future, text=None, error=None):
+        with self._lock:
+            del self._in_flight[key]
+            if error is None:
+                self._cache[key] = (time.monotonic(), text)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+        if error is None:
+            future.set_result(text)
+        else:
+            future.set_exception(error)
+
+    def complete(self, prompt, max_tokens=LLM_MAX_TOKENS):
+        key, cached_text, future, owner = self._claim(prompt, max_tokens)
+        if cached_text is not None:
+            return cached_text
+        if not owner:
+            return future.result()
+
+        try:
+            text = self.backend.complete(prompt, max_tokens)
+        except Exception as e:
+            self._settle(key, future, error=e)
+            raise
+        self._settle(key, future, text)
+        return text
+
+    def stream(self, prompt, max_tokens=LLM_MAX_TOKENS):
+        """Stream a response; cache hits and coalesced prompts arrive as a single chunk"""
+        key, cached_text, future, owner = self._claim(prompt, max_tokens)
+        if cached_text is not None:
+            yield cached_text
+            return
+        if not owner:
+            yield future.result()
+            return
+
+        chunks = []
+        try:
+            for chunk in self.backend.stream(prompt, max_tokens):
+                chunks.append(chunk)
+                yield chunk
+        except Exception as e:
+            self._settle(key, future, error=e)
+            raise
+        except GeneratorExit:
+            self._settle(key, future, error=RuntimeError("LLM stream abandoned before completion"))
+            raise
+        self._settle(key, future, "".join(chunks))
+
+    def stats(self):
+        with self._lock:
+            lookups = self.cache_hits + self.coalesced + self.misses
+            stats = {
+                "cache_hits": self.cache_hits,
+                "coalesced": self.coalesced,
+                "backend_calls": self.misses,
+                "hit_rate": (self.cache_hits + self.coalesced) / lookups if lookups else 0.0,
+                "cache_entries": len(self._cache)
+            }
+        stats["backend"] = self.backend.stats()
+        return stats
+
+_llm_backend = None
+_llm_backend_lock = threading.Lock()
+
+def get_llm_backend():
+    """Return the configured LLM backend, or None when SENTRIGUIDE_LLM_URL is not set"""
+    global _llm_backend
+
+    with _llm_backend_lock:
+        if _llm_backend is None and LLM_API_URL:
+            _llm_backend = CachingLLMBackend(MessagesAPIBackend())
+        return _llm_backend
+
+def set_llm_backend(backend):
+    """Install an LLM backend (or None for local scoring only)"""
+    global _llm_backend
+
+    with _llm_backend_lock:
+        _llm_backend = backend
+
+class LocalMessagesServer:
+    """Local stand-in for a messages API service, for tests and load runs without a live model
+
+    Replies are produced by `responder(prompt)`; the default returns a deterministic
+    confidence analysis derived from the prompt hash. `latency` adds a fixed delay.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, responder=None, token_latency=0.0):
+        self.latency = latency
+        self.token_latency = token_latency
+        self.responder = responder or self.default_response
+        self.requests_served = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Streams use chunked transfer encoding like the real API, so each event reaches the client as it is sent
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                if self.path.rstrip("/") != "/v1/messages":
+                    self.send_error(404)
+                    return
+                try:
+                    payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                    prompt = "".join(message.get("content", "") for message in payload.get("messages", []) if isinstance(message.get("content"), str))
+                except (ValueError, AttributeError):
+                    self.send_error(400)
+                    return
+
+                if server.latency:
+                    time.sleep(server.latency)
+                with server._lock:
+                    server.requests_served += 1
+
+                message = {
+                    "id": f"msg_local_{hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:12]}",
+                    "type": "message",
+                    "role": "assistant",
+                    "model": payload.get("model") or "local-stand-in",
+                    "content": [{"type": "text", "text": server.responder(prompt)}],
+                    "stop_reason": "end_turn"
+                }
+                if payload.get("stream"):
+                    self.send_stream(message)
+                    return
+
+                body = json.dumps(message).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def send_stream(self, message):
+                """Send the message as server-sent events, one text delta per word"""
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+
+                def send_chunk(data):
+                    self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+                    self.wfile.flush()
+
+                def send_event(event_type, data):
+                    send_chunk(f"event: {event_type}\ndata: {json.dumps(dict(data, type=event_type))}\n\n".encode("utf-8"))
+
+                text = message["content"][0]["text"]
+                send_event("message_start", {"message": dict(message, content=[], stop_reason=None)})
+                send_event("content_block_start", {"index": 0, "content_block": {"type": "text", "text": ""}})
+                for token in re.findall(r"\S+\s*|\s+", text):
+                    if server.token_latency:
+                        time.sleep(server.token_latency)
+                    send_event("content_block_delta", {"index": 0, "delta": {"type": "text_delta", "text": token}})
+                send_event("content_block_stop", {"index": 0})
+                send_event("message_delta", {"delta": {"stop_reason": "end_turn"}})
+                send_event("message_stop", {})
+                send_chunk(b"")
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1/messages"
+
+    @staticmethod
+    def default_response(prompt):
+        score = int(hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8], 16) % 101
+        status = "RESOLVED" if score >= 80 else "PARTIALLY_RESOLVED" if score >= 55 else "NOT_RESOLVED"
+        return f"""CONFIDENCE_SCORE: {score}
+RESOLUTION_STATUS: {status}
+RISK_FACTORS: Local stand-in response
+RECOMMENDATION: Stand-in server reply for testing; not a real model assessment"""
+
+    def start(self):
+        """Serve requests on a background thread; returns self"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="sentriguide-llm-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+# =============================
+# Core SentriGuide AI Functions
+# =============================
+class IncrementalSummarizer(HistoryFollower):
+    """Running conversation summary state, updated per appended message so each summary costs O(1)"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self.customer_count = 0
+        self.engineer_count = 0
+        self.first_customer_message = None
+        self.main_issue = "General inquiry"
+        self.latest_customer_message = None
+        self.latest_timestamp = None
+
+    def add(self, message):
+        if message['role'] == 'customer':
+            self.customer_count += 1
+            self.latest_customer_message = message['content']
+            if self.first_customer_message is None:
+                self.first_customer_message = message['content']
+                self.main_issue = detect_main_issue(message['content'])
+        elif message['role'] == 'engineer':
+            self.engineer_count += 1
+
+        self.latest_timestamp = message['timestamp']
+
+    def render(self):
+        """Format the summary panel text"""
+        total_messages = self.consumed
 
         # Determine conversation state
         if total_messages > 6:
@@ -1763,20 +2019,20 @@ def update_conversation_summary():
         else:
             state = "Initial contact phase"
 
-        conversation_summary = f"""CONVERSATION SUMMARY:
+        return f"""CONVERSATION SUMMARY:
 
-MAIN ISSUE: {main_issue}
-TOTAL MESSAGES: {total_messages} ({len(customer_messages)} customer, {len(engineer_messages)} engineer)
+MAIN ISSUE: {self.main_issue}
+TOTAL MESSAGES: {total_messages} ({self.customer_count} customer, {self.engineer_count} engineer)
 CURRENT STATE: {state}
 
 CUSTOMER PROFILE:
-• Communication: {'Detailed' if len(customer_messages) > 0 and len(customer_messages[0]['content']) > 100 else 'Concise'}
-• Latest concern: {customer_messages[-1]['content'][:100] if customer_messages else 'None'}...
+• Communication: {'Detailed' if self.first_customer_message is not None and len(self.first_customer_message) > 100 else 'Concise'}
+• Latest concern: {self.latest_customer_message[:100] if self.latest_customer_message is not None else 'None'}...
 
 PROGRESS NOTES:
-• Conversation started with: {main_issue}
-• Engineer responses provided: {len(engineer_messages)}
-• Latest interaction: {conversation_history[-1]['timestamp'] if conversation_history else 'N/A'}
+• Conversation started with: {self.main_issue}
+• Engineer responses provided: {self.engineer_count}
+• Latest interaction: {self.latest_timestamp if total_messages else 'N/A'}
 
 CONTEXT NOTES:
 • Monitor for resolution confirmation
@@ -1784,218 +2040,174 @@ CONTEXT NOTES:
 • Consider escalation if conversation exceeds 8 messages
 """
 
-        update_context_panel()
-        update_status("Context updated")
-
-    except Exception as e:
-        conversation_summary = f"Summary error: {str(e)}"
-        update_status("Context analysis failed")
-    finally:
-        is_processing = False
-
-def analyze_sentiment_and_tone():
-    """Challenge 2: Emotional Alignment - Analyze customer sentiment and suggest tone"""
-    global customer_sentiment, is_processing
+def detect_main_issue(first_customer_message):
+    """Identify the main issue from the first customer message"""
+    first_msg = first_customer_message.lower()
+    if any(word in first_msg for word in ['virus', 'malware', 'infected']):
+        return "Malware/Virus concern"
+    elif any(word in first_msg for word in ['slow', 'performance', 'speed']):
+        return "Performance issue"
+    elif any(word in first_msg for word in ['email', 'spam', 'phishing']):
+        return "Email security"
+    elif any(word in first_msg for word in ['update', 'install', 'download']):
+        return "Software update/installation"
+    return "General inquiry"
+
+def build_conversation_summary(history):
+    """Build the rule-based context summary for a conversation history"""
+    summarizer = IncrementalSummarizer()
+    summarizer.sync(history)
+    return summarizer.render()
+
+conversation_summarizer = IncrementalSummarizer()
+conversation_compactor = ConversationCompactor()
 
-    if not conversation_history or is_processing:
-        return
-
-    latest_customer_msg = ""
-    for msg in reversed(conversation_history):
-        if msg["role"] == "customer":
-            latest_customer_msg = msg["content"]
-            break
+def update_conversation_summary():
+    """Challenge 1: Context Management - Summarize long conversations"""
+    global conversation_summary
 
-    if not latest_customer_msg:
+    if len(conversation_history) < 2:
         return
 
-    is_processing = True
-    update_status("Analyzing customer emotion...")
+    update_status("Analyzing conversation context...")
 
     try:
-        # Enhanced sentiment analysis with contextual patterns
-        msg_lower = latest_customer_msg.lower()
-
-        # Emotion detection with weighted scoring
-        frustrated_patterns = [
-            ('this is ridiculous', 3), ('this is stupid', 3), ('this is terrible', 3),
-            ('not working', 2), ('still not', 2), ('keep getting', 2), ('tried everything', 2),
-            ('waste of time', 3), ('sick of this', 3), ('fed up', 3), ('had enough', 3),
-            ('frustrated', 2), ('annoying', 2), ('horrible', 2), ('awful', 2), ('terrible', 2),
-            ('angry', 2), ('mad', 2), ('upset', 2), ('irritated', 2), ('furious', 3),
-            ('useless', 2), ('broken', 2), ('garbage', 3), ('worst', 2), ('hate', 3)
-        ]
-
-        satisfied_patterns = [
-            ('thank you', 2), ('thanks', 2), ('appreciate', 2), ('helpful', 2), ('great', 2),
-            ('excellent', 2), ('perfect', 2), ('amazing', 2), ('wonderful', 2), ('fantastic', 2),
-            ('works perfectly', 3), ('fixed it', 2), ('solved', 2), ('resolved', 2),
-            ('good', 1), ('better', 1), ('working now', 2), ('that worked', 2),
-            ('happy', 2), ('pleased', 2), ('satisfied', 2), ('love', 2)
-        ]
+        conversation_summarizer.sync(conversation_history)
+        conversation_compactor.sync(conversation_history)
+        conversation_summary = f"{conversation_summarizer.render()}\n{conversation_compactor.context('RECENT TURNS')}"
 
-        urgent_patterns = [
-            ('urgent', 2), ('emergency', 3), ('critical', 2), ('asap', 2), ('immediately', 2),
-            ('right now', 2), ('can\'t wait', 2), ('need help now', 3), ('broken down', 2),
-            ('not working at all', 3), ('completely broken', 3), ('dead', 2), ('crashed', 2),
-            ('lost everything', 3), ('virus', 2), ('hacked', 3), ('breach', 3), ('compromised', 3)
-        ]
-
-        confused_patterns = [
-            ('don\'t understand', 2), ('confused', 2), ('unclear', 2), ('what does', 1),
-            ('how do i', 1), ('what is', 1), ('explain', 1), ('not sure', 1), ('help me understand', 2),
-            ('i don\'t know', 2), ('what\'s the difference', 1), ('which one', 1), ('where do i', 1),
-            ('step by step', 1), ('walk me through', 2), ('show me how', 2)
-        ]
-
-        worried_patterns = [
-            ('worried', 2), ('concerned', 2), ('afraid', 2), ('scared', 2), ('nervous', 2),
-            ('what if', 1), ('might happen', 1), ('could this', 1), ('is this normal', 1),
-            ('should i be', 1), ('is it safe', 2), ('will i lose', 2), ('am i protected', 2)
-        ]
-
-        impatient_patterns = [
-            ('how long', 1), ('still waiting', 2), ('been hours', 2), ('taking forever', 2),
-            ('when will', 1), ('how much longer', 2), ('this is slow', 2), ('hurry up', 3),
-            ('speed this up', 2), ('taking too long', 2), ('why so slow', 2)
-        ]
-
-        # Calculate weighted sentiment scores
-        sentiment_score = 0
-        emotion_scores = {
-            'frustrated': 0,
-            'satisfied': 0,
-            'urgent': 0,
-            'confused': 0,
-            'worried': 0,
-            'impatient': 0
-        }
-
-        # Check for patterns and calculate scores
-        for pattern, weight in frustrated_patterns:
-            if pattern in msg_lower:
-                emotion_scores['frustrated'] += weight
-                sentiment_score -= weight
-
-        for pattern, weight in satisfied_patterns:
-            if pattern in msg_lower:
-                emotion_scores['satisfied'] += weight
-                sentiment_score += weight
-
-        for pattern, weight in urgent_patterns:
-            if pattern in msg_lower:
-                emotion_scores['urgent'] += weight
-
-        for pattern, weight in confused_patterns:
-            if pattern in msg_lower:
-                emotion_scores['confused'] += weight
-
-        for pattern, weight in worried_patterns:
-            if pattern in msg_lower:
-                emotion_scores['worried'] += weight
-
-        for pattern, weight in impatient_patterns:
-            if pattern in msg_lower:
-                emotion_scores['impatient'] += weight
-                sentiment_score -= 1  # Impatience is slightly negative
-
-        # Determine primary emotion based on highest score
-        max_emotion = max(emotion_scores, key=emotion_scores.get)
-        max_score = emotion_scores[max_emotion]
-
-        if max_score >= 2:
-            emotion = max_emotion
-        elif sentiment_score >= 2:
-            emotion = "satisfied"
-        elif sentiment_score <= -2:
-            emotion = "frustrated"
-        else:
-            emotion = "neutral"
-
-        # Special case: if urgent score is high, prioritize urgency
-        if emotion_scores['urgent'] >= 2:
-            emotion = "urgent"
+        update_context_panel()
+        update_status("Context updated")
 
-        # Enhanced urgency detection
-        urgency_score = emotion_scores['urgent']
+    except Exception as e:
+        conversation_summary = f"Summary error: {str(e)}"
+        update_status("Context analysis failed")
 
-        # Additional urgency indicators
-        high_urgency_phrases = ['asap', 'emergency', 'critical', 'immediately', 'right now', 'urgent', 'can\'t wait', 'need help now']
-        medium_urgency_phrases = ['soon', 'quickly', 'when will', 'how long', 'need this fixed', 'time sensitive']
+def get_latest_customer_message(history):
+    """Return the content of the most recent customer message, or an empty string"""
+    for msg in reversed(history):
+        if msg["role"] == "customer":
+            return msg["content"]
+    return ""
+
+def score_customer_sentiment(message):
+    """Score emotion, urgency and satisfaction for a single customer message"""
+    # Enhanced sentiment analysis with contextual patterns
+    msg_lower = message.lower()
+
+    # Every sentiment and context phrase is found in one pass over the message
+    matches = SENTIMENT_MATCHER.find(msg_lower)
+    context = {category: 0 for category in SENTIMENT_CONTEXT_PHRASES}
+
+    # Calculate weighted sentiment scores
+    sentiment_score = 0
+    emotion_scores = {
+        'frustrated': 0,
+        'satisfied': 0,
+        'urgent': 0,
+        'confused': 0,
+        'worried': 0,
+        'impatient': 0
+    }
+    detected_patterns = []
+
+    for pattern, category, weight in matches:
+        if category in context:
+            context[category] += 1
+            continue
+
+        emotion_scores[category] += weight
+        detected_patterns.append(f"'{pattern}' (weight: {weight})")
+        if category == 'frustrated':
+            sentiment_score -= weight
+        elif category == 'satisfied':
+            sentiment_score += weight
+        elif category == 'impatient':
+            sentiment_score -= 1  # Impatience is slightly negative
+
+    # Determine primary emotion based on highest score
+    max_emotion = max(emotion_scores, key=emotion_scores.get)
+    max_score = emotion_scores[max_emotion]
+
+    if max_score >= 2:
+        emotion = max_emotion
+    elif sentiment_score >= 2:
+        emotion = "satisfied"
+    elif sentiment_score <= -2:
+        emotion = "frustrated"
+    else:
+        emotion = "neutral"
 
-        for phrase in high_urgency_phrases:
-            if phrase in msg_lower:
-                urgency_score += 2
+    # Special case: if urgent score is high, prioritize urgency
+    if emotion_scores['urgent'] >= 2:
+        emotion = "urgent"
 
-        for phrase in medium_urgency_phrases:
-            if phrase in msg_lower:
-                urgency_score += 1
+    # Enhanced urgency detection
+    urgency_score = emotion_scores['urgent']
 
-        # Check for business/work context that increases urgency
-        if any(word in msg_lower for word in ['work', 'business', 'office', 'meeting', 'deadline', 'presentation']):
-            urgency_score += 1
+    # Additional urgency indicators
+    urgency_score += 2 * context['high_urgency'] + context['medium_urgency']
 
-        # Determine final urgency level
-        if urgency_score >= 3 or emotion == "urgent":
-            urgency = "high"
-        elif urgency_score >= 1 or any(word in msg_lower for word in ['when', 'time', 'soon', 'quick']):
-            urgency = "medium"
-        else:
-            urgency = "low"
-
-        # Calculate satisfaction score with better logic
-        if emotion == "satisfied":
-            satisfaction = max(75, min(95, 85 + (sentiment_score * 5)))
-        elif emotion == "frustrated":
-            satisfaction = max(5, min(40, 25 + (sentiment_score * 10)))
-        elif emotion == "urgent":
-            satisfaction = max(30, min(60, 45 + (sentiment_score * 5)))
-        elif emotion == "worried":
-            satisfaction = max(20, min(50, 35 + (sentiment_score * 8)))
-        elif emotion == "confused":
-            satisfaction = max(40, min(70, 55 + (sentiment_score * 5)))
-        elif emotion == "impatient":
-            satisfaction = max(15, min(45, 30 + (sentiment_score * 8)))
-        else:
-            satisfaction = max(50, min(80, 65 + (sentiment_score * 10)))
-
-        # Enhanced tone recommendations based on detected emotion
-        if emotion == "frustrated":
-            tone_rec = "🚨 EMPATHETIC & SOLUTION-FOCUSED: Acknowledge frustration immediately, apologize for the inconvenience, focus on quick resolution"
-            empathy = "Say: 'I understand this is frustrating. Let me help resolve this right away.' Validate their experience and show urgency to help"
-            approach = "Immediate acknowledgment → Quick apology → Direct solution → Follow-up confirmation"
-        elif emotion == "urgent":
-            tone_rec = "⚡ DIRECT & EFFICIENT: Skip pleasantries, get straight to solutions, provide clear timelines"
-            empathy = "Say: 'I see this is urgent. Let me address this immediately.' Prioritize speed and efficiency over detailed explanations"
-            approach = "Immediate action → Clear steps → Timeline expectations → Escalation path if needed"
-        elif emotion == "confused":
-            tone_rec = "📚 PATIENT & EDUCATIONAL: Use simple language, break down steps, check understanding frequently"
-            empathy = "Say: 'Let me walk you through this step-by-step.' Use analogies and confirm understanding at each step"
-            approach = "Simple explanation → Step-by-step guidance → Comprehension checks → Alternative explanations if needed"
-        elif emotion == "worried":
-            tone_rec = "🛡️ REASSURING & INFORMATIVE: Provide reassurance about security, explain safety measures clearly"
-            empathy = "Say: 'I understand your concern. Let me explain what's happening and how we'll protect you.' Focus on safety and prevention"
-            approach = "Address concerns → Explain safety measures → Provide reassurance → Preventive guidance"
-        elif emotion == "satisfied":
-            tone_rec = "✅ PROFESSIONAL & THOROUGH: Maintain current positive momentum, ensure nothing is missed"
-            empathy = "Say: 'I'm glad that helped! Is there anything else I can assist you with?' Reinforce positive experience"
-            approach = "Acknowledge success → Complete any remaining items → Offer additional help → Positive closure"
-        elif emotion == "impatient":
-            tone_rec = "⏰ EFFICIENT & RESPONSIVE: Move quickly through solutions, provide specific timelines"
-            empathy = "Say: 'I'll get this resolved quickly for you.' Focus on speed and provide time estimates for each step"
-            approach = "Quick acknowledgment → Fast-track solution → Time estimates → Efficient execution"
-        else:
-            tone_rec = "🤝 STANDARD PROFESSIONAL: Be helpful, informative, and maintain friendly demeanor"
-            empathy = "Maintain standard professional courtesy while being thorough and helpful"
-            approach = "Professional greeting → Understand issue → Provide solution → Confirm satisfaction"
+    # Check for business/work context that increases urgency
+    if context['business_context']:
+        urgency_score += 1
 
-        # Generate detailed analysis
-        detected_patterns = []
-        for pattern, weight in frustrated_patterns + satisfied_patterns + urgent_patterns + confused_patterns + worried_patterns + impatient_patterns:
-            if pattern in msg_lower:
-                detected_patterns.append(f"'{pattern}' (weight: {weight})")
+    # Determine final urgency level
+    if urgency_score >= 3 or emotion == "urgent":
+        urgency = "high"
+    elif urgency_score >= 1 or context['time_hint']:
+        urgency = "medium"
+    else:
+        urgency = "low"
+
+    # Calculate satisfaction score with better logic
+    if emotion == "satisfied":
+        satisfaction = max(75, min(95, 85 + (sentiment_score * 5)))
+    elif emotion == "frustrated":
+        satisfaction = max(5, min(40, 25 + (sentiment_score * 10)))
+    elif emotion == "urgent":
+        satisfaction = max(30, min(60, 45 + (sentiment_score * 5)))
+    elif emotion == "worried":
+        satisfaction = max(20, min(50, 35 + (sentiment_score * 8)))
+    elif emotion == "confused":
+        satisfaction = max(40, min(70, 55 + (sentiment_score * 5)))
+    elif emotion == "impatient":
+        satisfaction = max(15, min(45, 30 + (sentiment_score * 8)))
+    else:
+        satisfaction = max(50, min(80, 65 + (sentiment_score * 10)))
+
+    # Enhanced tone recommendations based on detected emotion
+    if emotion == "frustrated":
+        tone_rec = "🚨 EMPATHETIC & SOLUTION-FOCUSED: Acknowledge frustration immediately, apologize for the inconvenience, focus on quick resolution"
+        empathy = "Say: 'I understand this is frustrating. Let me help resolve this right away.' Validate their experience and show urgency to help"
+        approach = "Immediate acknowledgment → Quick apology → Direct solution → Follow-up confirmation"
+    elif emotion == "urgent":
+        tone_rec = "⚡ DIRECT & EFFICIENT: Skip pleasantries, get straight to solutions, provide clear timelines"
+        empathy = "Say: 'I see this is urgent. Let me address this immediately.' Prioritize speed and efficiency over detailed explanations"
+        approach = "Immediate action → Clear steps → Timeline expectations → Escalation path if needed"
+    elif emotion == "confused":
+        tone_rec = "📚 PATIENT & EDUCATIONAL: Use simple language, break down steps, check understanding frequently"
+        empathy = "Say: 'Let me walk you through this step-by-step.' Use analogies and confirm understanding at each step"
+        approach = "Simple explanation → Step-by-step guidance → Comprehension checks → Alternative explanations if needed"
+    elif emotion == "worried":
+        tone_rec = "🛡️ REASSURING & INFORMATIVE: Provide reassurance about security, explain safety measures clearly"
+        empathy = "Say: 'I understand your concern. Let me explain what's happening and how we'll protect you.' Focus on safety and prevention"
+        approach = "Address concerns → Explain safety measures → Provide reassurance → Preventive guidance"
+    elif emotion == "satisfied":
+        tone_rec = "✅ PROFESSIONAL & THOROUGH: Maintain current positive momentum, ensure nothing is missed"
+        empathy = "Say: 'I'm glad that helped! Is there anything else I can assist you with?' Reinforce positive experience"
+        approach = "Acknowledge success → Complete any remaining items → Offer additional help → Positive closure"
+    elif emotion == "impatient":
+        tone_rec = "⏰ EFFICIENT & RESPONSIVE: Move quickly through solutions, provide specific timelines"
+        empathy = "Say: 'I'll get this resolved quickly for you.' Focus on speed and provide time estimates for each step"
+        approach = "Quick acknowledgment → Fast-track solution → Time estimates → Efficient execution"
+    else:
+        tone_rec = "🤝 STANDARD PROFESSIONAL: Be helpful, informative, and maintain friendly demeanor"
+        empathy = "Maintain standard professional courtesy while being thorough and helpful"
+        approach = "Professional greeting → Understand issue → Provide solution → Confirm satisfaction"
 
-        analysis = f"""🧠 ENHANCED SENTIMENT ANALYSIS:
+    # Generate detailed analysis
+    analysis = f"""🧠 ENHANCED SENTIMENT ANALYSIS:
 
 😊 EMOTION DETECTED: {emotion.upper()}
 ⚡ URGENCY LEVEL: {urgency.upper()}
@@ -2011,9 +2223,9 @@ def analyze_sentiment_and_tone():
 {approach}
 
 📋 CONVERSATION CONTEXT:
-• Message length: {'Detailed communication' if len(latest_customer_msg) > 100 else 'Concise message'}
-• Technical level: {'High-tech user' if any(word in msg_lower for word in ['log', 'error', 'code', 'configuration', 'registry', 'firewall']) else 'General user'}
-• Communication style: {'Formal' if any(word in msg_lower for word in ['please', 'kindly', 'would you']) else 'Casual'}
+• Message length: {'Detailed communication' if len(message) > 100 else 'Concise message'}
+• Technical level: {'High-tech user' if context['technical'] else 'General user'}
+• Communication style: {'Formal' if context['formal'] else 'Casual'}
 • Response priority: {urgency.upper()}
 
 🔍 DETECTED INDICATORS:
@@ -2022,49 +2234,85 @@ def analyze_sentiment_and_tone():
 💡 KEY RECOMMENDATION:
 {approach.split(' → ')[0]} - {empathy.split('.')[0]}"""
 
-        customer_sentiment.update({
-            "emotion": emotion,
-            "urgency": urgency,
-            "satisfaction": satisfaction,
-            "analysis": analysis
-        })
+    return {
+        "emotion": emotion,
+        "urgency": urgency,
+        "satisfaction": satisfaction,
+        "analysis": analysis
+    }
 
-        update_sentiment_panel()
-        update_status("Emotion analysis complete")
+def analyze_sentiment_and_tone():
+    """Challenge 2: Emotional Alignment - Analyze customer sentiment and suggest tone"""
+    global customer_sentiment
 
-    except Exception as e:
-        customer_sentiment["analysis"] = f"Sentiment analysis error: {str(e)}"
-        update_status("Emotion analysis failed")
-    finally:
-        is_processing = False
+    if not conversation_history:
+        return
 
-def calculate_resolution_confidence():
-    """Challenge 3: Premature Resolution Prevention - Score resolution confidence"""
-    global resolution_confidence, is_processing, resolution_analysis
+    latest_customer_msg = get_latest_customer_message(conversation_history)
 
-    if not conversation_history or is_processing:
+    if not latest_customer_msg:
         return
 
-    is_processing = True
-    update_status("Calculating resolution confidence...")
+    update_status("Analyzing customer emotion...")
 
     try:
-        conv_text = ""
-        for msg in conversation_history[-6:]:  # Last 6 messages
-            role = "CUSTOMER" if msg["role"] == "customer" else "ENGINEER"
-            conv_text += f"{role}: {msg['content']}\n"
+        customer_sentiment.update(score_customer_sentiment(latest_customer_msg))
 
-        response = anthropic_client.messages.create(
-            model=ANTHROPIC_MODEL,
-            max_tokens=300,
-            messages=[{
-                "role": "user",
-                "content": f"""Analyze this support conversation and determine if the issue is truly resolved. Prevent premature case closure.
+        update_sentiment_panel()
+        update_status("Emotion analysis complete")
 
-RECENT CONVERSATION:
-{conv_text}
+    except Exception as e:
+        customer_sentiment["analysis"] = f"Sentiment analysis error: {str(e)}"
+        update_status("Emotion analysis failed")
 
-CUSTOMER SENTIMENT: {customer_sentiment.get('emotion', 'unknown')}
+    return dict(customer_sentiment)
+
+def parse_confidence_score(analysis):
+    """Extract the CONFIDENCE_SCORE value from a confidence analysis, or None if absent"""
+    lines = analysis.split('\n')
+    for line in lines:
+        if 'CONFIDENCE_SCORE:' in line:
+            try:
+                return int(''.join(filter(str.isdigit, line)))
+            except:
+                return 50
+    return None
+
+class StreamingConfidenceParser:
+    """Parses a streamed confidence analysis, exposing CONFIDENCE_SCORE as soon as its digits are complete"""
+
+    SCORE_PATTERN = re.compile(r"CONFIDENCE_SCORE:[^\d\n]*(\d+)(?=\D)")
+
+    def __init__(self):
+        self.text = ""
+        self.score = None
+        self._line_start = 0  # Start of the last unfinished line; complete lines without a score are not scanned again
+
+    def feed(self, chunk):
+        """Append a chunk; returns True when this chunk completed the score"""
+        self.text += chunk
+        if self.score is None:
+            match = self.SCORE_PATTERN.search(self.text, self._line_start)
+            if match:
+                self.score = int(match.group(1))
+                return True
+            newline = self.text.rfind("\n", self._line_start)
+            if newline >= 0:
+                self._line_start = newline + 1
+        return False
+
+    def finish(self):
+        """Return the final score once the stream has ended (None if the reply had none)"""
+        if self.score is None:
+            self.score = parse_confidence_score(self.text)
+        return self.score
+
+def build_confidence_prompt(conversation_context, customer_emotion):
+    """Build the resolution confidence prompt for an LLM backend"""
+    return f"""Analyze this support conversation and determine if the issue is truly resolved. Prevent premature case closure.
+
+{conversation_context}
+CUSTOMER SENTIMENT: {customer_emotion or 'unknown'}
 
 Evaluate these factors:
 1. Has the root cause been identified and addressed?
@@ -2078,21 +2326,69 @@ CONFIDENCE_SCORE: [0-100] (100 = definitely resolved, 0 = not resolved)
 RESOLUTION_STATUS: [RESOLVED/PARTIALLY_RESOLVED/NOT_RESOLVED/NEEDS_FOLLOW_UP]
 RISK_FACTORS: [What could cause this to be a repeat contact]
 RECOMMENDATION: [Should case be closed or what needs to happen first]"""
-            }]
-        )
 
-        analysis = response.content[0].text
+def score_resolution_confidence(history, customer_emotion, model=None, backend=None, conversation_context=None, on_update=None):
+    """Score resolution confidence for a conversation; returns (score, analysis)
+
+    With an LLM backend the compacted conversation context (built from `history`
+    when not given) is sent as a prompt; if the call fails or the reply has no
+    score, the local model is used instead. When on_update is given the reply is
+    streamed and on_update(score_or_None, text_so_far) is called per chunk, with
+    the score filled in as soon as it has arrived.
+    """
+    if backend is not None:
+        if conversation_context is None:
+            conversation_context = build_conversation_context(history)
+        prompt = build_confidence_prompt(conversation_context, customer_emotion)
+        try:
+            if on_update is None:
+                analysis = backend.complete(prompt)
+                score = parse_confidence_score(analysis)
+            else:
+                parser = StreamingConfidenceParser()
+                for chunk in backend.stream(prompt):
+                    parser.feed(chunk)
+                    on_update(parser.score, parser.text)
+                analysis = parser.text
+                score = parser.finish()
+            if score is not None:
+                return score, analysis
+            print("LLM confidence reply had no CONFIDENCE_SCORE, using local model")
+        except Exception as e:
+            print(f"LLM confidence request failed, using local model: {str(e)}")
+
+    return (model or resolution_model).analyze(history, customer_emotion)
+
+def calculate_resolution_confidence(sentiment=None):
+    """Challenge 3: Premature Resolution Prevention - Score resolution confidence
+
+    Scores against `sentiment` (the sentiment stage's result) when given, else the
+    current customer sentiment. Returns the confidence score.
+    """
+    global resolution_confidence, resolution_analysis
 
-        # Extract confidence score
-        lines = analysis.split('\n')
-        for line in lines:
-            if 'CONFIDENCE_SCORE:' in line:
-                try:
-                    score = int(''.join(filter(str.isdigit, line)))
-                    resolution_confidence = score
-                    break
-                except:
-                    resolution_confidence = 50
+    if not conversation_history:
+        return
+
+    update_status("Calculating resolution confidence...")
+
+    try:
+        backend = get_llm_backend()
+        conversation_context = None
+        if backend is not None:
+            conversation_compactor.sync(conversation_history)
+            conversation_context = conversation_compactor.context()
+
+        def show_partial_analysis(score, text):
+            global resolution_confidence, resolution_analysis
+            if score is not None:
+                resolution_confidence = score
+            resolution_analysis = text
+            update_confidence_panel()
+
+        emotion = (sentiment or customer_sentiment).get('emotion')
+        resolution_confidence, analysis = score_resolution_confidence(conversation_history, emotion, backend=backend,
+                                                                      conversation_context=conversation_context, on_update=show_partial_analysis)
 
         resolution_analysis = analysis
         update_confidence_panel()
@@ -2102,17 +2398,13 @@ RECOMMENDATION: [Should case be closed or what needs to happen first]"""
         resolution_analysis = f"Confidence calculation error: {str(e)}"
         resolution_confidence = 50
         update_status("Confidence calculation failed")
-    finally:
-        is_processing = False
+
+    return resolution_confidence
 
 def get_solution_bullets(url, title):
     """Extract and format solution as simplified bullet points"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-
-        response = requests.get(url, headers=headers, timeout=10)
+        response = get_http_client().get(url)
         if response.status_code == 200:
             soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -2211,66 +2503,82 @@ def get_default_solution_bullets(title, query=""):
             "Contact Trend Micro support for specific assistance"
         ]
 
-def analyze_coaching_performance():
-    """Challenge 5: Performance Coaching - Analyze engineer performance and provide coaching"""
-    global coaching_feedback, performance_metrics, is_processing
+def score_coaching_performance(history, sentiment, confidence):
+    """Score the engineer's latest response and build coaching feedback, or None without engineer replies"""
+    # Get recent engineer responses for analysis
+    engineer_messages = [msg for msg in history if msg['role'] == 'engineer']
+    customer_messages = [msg for msg in history if msg['role'] == 'customer']
 
-    if not conversation_history or is_processing:
-        return
+    if not engineer_messages:
+        return None
 
-    is_processing = True
-    update_status("Analyzing performance metrics...")
+    latest_engineer_msg = engineer_messages[-1]['content'] if engineer_messages else ""
+    latest_customer_msg = customer_messages[-1]['content'] if customer_messages else ""
 
-    try:
-        # Get recent engineer responses for analysis
-        engineer_messages = [msg for msg in conversation_history if msg['role'] == 'engineer']
-        customer_messages = [msg for msg in conversation_history if msg['role'] == 'customer']
+    # Analyze response time (simulated based on conversation flow)
+    response_time_score = "excellent"
+    if len(history) > 8:
+        response_time_score = "needs_improvement"
+    elif len(history) > 5:
+        response_time_score = "good"
 
-        if not engineer_messages:
-            return
+    # Analyze empathy level based on engineer responses
+    empathy_score = analyze_empathy_level(latest_engineer_msg, sentiment.get('emotion', 'neutral'))
+
+    # Analyze technical accuracy based on content
+    technical_score = analyze_technical_accuracy(latest_engineer_msg)
 
-        latest_engineer_msg = engineer_messages[-1]['content'] if engineer_messages else ""
-        latest_customer_msg = customer_messages[-1]['content'] if customer_messages else ""
+    # Analyze communication clarity
+    clarity_score = analyze_communication_clarity(latest_engineer_msg)
 
-        # Analyze response time (simulated based on conversation flow)
-        response_time_score = "excellent"
-        if len(conversation_history) > 8:
-            response_time_score = "needs_improvement"
-        elif len(conversation_history) > 5:
-            response_time_score = "good"
+    # Analyze session progress
+    progress_score = analyze_session_progress(history, confidence)
 
-        # Analyze empathy level based on engineer responses
-        empathy_score = analyze_empathy_level(latest_engineer_msg, customer_sentiment.get('emotion', 'neutral'))
+    metrics = {
+        "response_time": response_time_score,
+        "empathy_level": empathy_score,
+        "technical_accuracy": technical_score,
+        "communication_clarity": clarity_score,
+        "session_progress": progress_score
+    }
+
+    return metrics, generate_coaching_feedback(metrics, sentiment, confidence)
+
+def analyze_coaching_performance(sentiment=None, confidence=None):
+    """Challenge 5: Performance Coaching - Analyze engineer performance and provide coaching
 
-        # Analyze technical accuracy based on content
-        technical_score = analyze_technical_accuracy(latest_engineer_msg)
+    Uses the sentiment and confidence stages' results when given, else the current values.
+    Returns (metrics, feedback), or None when there is nothing to coach or the analysis failed.
+    """
+    global coaching_feedback, performance_metrics
 
-        # Analyze communication clarity
-        clarity_score = analyze_communication_clarity(latest_engineer_msg)
+    if not conversation_history:
+        return None
 
-        # Analyze session progress
-        progress_score = analyze_session_progress()
+    update_status("Analyzing performance metrics...")
+
+    try:
+        result = score_coaching_performance(conversation_history, sentiment or customer_sentiment,
+                                            resolution_confidence if confidence is None else confidence)
+
+        if not result:
+            return None
 
         # Update performance metrics
-        performance_metrics.update({
-            "response_time": response_time_score,
-            "empathy_level": empathy_score,
-            "technical_accuracy": technical_score,
-            "communication_clarity": clarity_score,
-            "session_progress": progress_score
-        })
+        metrics, feedback = result
+        performance_metrics.update(metrics)
 
         # Generate coaching feedback
-        coaching_feedback = generate_coaching_feedback()
+        coaching_feedback = feedback
 
         update_coaching_panel()
         update_status("Performance analysis complete")
+        return result
 
     except Exception as e:
         coaching_feedback = f"Performance analysis error: {str(e)}"
         update_status("Performance analysis failed")
-    finally:
-        is_processing = False
+        return None
 
 def analyze_empathy_level(engineer_msg, customer_emotion):
     """Analyze empathy level in engineer's response"""
@@ -2360,16 +2668,19 @@ def analyze_communication_clarity(engineer_msg):
     else:
         return "poor"
 
-def analyze_session_progress():
+def analyze_session_progress(history=None, confidence=None):
     """Analyze overall session progress"""
-    total_messages = len(conversation_history)
-    engineer_messages = [msg for msg in conversation_history if msg['role'] == 'engineer']
-    customer_messages = [msg for msg in conversation_history if msg['role'] == 'customer']
+    if history is None:
+        history = conversation_history
+    if confidence is None:
+        confidence = resolution_confidence
+
+    total_messages = len(history)
 
     # Simple progress analysis
-    if resolution_confidence >= 80:
+    if confidence >= 80:
         return "excellent"
-    elif resolution_confidence >= 60:
+    elif confidence >= 60:
         return "good"
     elif total_messages <= 4:
         return "on_track"
@@ -2378,9 +2689,14 @@ def analyze_session_progress():
     else:
         return "poor"
 
-def generate_coaching_feedback():
+def generate_coaching_feedback(metrics=None, sentiment=None, confidence=None):
     """Generate comprehensive coaching feedback"""
-    metrics = performance_metrics
+    if metrics is None:
+        metrics = performance_metrics
+    if sentiment is None:
+        sentiment = customer_sentiment
+    if confidence is None:
+        confidence = resolution_confidence
 
     feedback = "🎯 PERFORMANCE COACHING ANALYSIS\n\n"
 
@@ -2427,7 +2743,7 @@ def generate_coaching_feedback():
     feedback += "💡 COACHING RECOMMENDATIONS:\n\n"
 
     if metrics["empathy_level"] in ["needs_improvement", "poor"]:
-        customer_emotion = customer_sentiment.get('emotion', 'neutral')
+        customer_emotion = sentiment.get('emotion', 'neutral')
         if customer_emotion == 'frustrated':
             feedback += "🔸 EMPATHY: Customer is frustrated. Use phrases like 'I understand this is frustrating' and 'Let me help resolve this quickly'\n"
         elif customer_emotion == 'urgent':
@@ -2470,15 +2786,15 @@ def generate_coaching_feedback():
     # Next Steps
     feedback += "\n🎯 IMMEDIATE ACTION ITEMS:\n\n"
 
-    if customer_sentiment.get('emotion') == 'frustrated':
+    if sentiment.get('emotion') == 'frustrated':
         feedback += "1. Acknowledge frustration and apologize for inconvenience\n"
         feedback += "2. Provide immediate next step to show progress\n"
         feedback += "3. Ask if customer needs anything else urgent\n"
-    elif customer_sentiment.get('urgency') == 'high':
+    elif sentiment.get('urgency') == 'high':
         feedback += "1. Prioritize speed over detailed explanations\n"
         feedback += "2. Provide timeline for resolution\n"
         feedback += "3. Offer escalation if needed\n"
-    elif resolution_confidence < 60:
+    elif confidence < 60:
         feedback += "1. Gather more information about the specific issue\n"
         feedback += "2. Provide step-by-step troubleshooting\n"
         feedback += "3. Confirm customer can follow instructions\n"
@@ -2489,11 +2805,11 @@ def generate_coaching_feedback():
 
     return feedback
 
+@on_ui_thread()
 def update_coaching_panel():
     """Update coaching analysis panel"""
     if coaching_panel:
-        coaching_panel.config(state=tk.NORMAL)
-        coaching_panel.delete(1.0, tk.END)
+        segments = []
 
         if coaching_feedback and conversation_history:
             # Show both real-time metrics and coaching analysis
@@ -2503,113 +2819,127 @@ def update_coaching_panel():
             real_time_lines = real_time_feedback.split('\n')
             for line in real_time_lines:
                 if '✅' in line:
-                    coaching_panel.insert(tk.END, line + '\n', "excellent")
+                    segments.append((line + '\n', "excellent"))
                 elif '⚠️' in line:
-                    coaching_panel.insert(tk.END, line + '\n', "needs_improvement")
+                    segments.append((line + '\n', "needs_improvement"))
                 elif '🚨' in line:
-                    coaching_panel.insert(tk.END, line + '\n', "poor")
+                    segments.append((line + '\n', "poor"))
                 elif '📈' in line or '😊' in line:
-                    coaching_panel.insert(tk.END, line + '\n', "good")
+                    segments.append((line + '\n', "good"))
                 elif '📉' in line or '😞' in line:
-                    coaching_panel.insert(tk.END, line + '\n', "poor")
+                    segments.append((line + '\n', "poor"))
                 elif line.startswith('•'):
-                    coaching_panel.insert(tk.END, line + '\n', "metric")
+                    segments.append((line + '\n', "metric"))
                 else:
-                    coaching_panel.insert(tk.END, line + '\n', "header")
+                    segments.append((line + '\n', "header"))
 
-            coaching_panel.insert(tk.END, "\n" + "="*60 + "\n\n", "header")
+            segments.append(("\n" + "="*60 + "\n\n", "header"))
 
             # Then show coaching analysis
             lines = coaching_feedback.split('\n')
             for line in lines:
                 if line.startswith('🌟 OUTSTANDING'):
-                    coaching_panel.insert(tk.END, line + '\n', "excellent")
+                    segments.append((line + '\n', "excellent"))
                 elif line.startswith('✅ STRONG'):
-                    coaching_panel.insert(tk.END, line + '\n', "good")
+                    segments.append((line + '\n', "good"))
                 elif line.startswith('⚠️ ROOM'):
-                    coaching_panel.insert(tk.END, line + '\n', "needs_improvement")
+                    segments.append((line + '\n', "needs_improvement"))
                 elif line.startswith('🚨 REQUIRES'):
-                    coaching_panel.insert(tk.END, line + '\n', "poor")
+                    segments.append((line + '\n', "poor"))
                 elif line.startswith('🔸'):
-                    coaching_panel.insert(tk.END, line + '\n', "coaching_tip")
+                    segments.append((line + '\n', "coaching_tip"))
                 elif 'EXCELLENT' in line or 'excellent' in line:
-                    coaching_panel.insert(tk.END, line + '\n', "excellent")
+                    segments.append((line + '\n', "excellent"))
                 elif 'GOOD' in line or 'good' in line:
-                    coaching_panel.insert(tk.END, line + '\n', "good")
+                    segments.append((line + '\n', "good"))
                 elif 'NEEDS_IMPROVEMENT' in line or 'needs_improvement' in line:
-                    coaching_panel.insert(tk.END, line + '\n', "needs_improvement")
+                    segments.append((line + '\n', "needs_improvement"))
                 elif 'POOR' in line or 'poor' in line:
-                    coaching_panel.insert(tk.END, line + '\n', "poor")
+                    segments.append((line + '\n', "poor"))
                 else:
-                    coaching_panel.insert(tk.END, line + '\n', "metric")
+                    segments.append((line + '\n', "metric"))
         else:
             # Display coaching guide
-            coaching_panel.insert(tk.END, "🎯 PERFORMANCE COACHING ASSISTANT\n\n", "header")
-            coaching_panel.insert(tk.END, "💡 WHAT THIS DOES:\n")
-            coaching_panel.insert(tk.END, "• Analyzes your support conversation performance in real-time\n")
-            coaching_panel.insert(tk.END, "• Provides specific coaching recommendations for improvement\n")
-            coaching_panel.insert(tk.END, "• Tracks key performance metrics across all interactions\n")
-            coaching_panel.insert(tk.END, "• Offers immediate action items for current conversation\n\n")
-
-            coaching_panel.insert(tk.END, "📊 REAL-TIME METRICS TRACKED:\n", "header")
-            coaching_panel.insert(tk.END, "• ⏱️ Response Rate: Messages per minute and efficiency\n", "excellent")
-            coaching_panel.insert(tk.END, "• 💬 Message Quality: Length optimization and clarity\n", "good")
-            coaching_panel.insert(tk.END, "• 📈 Satisfaction Trends: Customer satisfaction over time\n", "good")
-            coaching_panel.insert(tk.END, "• 🚨 Performance Alerts: Real-time warnings and recommendations\n", "needs_improvement")
-            coaching_panel.insert(tk.END, "• 🎯 Goal Tracking: Performance objectives and progress\n", "good")
-
-            coaching_panel.insert(tk.END, "\n📊 PERFORMANCE ANALYSIS:\n", "header")
-            coaching_panel.insert(tk.END, "• 💝 Empathy Level: Emotional alignment with customer needs\n", "good")
-            coaching_panel.insert(tk.END, "• 🔧 Technical Accuracy: Use of correct Trend Micro terminology\n", "good")
-            coaching_panel.insert(tk.END, "• 💬 Communication Clarity: Clear, structured communication\n", "good")
-            coaching_panel.insert(tk.END, "• 📈 Session Progress: Overall conversation effectiveness\n", "good")
-
-            coaching_panel.insert(tk.END, "\n🏆 COACHING FEATURES:\n", "header")
-            coaching_panel.insert(tk.END, "• Real-time performance dashboard with live metrics\n")
-            coaching_panel.insert(tk.END, "• Performance scoring with color-coded feedback\n")
-            coaching_panel.insert(tk.END, "• Immediate alerts for potential issues\n")
-            coaching_panel.insert(tk.END, "• Specific improvement suggestions based on customer emotion\n")
-            coaching_panel.insert(tk.END, "• Best practices reinforcement for strong performance areas\n")
-            coaching_panel.insert(tk.END, "• Goal-oriented recommendations for skill development\n\n")
-
-            coaching_panel.insert(tk.END, "🧠 Start a customer conversation to receive real-time performance coaching, live metrics, and improvement recommendations.", "coaching_tip")
-
-        coaching_panel.config(state=tk.DISABLED)
-
-def update_session_metrics(engineer_message):
-    """Update real-time session metrics"""
-    global session_metrics
-    import datetime
+            segments.append(("🎯 PERFORMANCE COACHING ASSISTANT\n\n", "header"))
+            segments.append(("💡 WHAT THIS DOES:\n", None))
+            segments.append(("• Analyzes your support conversation performance in real-time\n", None))
+            segments.append(("• Provides specific coaching recommendations for improvement\n", None))
+            segments.append(("• Tracks key performance metrics across all interactions\n", None))
+            segments.append(("• Offers immediate action items for current conversation\n\n", None))
+
+            segments.append(("📊 REAL-TIME METRICS TRACKED:\n", "header"))
+            segments.append(("• ⏱️ Response Rate: Messages per minute and efficiency\n", "excellent"))
+            segments.append(("• 💬 Message Quality: Length optimization and clarity\n", "good"))
+            segments.append(("• 📈 Satisfaction Trends: Customer satisfaction over time\n", "good"))
+            segments.append(("• 🚨 Performance Alerts: Real-time warnings and recommendations\n", "needs_improvement"))
+            segments.append(("• 🎯 Goal Tracking: Performance objectives and progress\n", "good"))
+
+            segments.append(("\n📊 PERFORMANCE ANALYSIS:\n", "header"))
+            segments.append(("• 💝 Empathy Level: Emotional alignment with customer needs\n", "good"))
+            segments.append(("• 🔧 Technical Accuracy: Use of correct Trend Micro terminology\n", "good"))
+            segments.append(("• 💬 Communication Clarity: Clear, structured communication\n", "good"))
+            segments.append(("• 📈 Session Progress: Overall conversation effectiveness\n", "good"))
+
+            segments.append(("\n🏆 COACHING FEATURES:\n", "header"))
+            segments.append(("• Real-time performance dashboard with live metrics\n", None))
+            segments.append(("• Performance scoring with color-coded feedback\n", None))
+            segments.append(("• Immediate alerts for potential issues\n", None))
+            segments.append(("• Specific improvement suggestions based on customer emotion\n", None))
+            segments.append(("• Best practices reinforcement for strong performance areas\n", None))
+            segments.append(("• Goal-oriented recommendations for skill development\n\n", None))
+
+            segments.append(("🧠 Start a customer conversation to receive real-time performance coaching, live metrics, and improvement recommendations.", "coaching_tip"))
+
+        render_panel(coaching_panel, segments)
+
+def new_session_metrics():
+    """Return a fresh real-time session metrics record"""
+    return {
+        "messages_sent": 0,
+        "avg_response_length": 0,
+        "empathy_score_total": 0,
+        "technical_accuracy_total": 0,
+        "clarity_score_total": 0,
+        "session_start_time": None,
+        "last_response_time": None,
+        "escalation_warnings": 0,
+        "customer_satisfaction_trend": []
+    }
 
+def record_session_metrics(metrics, engineer_message, satisfaction):
+    """Record an engineer message in a session metrics record"""
     current_time = datetime.datetime.now()
 
     # Initialize session if first message
-    if session_metrics["session_start_time"] is None:
-        session_metrics["session_start_time"] = current_time
+    if metrics["session_start_time"] is None:
+        metrics["session_start_time"] = current_time
 
     # Update message count
-    session_metrics["messages_sent"] += 1
+    metrics["messages_sent"] += 1
 
     # Update average response length
-    current_avg = session_metrics["avg_response_length"]
-    message_count = session_metrics["messages_sent"]
-    session_metrics["avg_response_length"] = ((current_avg * (message_count - 1)) + len(engineer_message)) / message_count
+    current_avg = metrics["avg_response_length"]
+    message_count = metrics["messages_sent"]
+    metrics["avg_response_length"] = ((current_avg * (message_count - 1)) + len(engineer_message)) / message_count
 
     # Calculate response time (simulated)
-    if session_metrics["last_response_time"]:
-        response_time_seconds = (current_time - session_metrics["last_response_time"]).total_seconds()
+    if metrics["last_response_time"]:
+        response_time_seconds = (current_time - metrics["last_response_time"]).total_seconds()
         if response_time_seconds > 300:  # 5 minutes
-            session_metrics["escalation_warnings"] += 1
+            metrics["escalation_warnings"] += 1
 
-    session_metrics["last_response_time"] = current_time
+    metrics["last_response_time"] = current_time
 
     # Track customer satisfaction trend
-    satisfaction = customer_sentiment.get('satisfaction', 70)
-    session_metrics["customer_satisfaction_trend"].append(satisfaction)
+    metrics["customer_satisfaction_trend"].append(satisfaction)
 
     # Keep only last 10 satisfaction scores
-    if len(session_metrics["customer_satisfaction_trend"]) > 10:
-        session_metrics["customer_satisfaction_trend"].pop(0)
+    if len(metrics["customer_satisfaction_trend"]) > 10:
+        metrics["customer_satisfaction_trend"].pop(0)
+
+def update_session_metrics(engineer_message):
+    """Update real-time session metrics"""
+    record_session_metrics(session_metrics, engineer_message, customer_sentiment.get('satisfaction', 70))
 
 def get_real_time_performance_feedback():
     """Generate real-time performance feedback"""
@@ -2728,362 +3058,344 @@ def get_real_time_performance_feedback():
 def reset_session_metrics():
     """Reset session metrics for new conversation"""
     global session_metrics
-    session_metrics = {
-        "messages_sent": 0,
-        "avg_response_length": 0,
-        "empathy_score_total": 0,
-        "technical_accuracy_total": 0,
-        "clarity_score_total": 0,
-        "session_start_time": None,
-        "last_response_time": None,
-        "escalation_warnings": 0,
-        "customer_satisfaction_trend": []
-    }
+    session_metrics = new_session_metrics()
+
+_article_fetch_executor = None
+_article_fetch_executor_lock = threading.Lock()
+
+def get_article_fetch_executor():
+    """Return the bounded thread pool used to fetch Help Center article pages"""
+    global _article_fetch_executor
+
+    with _article_fetch_executor_lock:
+        if _article_fetch_executor is None:
+            _article_fetch_executor = ThreadPoolExecutor(max_workers=ARTICLE_FETCH_WORKERS, thread_name_prefix="sentriguide-article")
+        return _article_fetch_executor
+
+def fetch_solution_bullets_concurrently(articles, deadline=None):
+    """Fetch solution bullets for Help Center articles in parallel
+
+    Only the top ARTICLE_FETCH_LIMIT articles are fetched. Returns
+    (bullets_by_index, late_futures_by_index): bullets for the pages that arrived
+    within `deadline` seconds, and the unfinished fetches for the rest.
+    """
+    if HELP_CENTER_OFFLINE:
+        return {}, {}
+    if deadline is None:
+        deadline = ARTICLE_FETCH_DEADLINE
+    executor = get_article_fetch_executor()
+    futures = {}
+    for index, article in enumerate(articles[:ARTICLE_FETCH_LIMIT]):
+        if article['link'] and article['link'].startswith(HELP_CENTER_BASE_URL):
+            futures[executor.submit(get_solution_bullets, article['link'], article['title'])] = index
+
+    if not futures:
+        return {}, {}
+
+    done, not_done = wait(futures, timeout=deadline)
+    bullets_by_index = {futures[future]: future.result() for future in done}
+    late_futures = {futures[future]: future for future in not_done}
+    return bullets_by_index, late_futures
+
+def format_general_solutions(message, articles, query, bullets_by_index, pending=()):
+    """Format general Help Center articles; articles in `pending` show a loading placeholder"""
+    knowledge_data = f"💡 TREND MICRO SOLUTIONS\nIssue: {message[:80]}...\n\n"
+
+    # Process general articles normally
+    for i, article in enumerate(articles, 1):
+        knowledge_data += f"📋 {i}. {article['title']}\n"
+
+        if i - 1 in pending:
+            knowledge_data += "   ⏳ Loading solution steps from the Help Center...\n"
+        else:
+            # Get solution bullets from the article
+            bullets = bullets_by_index.get(i - 1, [])
+
+            # If no bullets from web scraping, use default solutions
+            if not bullets:
+                bullets = get_default_solution_bullets(article['title'], query)
+
+            # If still no bullets, use snippet
+            if bullets:
+                for bullet in bullets:
+                    knowledge_data += f"   • {bullet}\n"
+            else:
+                knowledge_data += f"   • {article['snippet']}\n"
+
+        # Add quick action based on issue type
+        if any(word in message.lower() for word in ['virus', 'malware', 'infected']):
+            knowledge_data += f"   ⚡ Quick: Run full scan, check quarantine\n"
+        elif any(word in message.lower() for word in ['slow', 'performance']):
+            knowledge_data += f"   ⚡ Quick: Check resources, optimize settings\n"
+        elif any(word in message.lower() for word in ['email', 'spam']):
+            knowledge_data += f"   ⚡ Quick: Configure email security\n"
+
+        knowledge_data += f"   🔗 {article['link']}\n\n"
+
+    if not articles:
+        knowledge_data += "📚 GENERAL TREND MICRO SOLUTIONS:\n\n"
+        knowledge_data += "🛡️ SECURITY BEST PRACTICES:\n"
+        knowledge_data += "• Keep Trend Micro products updated to latest version\n"
+        knowledge_data += "• Run full system scans weekly\n"
+        knowledge_data += "• Enable real-time protection and web reputation\n"
+        knowledge_data += "• Configure firewall settings appropriately\n"
+        knowledge_data += "• Review quarantine regularly for false positives\n\n"
+
+        knowledge_data += "🔧 COMMON TROUBLESHOOTING STEPS:\n"
+        knowledge_data += "• Restart Trend Micro services if performance issues occur\n"
+        knowledge_data += "• Check for conflicting security software\n"
+        knowledge_data += "• Verify system requirements are met\n"
+        knowledge_data += "• Update Windows and system drivers\n"
+        knowledge_data += "• Contact support if issues persist\n\n"
+
+    return knowledge_data
+
+def cancel_article_fetches(futures):
+    """Cancel article fetches that have not started yet so they stop holding the fetch pool"""
+    for future in futures:
+        future.cancel()
+
+def build_general_solutions(message, articles, query, on_update=None, is_current=None):
+    """Format general solutions without letting slow article pages hold back the whole panel
+
+    Article pages are fetched concurrently. Pages that miss the deadline fall back
+    to default bullets, or, when on_update is given, show a placeholder and are
+    filled in progressively: on_update receives every version of the text in order,
+    starting with the one this function returns. Once is_current() returns False
+    (a newer message replaced this one) late bullets are dropped and fetches that
+    have not started are cancelled.
+    """
+    bullets_by_index, late_futures = fetch_solution_bullets_concurrently(articles)
+
+    if not late_futures or on_update is None:
+        cancel_article_fetches(late_futures.values())
+        knowledge_data = format_general_solutions(message, articles, query, bullets_by_index)
+        if on_update is not None:
+            on_update(knowledge_data)
+        return knowledge_data
+
+    pending = set(late_futures)
+    # Re-entrant because a fetch that finishes during registration runs its callback right here
+    lock = threading.RLock()
+
+    def fill_late_bullets(index, future):
+        with lock:
+            if not pending:
+                return
+            if is_current is not None and not is_current():
+                stale_futures = [late_futures[index] for index in pending]
+                pending.clear()  # Cleared first: cancelling runs these callbacks again right away
+                cancel_article_fetches(stale_futures)
+                return
+            bullets_by_index[index] = [] if future.cancelled() else future.result()
+            pending.discard(index)
+            on_update(format_general_solutions(message, articles, query, bullets_by_index, pending))
+
+    with lock:
+        knowledge_data = format_general_solutions(message, articles, query, bullets_by_index, pending)
+        on_update(knowledge_data)
+        for index, future in late_futures.items():
+            future.add_done_callback(lambda future, index=index: fill_late_bullets(index, future))
+
+    return knowledge_data
+
+# Terms that place a customer message in each knowledge category, in reporting order
+KNOWLEDGE_CATEGORY_TERMS = {
+    'renewal': ("renew", "renewal", "subscription", "activate", "activation", "license", "expire", "expiration", "payment", "billing"),
+    'installation': ("install", "installation", "download", "setup", "maximum security", "antivirus plus", "internet security"),
+    'id_protection': ("id protection", "password manager", "password", "import password", "identity", "personal data", "privacy", "data breach"),
+    'web_protection': ("vpn", "web protection", "safe browsing", "website", "phishing", "block site", "parental control"),
+    'billing': ("cashback", "refund", "billing", "payment", "charge", "cancel subscription", "money back", "claim cashback", "return", "invoice"),
+    'technical_error': ("error", "not working", "won't start", "crashes", "freezes", "installation failed", "can't install", "setup error", "connection error", "website error", "app error", "loading error", "login error", "sync error", "update failed", "scan failed", "won't open", "blank screen", "stuck", "hangs"),
+    'account_website': ("account portal", "can't login", "forgot password", "account locked", "website down", "portal not working", "account access", "login failed", "password reset", "account issues", "portal error", "dashboard not loading", "account.trendmicro.com", "my account", "sign in problem", "authentication failed", "session expired", "account suspended", "profile issues"),
+    'resolution_guard': ("case closed", "ticket resolved", "issue resolved", "problem solved", "case complete", "close ticket", "resolution confirmed", "mark resolved", "case closure", "support complete", "issue fixed", "problem fixed", "ready to close", "case status", "resolution quality", "customer satisfied", "follow up needed", "escalate case", "reopen case"),
+    'general': tuple(SEARCH_KEYWORDS)
+}
+
+KNOWLEDGE_TERM_MATCHER = compile_phrase_matcher(KNOWLEDGE_CATEGORY_TERMS)
+
+# Knowledge routes in priority order: (category, panel header, layout).
+# "guides" lists the top local guides in full; "primary_guide" shows the best guide in full plus short related articles.
+# Messages matching no route get general Help Center solutions.
+KNOWLEDGE_ROUTES = (
+    ('resolution_guard', "💡 RESOLUTION GUARD - CASE CLOSURE ANALYSIS", 'guides'),
+    ('account_website', "💡 TREND MICRO ACCOUNT PORTAL SOLUTIONS", 'guides'),
+    ('technical_error', "💡 TREND MICRO TECHNICAL TROUBLESHOOTING", 'guides'),
+    ('renewal', "💡 TREND MICRO RENEWAL SOLUTIONS", 'primary_guide'),
+    ('installation', "💡 TREND MICRO INSTALLATION SOLUTIONS", 'primary_guide'),
+    ('id_protection', "💡 TREND MICRO ID PROTECTION SOLUTIONS", 'guides'),
+    ('web_protection', "💡 TREND MICRO WEB PROTECTION SOLUTIONS", 'guides'),
+    ('billing', "💡 TREND MICRO BILLING & REFUND SOLUTIONS", 'guides')
+)
+
+def classify_knowledge_terms(message):
+    """Return {category: matched terms in term order} for every knowledge category, from one pass over the message"""
+    hits = {category: [] for category in KNOWLEDGE_CATEGORY_TERMS}
+    for term, category, _ in KNOWLEDGE_TERM_MATCHER.find(message.lower()):
+        hits[category].append(term)
+    return hits
+
+def route_knowledge_query(message):
+    """Pick the highest-priority knowledge route for a message
+
+    Returns (route, found_terms, query); route is None for general Help Center searches.
+    """
+    hits = classify_knowledge_terms(message)
+    for route in KNOWLEDGE_ROUTES:
+        found = hits[route[0]]
+        if found:
+            return route, found, " ".join(set(found[:2]))
+
+    query_words = hits['general']
+    return None, query_words, " ".join(set(query_words[:3])) if query_words else "security"
+
+def format_category_guides(message, header, guides):
+    """Format up to three local guides in full under a category header"""
+    knowledge_data = f"{header}\nIssue: {message[:80]}...\n\n"
+
+    for i, article in enumerate(guides[:3], 1):
+        knowledge_data += f"📋 {i}. {article['title']}\n"
+        knowledge_data += f"{article['snippet']}\n\n"
+
+    return knowledge_data
+
+def format_primary_guide(message, header, articles):
+    """Format the best matching guide in full, followed by up to two related articles"""
+    knowledge_data = f"{header}\nIssue: {message[:80]}...\n\n"
+    if not articles:
+        return knowledge_data
+
+    primary_guide = articles[0]
+    knowledge_data += f"📋 1. {primary_guide['title']}\n"
+    knowledge_data += f"{primary_guide['snippet']}\n\n"
+
+    # Add a few additional relevant articles for context
+    additional_count = 2
+    for article in articles[1:]:
+        if article['title'] != primary_guide['title']:
+            knowledge_data += f"📋 {additional_count}. {article['title']}\n"
+            knowledge_data += f"   • {article['snippet'][:100]}...\n"
+            knowledge_data += f"   🔗 {article['link']}\n\n"
+            additional_count += 1
+            if additional_count > 3:  # Limit to 3 total articles
+                break
+
+    return knowledge_data
+
+def build_knowledge_suggestions(message, on_update=None, is_current=None):
+    """Search the Help Center for a customer message and format the knowledge suggestions
+
+    When on_update is given it is called with each version of the suggestions,
+    including late article bullets that arrive after this function returns, for
+    as long as is_current() (if given) returns True.
+    """
+    route, found, query = route_knowledge_query(message)
+
+    if route is None:
+        # Search Trend Micro Help Center
+        articles = fetch_trend_micro_articles(query)
+        return build_general_solutions(message, articles, query, on_update, is_current)
+
+    category, header, layout = route
+    guides = get_knowledge_index().search(found, context=FALLBACK_CATEGORY_TERMS[category]) or get_fallback_corpus().by_category[category]
+    if layout == 'primary_guide':
+        knowledge_data = format_primary_guide(message, header, guides)
+    else:
+        knowledge_data = format_category_guides(message, header, guides)
+
+    if on_update is not None:
+        on_update(knowledge_data)
+
+    return knowledge_data
+
+def format_knowledge_error(error):
+    """Format the knowledge panel text shown when the Help Center search fails"""
+    return f"❌ Error accessing Trend Micro Help Center: {str(error)}\n\n🆘 MANUAL SUPPORT OPTIONS:\n• Visit https://helpcenter.trendmicro.com/en-us/\n• Contact Trend Micro technical support\n• Check product documentation\n• Search community forums for solutions"
 
 def surface_dynamic_knowledge():
     """Challenge 4: Knowledge Efficiency - Surface Trend Micro Help Center knowledge automatically"""
-    global knowledge_suggestions, is_processing
+    global knowledge_suggestions, knowledge_generation
 
-    if not conversation_history or is_processing:
+    if not conversation_history:
         return
 
-    is_processing = True
     update_status("Searching Trend Micro Help Center...")
 
     try:
         # Get latest customer message
-        latest_customer_msg = ""
-        for msg in reversed(conversation_history):
-            if msg["role"] == "customer":
-                latest_customer_msg = msg["content"]
-                break
+        latest_customer_msg = get_latest_customer_message(conversation_history)
 
         if not latest_customer_msg:
             return
 
-        # Extract search query from customer message with priority for renewal terms
-        query_words = []
-        msg_lower = latest_customer_msg.lower()
-
-        # Check for renewal-related terms first (high priority)
-        renewal_terms = ["renew", "renewal", "subscription", "activate", "activation", "license", "expire", "expiration", "payment", "billing"]
-        renewal_found = []
-        for term in renewal_terms:
-            if term in msg_lower:
-                renewal_found.append(term)
-
-        # Check for installation-related terms (high priority)
-        installation_terms = ["install", "installation", "download", "setup", "maximum security", "antivirus plus", "internet security"]
-        installation_found = []
-        for term in installation_terms:
-            if term in msg_lower:
-                installation_found.append(term)
-
-        # Check for ID Protection and Password Manager terms (high priority)
-        id_protection_terms = ["id protection", "password manager", "password", "import password", "identity", "personal data", "privacy", "data breach"]
-        id_protection_found = []
-        for term in id_protection_terms:
-            if term in msg_lower:
-                id_protection_found.append(term)
-
-        # Check for VPN and Web Protection terms (high priority)
-        web_protection_terms = ["vpn", "web protection", "safe browsing", "website", "phishing", "block site", "parental control"]
-        web_protection_found = []
-        for term in web_protection_terms:
-            if term in msg_lower:
-                web_protection_found.append(term)
-
-        # Check for billing and refund terms (high priority)
-        billing_terms = ["cashback", "refund", "billing", "payment", "charge", "cancel subscription", "money back", "claim cashback", "return", "invoice"]
-        billing_found = []
-        for term in billing_terms:
-            if term in msg_lower:
-                billing_found.append(term)
-
-        # Check for technical issues and errors (high priority)
-        technical_error_terms = ["error", "not working", "won't start", "crashes", "freezes", "installation failed", "can't install", "setup error", "connection error", "website error", "app error", "loading error", "login error", "sync error", "update failed", "scan failed", "won't open", "blank screen", "stuck", "hangs"]
-        technical_error_found = []
-        for term in technical_error_terms:
-            if term in msg_lower:
-                technical_error_found.append(term)
-
-        # Check for account website and portal issues (high priority)
-        account_website_terms = ["account portal", "can't login", "forgot password", "account locked", "website down", "portal not working", "account access", "login failed", "password reset", "account issues", "portal error", "dashboard not loading", "account.trendmicro.com", "my account", "sign in problem", "authentication failed", "session expired", "account suspended", "profile issues"]
-        account_website_found = []
-        for term in account_website_terms:
-            if term in msg_lower:
-                account_website_found.append(term)
-
-        # Check for resolution guard and case closure terms (high priority)
-        resolution_guard_terms = ["case closed", "ticket resolved", "issue resolved", "problem solved", "case complete", "close ticket", "resolution confirmed", "mark resolved", "case closure", "support complete", "issue fixed", "problem fixed", "ready to close", "case status", "resolution quality", "customer satisfied", "follow up needed", "escalate case", "reopen case"]
-        resolution_guard_found = []
-        for term in resolution_guard_terms:
-            if term in msg_lower:
-                resolution_guard_found.append(term)
-
-        # Prioritize specific query types
-        if resolution_guard_found:
-            query_words = resolution_guard_found[:2]  # Use top 2 resolution guard terms (highest priority)
-        elif account_website_found:
-            query_words = account_website_found[:2]  # Use top 2 account website terms
-        elif technical_error_found:
-            query_words = technical_error_found[:2]  # Use top 2 technical error terms
-        elif renewal_found:
-            query_words = renewal_found[:2]  # Use top 2 renewal terms
-        elif installation_found:
-            query_words = installation_found[:2]  # Use top 2 installation terms
-        elif id_protection_found:
-            query_words = id_protection_found[:2]  # Use top 2 ID protection terms
-        elif web_protection_found:
-            query_words = web_protection_found[:2]  # Use top 2 web protection terms
-        elif billing_found:
-            query_words = billing_found[:2]  # Use top 2 billing terms
-        else:
-            # Otherwise use general keywords
-            for keyword in SEARCH_KEYWORDS:
-                if keyword in msg_lower:
-                    query_words.append(keyword)
+        knowledge_generation += 1
+        generation = knowledge_generation
+        solution_entry = None
 
-        query = " ".join(set(query_words[:3])) if query_words else "security"
+        def is_current():
+            return generation == knowledge_generation
 
-        # Search Trend Micro Help Center
-        articles = fetch_trend_micro_articles(query)
+        def publish_knowledge(text):
+            global knowledge_suggestions
+            nonlocal solution_entry
+            if not is_current():
+                return
+            knowledge_suggestions = text
+            update_knowledge_panel()
 
-        # Special handling for resolution guard and case closure (highest priority)
-        if resolution_guard_found:
-            knowledge_data = f"💡 RESOLUTION GUARD - CASE CLOSURE ANALYSIS\nIssue: {latest_customer_msg[:80]}...\n\n"
-
-            # Get resolution guard guides from fallback articles
-            fallback_articles = get_fallback_articles()
-            resolution_guides = []
-            for article in fallback_articles:
-                if any(term in article['title'].lower() for term in ['resolution', 'case closure', 'quality', 'confidence']):
-                    resolution_guides.append(article)
-
-            if resolution_guides:
-                for i, article in enumerate(resolution_guides[:3], 1):
-                    knowledge_data += f"📋 {i}. {article['title']}\n"
-                    knowledge_data += f"{article['snippet']}\n\n"
-
-        # Special handling for account website and portal issues
-        elif account_website_found:
-            knowledge_data = f"💡 TREND MICRO ACCOUNT PORTAL SOLUTIONS\nIssue: {latest_customer_msg[:80]}...\n\n"
-
-            # Get account portal troubleshooting guides from fallback articles
-            fallback_articles = get_fallback_articles()
-            account_guides = []
-            for article in fallback_articles:
-                if any(term in article['title'].lower() for term in ['account', 'portal', 'login', 'website', 'access']):
-                    account_guides.append(article)
-
-            if account_guides:
-                for i, article in enumerate(account_guides[:3], 1):
-                    knowledge_data += f"📋 {i}. {article['title']}\n"
-                    knowledge_data += f"{article['snippet']}\n\n"
-
-        # Special handling for technical errors and troubleshooting
-        elif technical_error_found:
-            knowledge_data = f"💡 TREND MICRO TECHNICAL TROUBLESHOOTING\nIssue: {latest_customer_msg[:80]}...\n\n"
-
-            # Get technical troubleshooting guides from fallback articles
-            fallback_articles = get_fallback_articles()
-            technical_guides = []
-            for article in fallback_articles:
-                if any(term in article['title'].lower() for term in ['error', 'troubleshooting', 'installation', 'technical']):
-                    technical_guides.append(article)
-
-            if technical_guides:
-                for i, article in enumerate(technical_guides[:3], 1):
-                    knowledge_data += f"📋 {i}. {article['title']}\n"
-                    knowledge_data += f"{article['snippet']}\n\n"
-
-        # Special handling for renewal queries - prioritize detailed renewal guide
-        elif renewal_found:
-            knowledge_data = f"💡 TREND MICRO RENEWAL SOLUTIONS\nIssue: {latest_customer_msg[:80]}...\n\n"
-
-            # Get the detailed renewal guide from our fallback articles
-            fallback_articles = get_fallback_articles()
-            renewal_guide = None
-            for article in fallback_articles:
-                if "renew" in article['title'].lower():
-                    renewal_guide = article
-                    break
-
-            if renewal_guide:
-                knowledge_data += f"📋 1. {renewal_guide['title']}\n"
-                knowledge_data += f"{renewal_guide['snippet']}\n\n"
-
-            # Add a few additional relevant articles from fallback for renewal context
-            additional_count = 2
-            for article in fallback_articles[:3]:  # Get first 3 other articles
-                if renewal_guide and article['title'] != renewal_guide['title']:
-                    knowledge_data += f"📋 {additional_count}. {article['title']}\n"
-                    knowledge_data += f"   • {article['snippet'][:100]}...\n"
-                    knowledge_data += f"   🔗 {article['link']}\n\n"
-                    additional_count += 1
-                    if additional_count > 3:  # Limit to 3 total articles
-                        break
-
-        # Special handling for installation queries - prioritize detailed installation guide
-        elif installation_found:
-            knowledge_data = f"💡 TREND MICRO INSTALLATION SOLUTIONS\nIssue: {latest_customer_msg[:80]}...\n\n"
-
-            # Get the detailed installation guide from our fallback articles
-            fallback_articles = get_fallback_articles()
-            installation_guide = None
-            for article in fallback_articles:
-                if "install" in article['title'].lower():
-                    installation_guide = article
-                    break
-
-            if installation_guide:
-                knowledge_data += f"📋 1. {installation_guide['title']}\n"
-                knowledge_data += f"{installation_guide['snippet']}\n\n"
-
-            # Add a few additional relevant articles from fallback for installation context
-            additional_count = 2
-            for article in fallback_articles[:3]:  # Get first 3 other articles
-                if installation_guide and article['title'] != installation_guide['title']:
-                    knowledge_data += f"📋 {additional_count}. {article['title']}\n"
-                    knowledge_data += f"   • {article['snippet'][:100]}...\n"
-                    knowledge_data += f"   🔗 {article['link']}\n\n"
-                    additional_count += 1
-                    if additional_count > 3:  # Limit to 3 total articles
-                        break
-
-        # Special handling for ID Protection and Password Manager queries
-        elif id_protection_found:
-            knowledge_data = f"💡 TREND MICRO ID PROTECTION SOLUTIONS\nIssue: {latest_customer_msg[:80]}...\n\n"
-
-            # Get ID Protection guides from fallback articles
-            fallback_articles = get_fallback_articles()
-            id_protection_guides = []
-            for article in fallback_articles:
-                if any(term in article['title'].lower() for term in ['password', 'privacy', 'identity', 'data']):
-                    id_protection_guides.append(article)
-
-            if id_protection_guides:
-                for i, article in enumerate(id_protection_guides[:3], 1):
-                    knowledge_data += f"📋 {i}. {article['title']}\n"
-                    knowledge_data += f"{article['snippet']}\n\n"
-
-        # Special handling for VPN and Web Protection queries
-        elif web_protection_found:
-            knowledge_data = f"💡 TREND MICRO WEB PROTECTION SOLUTIONS\nIssue: {latest_customer_msg[:80]}...\n\n"
-
-            # Get Web Protection guides from fallback articles
-            fallback_articles = get_fallback_articles()
-            web_protection_guides = []
-            for article in fallback_articles:
-                if any(term in article['title'].lower() for term in ['web', 'firewall', 'protection', 'parental']):
-                    web_protection_guides.append(article)
-
-            if web_protection_guides:
-                for i, article in enumerate(web_protection_guides[:3], 1):
-                    knowledge_data += f"📋 {i}. {article['title']}\n"
-                    knowledge_data += f"{article['snippet']}\n\n"
-
-        # Special handling for billing and refund queries
-        elif billing_found:
-            knowledge_data = f"💡 TREND MICRO BILLING & REFUND SOLUTIONS\nIssue: {latest_customer_msg[:80]}...\n\n"
-
-            # Get billing guides from fallback articles
-            fallback_articles = get_fallback_articles()
-            billing_guides = []
-            for article in fallback_articles:
-                if any(term in article['title'].lower() for term in ['billing', 'refund', 'cashback', 'payment', 'cancel']):
-                    billing_guides.append(article)
-
-            if billing_guides:
-                for i, article in enumerate(billing_guides[:3], 1):
-                    knowledge_data += f"📋 {i}. {article['title']}\n"
-                    knowledge_data += f"{article['snippet']}\n\n"
-
-        else:
-            knowledge_data = f"💡 TREND MICRO SOLUTIONS\nIssue: {latest_customer_msg[:80]}...\n\n"
-
-            # Process general articles normally
-            for i, article in enumerate(articles, 1):
-                knowledge_data += f"📋 {i}. {article['title']}\n"
-
-                # Get solution bullets from the article
-                bullets = []
-                if article['link'] and 'helpcenter.trendmicro.com' in article['link']:
-                    bullets = get_solution_bullets(article['link'], article['title'])
+            # Track this solution in history, keeping the entry in step with late article bullets
+            if solution_entry is None:
+                solution_entry = add_to_solution_history(latest_customer_msg, text)
+            else:
+                update_solution_entry(solution_entry, text)
+                update_solution_history_dropdown()
 
-                # If no bullets from web scraping, use default solutions
-                if not bullets:
-                    bullets = get_default_solution_bullets(article['title'], query)
+        build_knowledge_suggestions(latest_customer_msg, on_update=publish_knowledge, is_current=is_current)
 
-                # If still no bullets, use snippet
-                if bullets:
-                    for bullet in bullets:
-                        knowledge_data += f"   • {bullet}\n"
-                else:
-                    knowledge_data += f"   • {article['snippet']}\n"
-
-                # Add quick action based on issue type
-                if any(word in latest_customer_msg.lower() for word in ['virus', 'malware', 'infected']):
-                    knowledge_data += f"   ⚡ Quick: Run full scan, check quarantine\n"
-                elif any(word in latest_customer_msg.lower() for word in ['slow', 'performance']):
-                    knowledge_data += f"   ⚡ Quick: Check resources, optimize settings\n"
-                elif any(word in latest_customer_msg.lower() for word in ['email', 'spam']):
-                    knowledge_data += f"   ⚡ Quick: Configure email security\n"
-
-                knowledge_data += f"   🔗 {article['link']}\n\n"
-
-            if not articles:
-                knowledge_data += "📚 GENERAL TREND MICRO SOLUTIONS:\n\n"
-                knowledge_data += "🛡️ SECURITY BEST PRACTICES:\n"
-                knowledge_data += "• Keep Trend Micro products updated to latest version\n"
-                knowledge_data += "• Run full system scans weekly\n"
-                knowledge_data += "• Enable real-time protection and web reputation\n"
-                knowledge_data += "• Configure firewall settings appropriately\n"
-                knowledge_data += "• Review quarantine regularly for false positives\n\n"
-
-                knowledge_data += "🔧 COMMON TROUBLESHOOTING STEPS:\n"
-                knowledge_data += "• Restart Trend Micro services if performance issues occur\n"
-                knowledge_data += "• Check for conflicting security software\n"
-                knowledge_data += "• Verify system requirements are met\n"
-                knowledge_data += "• Update Windows and system drivers\n"
-                knowledge_data += "• Contact support if issues persist\n\n"
-
-        knowledge_suggestions = knowledge_data
-        update_knowledge_panel()
         update_status("Trend Micro solutions found")
 
-        # Track this solution in history
-        add_to_solution_history(latest_customer_msg, knowledge_data)
-
     except Exception as e:
-        knowledge_suggestions = f"❌ Error accessing Trend Micro Help Center: {str(e)}\n\n🆘 MANUAL SUPPORT OPTIONS:\n• Visit https://helpcenter.trendmicro.com/en-us/\n• Contact Trend Micro technical support\n• Check product documentation\n• Search community forums for solutions"
+        knowledge_suggestions = format_knowledge_error(e)
         update_knowledge_panel()
         update_status("Help Center search failed")
-    finally:
-        is_processing = False
 
-def add_to_solution_history(customer_query, solution_provided):
-    """Add a solution to the history tracking"""
-    global solution_history
+def append_solution_entry(history, customer_query, solution_provided, solution_type=None, solution_summary=None, limit=10):
+    """Append a solution entry to a solution history list, keeping the last `limit` entries
 
-    import datetime
-
-    # Create solution entry
+    solution_type and solution_summary are derived from the solution text unless given.
+    """
     solution_entry = {
         'timestamp': datetime.datetime.now(),
         'customer_query': customer_query[:100] + "..." if len(customer_query) > 100 else customer_query,
+        'solution_type': solution_type or get_solution_type(solution_provided),
+        'solution_summary': solution_summary or get_solution_summary(solution_provided),
+        'full_solution': solution_provided
+    }
+
+    history.append(solution_entry)
+    if len(history) > limit:
+        history.pop(0)  # Remove oldest entry
+
+    return solution_entry
+
+def update_solution_entry(solution_entry, solution_provided):
+    """Replace the solution recorded in a history entry with a newer version of the text"""
+    solution_entry.update({
         'solution_type': get_solution_type(solution_provided),
         'solution_summary': get_solution_summary(solution_provided),
         'full_solution': solution_provided
-    }
+    })
+
+def add_to_solution_history(customer_query, solution_provided):
+    """Add a solution to the history tracking"""
+    global solution_history
 
     # Add to history (keep last 10 solutions)
-    solution_history.append(solution_entry)
-    if len(solution_history) > 10:
-        solution_history.pop(0)  # Remove oldest entry
+    solution_entry = append_solution_entry(solution_history, customer_query, solution_provided)
 
     # Update solution history dropdown
     update_solution_history_dropdown()
+    return solution_entry
 
 def get_solution_type(solution_text):
     """Determine the type of solution provided"""
@@ -3146,36 +3458,32 @@ def get_solution_summary(solution_text):
         # Final fallback
         return "Trend Micro help center solutions and troubleshooting guidance"
 
+@on_ui_thread()
 def update_solution_history_dropdown():
     """Update the solution history dropdown with available solutions"""
     if solution_history_dropdown:
-        # Clear current options
-        solution_history_dropdown['values'] = ()
-
-        if solution_history:
-            # Create dropdown options
-            dropdown_options = []
-            for i, entry in enumerate(reversed(solution_history), 1):
-                timestamp_str = entry['timestamp'].strftime("%m/%d %H:%M")
-                option_text = f"#{len(solution_history) - i + 1} [{timestamp_str}] {entry['solution_type']} - {entry['customer_query'][:50]}..."
-                dropdown_options.append(option_text)
-
-            solution_history_dropdown['values'] = dropdown_options
+        dropdown_options = []
+        for i, entry in enumerate(reversed(solution_history), 1):
+            timestamp_str = entry['timestamp'].strftime("%m/%d %H:%M")
+            option_text = f"#{len(solution_history) - i + 1} [{timestamp_str}] {entry['solution_type']} - {entry['customer_query'][:50]}..."
+            dropdown_options.append(option_text)
+
+        # Nothing new since the last refresh: keep the options and whatever the engineer is viewing
+        dropdown_options = tuple(dropdown_options)
+        if dropdown_options == getattr(solution_history_dropdown, 'rendered_options', None):
+            return
+        solution_history_dropdown.rendered_options = dropdown_options
+        solution_history_dropdown['values'] = dropdown_options
 
-            # Set default text
-            if solution_history_var:
+        if solution_history_var:
+            if solution_history:
                 solution_history_var.set(f"📜 {len(solution_history)} solution(s) available - Select to view details")
-        else:
-            # No history available
-            if solution_history_var:
+            else:
                 solution_history_var.set("📜 No solution history yet - Solutions will appear here automatically")
 
         # Clear the details panel initially
         if solution_history_panel:
-            solution_history_panel.config(state=tk.NORMAL)
-            solution_history_panel.delete(1.0, tk.END)
-            solution_history_panel.insert(tk.END, "Select a solution from the dropdown above to view details...")
-            solution_history_panel.config(state=tk.DISABLED)
+            render_panel(solution_history_panel, [("Select a solution from the dropdown above to view details...", None)])
 
 def on_history_selection_changed(event=None):
     """Handle selection change in history dropdown"""
@@ -3188,35 +3496,34 @@ def on_history_selection_changed(event=None):
         entry = list(reversed(solution_history))[selection_index]
 
         # Display detailed information
-        solution_history_panel.config(state=tk.NORMAL)
-        solution_history_panel.delete(1.0, tk.END)
+        segments = []
 
         # Header
         timestamp_str = entry['timestamp'].strftime("%m/%d/%Y %H:%M:%S")
-        solution_history_panel.insert(tk.END, f"📜 SOLUTION DETAILS - {entry['solution_type']}\n")
-        solution_history_panel.insert(tk.END, f"🕒 Timestamp: {timestamp_str}\n")
-        solution_history_panel.insert(tk.END, "=" * 60 + "\n\n")
+        segments.append((f"📜 SOLUTION DETAILS - {entry['solution_type']}\n", None))
+        segments.append((f"🕒 Timestamp: {timestamp_str}\n", None))
+        segments.append(("=" * 60 + "\n\n", None))
 
         # Customer query
-        solution_history_panel.insert(tk.END, f"❓ CUSTOMER QUERY:\n{entry['customer_query']}\n\n")
+        segments.append((f"❓ CUSTOMER QUERY:\n{entry['customer_query']}\n\n", None))
 
         # Solution summary
-        solution_history_panel.insert(tk.END, f"✅ SOLUTION PROVIDED:\n{entry['solution_summary']}\n\n")
+        segments.append((f"✅ SOLUTION PROVIDED:\n{entry['solution_summary']}\n\n", None))
 
         # Key actions for quick reference
-        solution_history_panel.insert(tk.END, "🔑 QUICK ACTIONS FOR CUSTOMER:\n")
+        segments.append(("🔑 QUICK ACTIONS FOR CUSTOMER:\n", None))
         if "renewal" in entry['customer_query'].lower():
-            solution_history_panel.insert(tk.END, "• Visit account.trendmicro.com\n• Go to Licenses tab\n• Click Renew Now\n• Complete payment process\n")
+            segments.append(("• Visit account.trendmicro.com\n• Go to Licenses tab\n• Click Renew Now\n• Complete payment process\n", None))
         elif "install" in entry['customer_query'].lower():
-            solution_history_panel.insert(tk.END, "• Download installer from account portal\n• Run as Administrator\n• Follow installation wizard\n• Activate with license key\n")
+            segments.append(("• Download installer from account portal\n• Run as Administrator\n• Follow installation wizard\n• Activate with license key\n", None))
         elif "virus" in entry['customer_query'].lower() or "malware" in entry['customer_query'].lower():
-            solution_history_panel.insert(tk.END, "• Run full system scan\n• Check quarantine for threats\n• Update virus definitions\n• Restart if required\n")
+            segments.append(("• Run full system scan\n• Check quarantine for threats\n• Update virus definitions\n• Restart if required\n", None))
         else:
-            solution_history_panel.insert(tk.END, "• Follow the detailed solution provided above\n• Contact support if issues persist\n")
+            segments.append(("• Follow the detailed solution provided above\n• Contact support if issues persist\n", None))
 
-        solution_history_panel.insert(tk.END, f"\n💡 TIP: Click '📄 Details' button to view the complete solution text.")
+        segments.append((f"\n💡 TIP: Click '📄 Details' button to view the complete solution text.", None))
 
-        solution_history_panel.config(state=tk.DISABLED)
+        render_panel(solution_history_panel, segments)
 
 def view_solution_details():
     """Show detailed view of selected solution"""
@@ -3226,6 +3533,7 @@ def view_solution_details():
 
     # Create a selection dialog
     detail_window = tk.Toplevel()
+    ensure_ui_scaling(detail_window)
     detail_window.title("Solution History Details")
     detail_window.geometry("800x600")
     detail_window.configure(bg=SENTRIGUIDE_THEME['bg_primary'])
@@ -3304,31 +3612,652 @@ def clear_solution_history():
         update_solution_history_dropdown()
         messagebox.showinfo("History Cleared", "Solution history has been cleared successfully.")
 
+# =============================
+# Concurrent Analysis Pipeline
+# =============================
+# Stage name -> stages whose results it needs. Summary, sentiment and knowledge
+# start immediately; confidence waits for sentiment and coaching for both.
+ANALYSIS_STAGES = (
+    ("summary", ()),
+    ("sentiment", ()),
+    ("knowledge", ()),
+    ("confidence", ("sentiment",)),
+    ("coaching", ("sentiment", "confidence")),
+)
+
+_analysis_executor = None
+_analysis_executor_lock = threading.Lock()
+
+def get_analysis_executor():
+    """Return the shared thread pool that runs analysis stages"""
+    global _analysis_executor
+
+    with _analysis_executor_lock:
+        if _analysis_executor is None:
+            _analysis_executor = ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS, thread_name_prefix="sentriguide-stage")
+        return _analysis_executor
+
+class AnalysisPipeline:
+    """Dependency-aware runner that starts each analysis stage as soon as its inputs are ready"""
+
+    def __init__(self, stage_functions, stages=ANALYSIS_STAGES, executor=None):
+        # stage_functions: stage name -> callable taking a dict of its dependencies' results
+        self.stage_functions = stage_functions
+        self.stages = stages
+        self.executor = executor
+
+        known = {name for name, _ in stages}
+        for name, dependencies in stages:
+            if name not in stage_functions:
+                raise ValueError(f"No function registered for analysis stage '{name}'")
+            missing = set(dependencies) - known
+            if missing:
+                raise ValueError(f"Analysis stage '{name}' depends on unknown stages: {', '.join(sorted(missing))}")
+
+    def run(self, cancel_event=None):
+        """Run every stage and return (results, timings) keyed by stage name
+
+        Once cancel_event is set no further stages are started; stages already
+        running are allowed to finish and the timings are flagged "cancelled".
+        """
+        executor = self.executor or get_analysis_executor()
+        started = time.perf_counter()
+        results = {}
+        timings = {}
+        waiting = {name: set(dependencies) for name, dependencies in self.stages}
+        running = {}
+
+        def submit_ready_stages():
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            for name in [name for name, dependencies in waiting.items() if dependencies <= results.keys()]:
+                dependencies = waiting.pop(name)
+                inputs = {dependency: results[dependency] for dependency in dependencies}
+                future = executor.submit(self._run_stage, self.stage_functions[name], inputs, started)
+                running[future] = name
+
+        submit_ready_stages()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                results[name], timings[name] = future.result()
+            submit_ready_stages()
+
+        if cancel_event is not None and cancel_event.is_set():
+            timings["cancelled"] = True
+        elif waiting:
+            raise ValueError(f"Analysis stages could not be scheduled (dependency cycle): {', '.join(sorted(waiting))}")
+
+        timings["total_ms"] = (time.perf_counter() - started) * 1000
+        return results, timings
+
+    @staticmethod
+    def _run_stage(function, inputs, pipeline_started):
+        stage_started = time.perf_counter()
+        timing = {"queued_ms": (stage_started - pipeline_started) * 1000}
+        result = None
+
+        try:
+            result = function(inputs)
+        except Exception as e:
+            # A failing stage must not stall the stages that depend on it
+            timing["error"] = str(e)
+
+        finished = time.perf_counter()
+        timing["duration_ms"] = (finished - stage_started) * 1000
+        timing["latency_ms"] = (finished - pipeline_started) * 1000
+        return result, timing
+
+def format_stage_timings(timings):
+    """Format per-stage end-to-end latencies as a one-line report"""
+    stages = ", ".join(f"{name} {timing['latency_ms']:.0f}ms" for name, timing in timings.items() if isinstance(timing, dict))
+    return f"{timings['total_ms']:.0f}ms total ({stages})"
+
+class AnalysisJob:
+    """One queued analysis pass for a conversation"""
+
+    def __init__(self, analyze):
+        self.analyze = analyze
+        self.cancel_event = threading.Event()
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+    def wait(self, timeout=None):
+        """Block until the pass has finished or been dropped; returns False on timeout"""
+        return self.done.wait(timeout)
+
+class AnalysisScheduler:
+    """Per-conversation analysis queue that coalesces bursts into the latest message
+
+    Each conversation has at most one running pass and one pending pass. A new
+    request replaces the pending one and cancels the running one, so a burst of
+    messages collapses into a single pass over the latest conversation state
+    and no request is ever silently dropped.
+    """
+
+    def __init__(self, max_workers=ANALYSIS_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sentriguide-pass")
+        self._lock = threading.Lock()
+        # conversation_id -> {"running": AnalysisJob or None, "pending": AnalysisJob or None}
+        self._conversations = {}
+        self.submitted = 0
+        self.completed = 0
+        self.coalesced = 0
+        self.cancelled = 0
+
+    def submit(self, conversation_id, analyze):
+        """Queue analyze(cancel_event) for a conversation and return its AnalysisJob"""
+        job = AnalysisJob(analyze)
+
+        with self._lock:
+            self.submitted += 1
+            state = self._conversations.setdefault(conversation_id, {"running": None, "pending": None})
+
+            superseded = state["pending"]
+            if superseded is not None:
+                # The newer request covers everything the queued one would have analyzed
+                superseded.cancel_event.set()
+                superseded.done.set()
+                self.coalesced += 1
+            state["pending"] = job
+
+            running = state["running"]
+            if running is None:
+                self._start_next(conversation_id, state)
+            elif not running.cancel_event.is_set():
+                running.cancel_event.set()
+                self.cancelled += 1
+
+        return job
+
+    def pending(self, conversation_id):
+        """Return the number of running and queued passes for a conversation"""
+        with self._lock:
+            state = self._conversations.get(conversation_id)
+            if not state:
+                return 0
+            return (state["running"] is not None) + (state["pending"] is not None)
+
+    def stats(self):
+        """Return scheduler counters"""
+        with self._lock:
+            return {
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "coalesced": self.coalesced,
+                "cancelled": self.cancelled,
+                "active_conversations": len(self._conversations)
+            }
+
+    def _start_next(self, conversation_id, state):
+        job = state["pending"]
+        state["pending"] = None
+        state["running"] = job
+        self._executor.submit(self._run, conversation_id, job)
+
+    def _run(self, conversation_id, job):
+        try:
+            job.result = job.analyze(job.cancel_event)
+        except Exception as e:
+            job.error = e
+            print(f"Analysis pass failed for {conversation_id}: {str(e)}")
+        finally:
+            with self._lock:
+                self.completed += 1
+                state = self._conversations[conversation_id]
+                state["running"] = None
+                if state["pending"] is not None:
+                    self._start_next(conversation_id, state)
+                else:
+                    del self._conversations[conversation_id]
+            job.done.set()
+
+analysis_scheduler = AnalysisScheduler()
+
 def run_sentriguide_analysis():
-    """Run all SentriGuide AI analyses"""
-    if is_processing:
-        return
+    """Queue a SentriGuide AI analysis pass for the current conversation"""
+
+    def run_analysis(cancel_event):
+        # Stages hand their results to the stages that depend on them; each also
+        # publishes its result to the panels as soon as it is ready
+        pipeline = AnalysisPipeline({
+            "summary": lambda inputs: update_conversation_summary(),
+            "sentiment": lambda inputs: analyze_sentiment_and_tone(),
+            "knowledge": lambda inputs: surface_dynamic_knowledge(),
+            "confidence": lambda inputs: calculate_resolution_confidence(inputs["sentiment"]),
+            "coaching": lambda inputs: analyze_coaching_performance(inputs["sentiment"], inputs["confidence"]),
+        })
 
-    def run_analysis():
-        update_conversation_summary()
-        time.sleep(0.5)  # Prevent API rate limiting
-        analyze_sentiment_and_tone()
-        time.sleep(0.5)
-        calculate_resolution_confidence()
-        time.sleep(0.5)
-        surface_dynamic_knowledge()
-        time.sleep(0.5)
-        analyze_coaching_performance()
+        _, timings = pipeline.run(cancel_event)
+        if timings.get("cancelled"):
+            update_status("Analysis superseded by a newer message")
+        else:
+            update_status(f"Analysis complete in {format_stage_timings(timings)}")
 
-    # Run in background thread
-    threading.Thread(target=run_analysis, daemon=True).start()
+    # Runs on the scheduler's worker threads; bursts of messages coalesce into one pass
+    analysis_scheduler.submit(GUI_CONVERSATION_ID, run_analysis)
+
+# =============================
+# Headless Analysis Engine
+# =============================
+class SentriGuideEngine:
+    """Headless SentriGuide analysis engine that owns the state of one conversation"""
+
+    def __init__(self, confidence_model=None, llm_backend=None):
+        self.confidence_model = confidence_model
+        self.llm_backend = llm_backend if llm_backend is not None else get_llm_backend()
+        self.reset()
+
+    def reset(self):
+        """Clear the conversation and all analysis state"""
+        self.conversation_history = []
+        self.conversation_summary = ""
+        self.summarizer = IncrementalSummarizer()
+        self.compactor = ConversationCompactor()
+        self.customer_sentiment = {"emotion": "neutral", "urgency": "medium", "satisfaction": 70}
+        self.resolution_confidence = 0
+        self.resolution_analysis = ""
+        self.knowledge_suggestions = ""
+        self.solution_history = []
+        self.coaching_feedback = ""
+        self.performance_metrics = {
+            "response_time": "good",
+            "empathy_level": "medium",
+            "technical_accuracy": "high",
+            "communication_clarity": "good",
+            "session_progress": "on_track"
+        }
+        self.session_metrics = new_session_metrics()
+
+    def add_message(self, role, content, timestamp=None):
+        """Append a message to the conversation and return the stored entry"""
+        if timestamp is None:
+            timestamp = datetime.datetime.now().strftime("%H:%M")
+
+        message = {"role": role, "content": content, "timestamp": timestamp}
+        self.conversation_history.append(message)
+
+        if role == "engineer":
+            record_session_metrics(self.session_metrics, content, self.customer_sentiment.get('satisfaction', 70))
+
+        return message
+
+    # Each analysis has a stage method that only reads the conversation and the
+    # results it is handed, and a public method that runs the stage and applies
+    # its result to the engine. run_analysis() runs the stages as a pipeline and
+    # applies all of their results once at the end.
+    def summarize_conversation(self):
+        """Challenge 1 stage: summarize the conversation, or None if there is too little to summarize"""
+        if len(self.conversation_history) < 2:
+            return None
+
+        try:
+            self.summarizer.sync(self.conversation_history)
+            self.compactor.sync(self.conversation_history)
+            return {"summary": f"{self.summarizer.render()}\n{self.compactor.context('RECENT TURNS')}"}
+        except Exception as e:
+            return {"summary": f"Summary error: {str(e)}", "error": str(e)}
+
+    def score_sentiment(self):
+        """Challenge 2 stage: score the latest customer message, or None if the customer has not spoken"""
+        latest_customer_msg = get_latest_customer_message(self.conversation_history)
+        if not latest_customer_msg:
+            return None
+
+        try:
+            return dict(self.customer_sentiment, **score_customer_sentiment(latest_customer_msg))
+        except Exception as e:
+            return dict(self.customer_sentiment, analysis=f"Sentiment analysis error: {str(e)}", error=str(e))
+
+    def score_confidence(self, sentiment=None, on_update=None):
+        """Challenge 3 stage: score how safely the case could be closed, given the sentiment stage's result
+
+        on_update(score_or_None, text_so_far) is called while an LLM reply streams in.
+        """
+        if not self.conversation_history:
+            return None
+
+        try:
+            conversation_context = None
+            if self.llm_backend is not None:
+                self.compactor.sync(self.conversation_history)
+                conversation_context = self.compactor.context()
+            emotion = (sentiment or self.customer_sentiment).get('emotion')
+            confidence, analysis = score_resolution_confidence(self.conversation_history, emotion, self.confidence_model,
+                                                               self.llm_backend, conversation_context, on_update)
+            return {"confidence": confidence, "analysis": analysis}
+        except Exception as e:
+            return {"confidence": 50, "analysis": f"Confidence calculation error: {str(e)}", "error": str(e)}
+
+    def find_knowledge(self):
+        """Challenge 4 stage: Help Center knowledge for the latest customer message
+
+        Waits for the final text: article pages that miss the fetch deadline show
+        default bullets rather than a loading placeholder.
+        """
+        latest_customer_msg = get_latest_customer_message(self.conversation_history)
+        if not latest_customer_msg:
+            return None
+
+        try:
+            knowledge = build_knowledge_suggestions(latest_customer_msg)
+        except Exception as e:
+            return {"knowledge": format_knowledge_error(e), "error": str(e)}
+
+        return {
+            "knowledge": knowledge,
+            "customer_query": latest_customer_msg,
+            "solution_type": get_solution_type(knowledge),
+            "solution_summary": get_solution_summary(knowledge)
+        }
+
+    def score_coaching(self, sentiment=None, confidence=None):
+        """Challenge 5 stage: coach the engineer's latest response, or None before the engineer has replied
+
+        Uses the sentiment and confidence stages' results, falling back to the
+        engine's current values when a stage had nothing to report.
+        """
+        sentiment = sentiment or self.customer_sentiment
+        confidence = confidence["confidence"] if confidence else self.resolution_confidence
+        try:
+            result = score_coaching_performance(self.conversation_history, sentiment, confidence)
+        except Exception as e:
+            return {"feedback": f"Performance analysis error: {str(e)}", "error": str(e)}
+
+        if not result:
+            return None
+
+        metrics, feedback = result
+        return {"metrics": dict(self.performance_metrics, **metrics), "feedback": feedback}
+
+    def apply_analysis(self, results):
+        """Apply stage results keyed by stage name to the engine's analysis state"""
+        summary = results.get("summary")
+        if summary:
+            self.conversation_summary = summary["summary"]
+
+        sentiment = results.get("sentiment")
+        if sentiment:
+            self.customer_sentiment.update((key, value) for key, value in sentiment.items() if key != "error")
+
+        confidence = results.get("confidence")
+        if confidence:
+            self.resolution_confidence = confidence["confidence"]
+            self.resolution_analysis = confidence["analysis"]
+
+        knowledge = results.get("knowledge")
+        if knowledge:
+            self.knowledge_suggestions = knowledge["knowledge"]
+            if "error" not in knowledge:
+                append_solution_entry(self.solution_history, knowledge["customer_query"], knowledge["knowledge"],
+                                      knowledge["solution_type"], knowledge["solution_summary"])
+
+        coaching = results.get("coaching")
+        if coaching:
+            if "metrics" in coaching:
+                self.performance_metrics = dict(coaching["metrics"])
+            self.coaching_feedback = coaching["feedback"]
+
+    def update_conversation_summary(self):
+        """Challenge 1: summarize the conversation, or None if there is too little to summarize"""
+        result = self.summarize_conversation()
+        self.apply_analysis({"summary": result})
+        return result
+
+    def analyze_sentiment_and_tone(self):
+        """Challenge 2: score the latest customer message, or None if the customer has not spoken"""
+        result = self.score_sentiment()
+        self.apply_analysis({"sentiment": result})
+        return result
+
+    def calculate_resolution_confidence(self, on_update=None):
+        """Challenge 3: score how safely the case could be closed
+
+        on_update(score_or_None, text_so_far) is called while an LLM reply streams in.
+        """
+        result = self.score_confidence(on_update=on_update)
+        self.apply_analysis({"confidence": result})
+        return result
+
+    def surface_dynamic_knowledge(self):
+        """Challenge 4: surface Help Center knowledge for the latest customer message"""
+        result = self.find_knowledge()
+        self.apply_analysis({"knowledge": result})
+        return result
+
+    def analyze_coaching_performance(self):
+        """Challenge 5: coach the engineer's latest response, or None before the engineer has replied"""
+        result = self.score_coaching()
+        self.apply_analysis({"coaching": result})
+        return result
+
+    def run_analysis(self, cancel_event=None):
+        """Run every SentriGuide analysis concurrently and return the results keyed by stage name
+
+        Stages receive their dependencies' results and leave the engine alone; the
+        results are applied once the pass ends (including the stages that finished
+        before a cancel). Stage latencies from the start of the pass are returned
+        under "timings". Passing a cancel_event lets an AnalysisScheduler stop a
+        superseded pass.
+        """
+        pipeline = AnalysisPipeline({
+            "summary": lambda inputs: self.summarize_conversation(),
+            "sentiment": lambda inputs: self.score_sentiment(),
+            "knowledge": lambda inputs: self.find_knowledge(),
+            "confidence": lambda inputs: self.score_confidence(inputs["sentiment"]),
+            "coaching": lambda inputs: self.score_coaching(inputs["sentiment"], inputs["confidence"]),
+        })
+        results, timings = pipeline.run(cancel_event)
+        self.apply_analysis(results)
+        results["timings"] = timings
+        return results
+
+    def process_message(self, role, content, timestamp=None):
+        """Append a message and run a full analysis pass over the updated conversation"""
+        self.add_message(role, content, timestamp)
+        return self.run_analysis()
+
+# =============================
+# Transcript Replay
+# =============================
+def load_transcripts(paths):
+    """Yield (conversation_id, messages) from JSONL transcript files or directories of them
+
+    Each line is a conversation_history entry: {"role", "content", "timestamp"}.
+    Lines may carry a "conversation_id"; otherwise the file name is used.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            file_paths = sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith(".jsonl"))
+        else:
+            file_paths = [path]
+
+        for file_path in file_paths:
+            default_id = os.path.splitext(os.path.basename(file_path))[0]
+            conversations = {}
+            with open(file_path, encoding="utf-8") as transcript:
+                for line_number, line in enumerate(transcript, 1):
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    if "role" not in record or "content" not in record:
+                        raise ValueError(f"{file_path}:{line_number}: transcript records need 'role' and 'content'")
+                    conversation_id = str(record.get("conversation_id", default_id))
+                    conversations.setdefault(conversation_id, []).append(
+                        {"role": record["role"], "content": record["content"], "timestamp": record.get("timestamp")})
+            yield from conversations.items()
+
+def replay_conversation(conversation_id, messages):
+    """Replay a conversation through a fresh engine, analysing after every message
+
+    Returns (results, latencies_ms): one result per message with the analysis
+    stages keyed by name, and the analysis latency of each message.
+    """
+    engine = SentriGuideEngine()
+    results = []
+    latencies = []
+    for index, message in enumerate(messages):
+        entry = engine.add_message(message["role"], message["content"], message.get("timestamp"))
+        start = time.perf_counter()
+        analysis = engine.run_analysis()
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append(dict({"conversation_id": conversation_id, "index": index, "role": entry["role"], "timestamp": entry["timestamp"]}, **analysis))
+    return results, latencies
+
+def _init_replay_worker(offline):
+    """Prepare a replay worker process"""
+    global HELP_CENTER_OFFLINE
+    HELP_CENTER_OFFLINE = offline
+    sys.stdout = sys.stderr  # Keep diagnostics out of a results stream on stdout
+    get_knowledge_index()
+
+def replay_transcripts(paths, output, workers=REPLAY_WORKERS, offline=False):
+    """Replay transcripts across worker processes, writing one JSON line per message to `output`
+
+    Conversations are written in completion order; at most REPLAY_QUEUE_DEPTH
+    conversations per worker are queued at once. Returns throughput stats.
+    """
+    started = time.perf_counter()
+    conversations = 0
+    latencies = []
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_replay_worker, initargs=(offline,)) as executor:
+        running = set()
+
+        def write_finished(return_when):
+            nonlocal conversations
+            done, _ = wait(running, return_when=return_when)
+            for future in done:
+                running.discard(future)
+                results, message_latencies = future.result()
+                for result in results:
+                    output.write(json.dumps(result, default=str) + "\n")
+                conversations += 1
+                latencies.extend(message_latencies)
+
+        for conversation_id, messages in load_transcripts(paths):
+            running.add(executor.submit(replay_conversation, conversation_id, messages))
+            if len(running) >= workers * REPLAY_QUEUE_DEPTH:
+                write_finished(FIRST_COMPLETED)
+        while running:
+            write_finished(FIRST_COMPLETED)
+
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    stats = {
+        "conversations": conversations,
+        "messages": len(latencies),
+        "workers": workers,
+        "elapsed_s": round(elapsed, 3),
+        "messages_per_s": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "conversations_per_s": round(conversations / elapsed, 1) if elapsed else 0.0
+    }
+    if latencies:
+        stats["p50_ms"] = round(latencies[len(latencies) // 2], 2)
+        stats["p99_ms"] = round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))], 2)
+    return stats
+
+# =============================
+# Multi-Conversation Sessions
+# =============================
+class SessionManager:
+    """Registry of per-conversation SentriGuideEngine sessions with idle eviction"""
+
+    def __init__(self, idle_timeout=SESSION_IDLE_TIMEOUT, max_sessions=MAX_SESSIONS, engine_factory=SentriGuideEngine):
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.engine_factory = engine_factory
+        self.evicted_sessions = 0
+        # conversation_id -> (engine, last_used); ordered from least to most recently used
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._sessions)
+
+    def __contains__(self, conversation_id):
+        with self._lock:
+            entry = self._sessions.get(conversation_id)
+            return entry is not None and time.monotonic() - entry[1] < self.idle_timeout
+
+    def get(self, conversation_id):
+        """Return the session for a conversation and mark it active, or None if unknown or idle too long"""
+        with self._lock:
+            self._evict_idle(time.monotonic())
+            entry = self._sessions.get(conversation_id)
+            if entry is None:
+                return None
+            self._touch(conversation_id, entry[0])
+            return entry[0]
+
+    def get_or_create(self, conversation_id):
+        """Return the session for a conversation, creating it if needed (or if the old one was idle too long)"""
+        with self._lock:
+            self._evict_idle(time.monotonic())
+            entry = self._sessions.get(conversation_id)
+            if entry is not None:
+                self._touch(conversation_id, entry[0])
+                return entry[0]
+
+            engine = self.engine_factory()
+            self._sessions[conversation_id] = (engine, time.monotonic())
+
+            # Keep memory bounded even when every session is still active
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+                self.evicted_sessions += 1
+
+            return engine
+
+    def end(self, conversation_id):
+        """Remove a conversation's session and return it, or None if unknown"""
+        with self._lock:
+            entry = self._sessions.pop(conversation_id, None)
+            return entry[0] if entry else None
+
+    def evict_idle(self):
+        """Drop sessions idle for longer than idle_timeout and return their conversation IDs"""
+        with self._lock:
+            return self._evict_idle(time.monotonic())
+
+    def conversation_ids(self):
+        """Return active conversation IDs from least to most recently used"""
+        with self._lock:
+            return list(self._sessions)
+
+    def _touch(self, conversation_id, engine):
+        self._sessions[conversation_id] = (engine, time.monotonic())
+        self._sessions.move_to_end(conversation_id)
+
+    def _evict_idle(self, now):
+        evicted = []
+        # Sessions are ordered by last use, so the idle ones are always at the front
+        while self._sessions:
+            conversation_id, (engine, last_used) = next(iter(self._sessions.items()))
+            if now - last_used < self.idle_timeout:
+                break
+            del self._sessions[conversation_id]
+            evicted.append(conversation_id)
+
+        self.evicted_sessions += len(evicted)
+        return evicted
 
 # =============================
 # UI Update Functions
 # =============================
 def update_status(message):
+    """Log a status message and show it in the status bar"""
+    show_status(message)
+    print(f"🧠 SentriGuide: {message}")
+
+@on_ui_thread()
+def show_status(message):
     """Update modern status bar with animations"""
     if status_label:
+        ensure_ui_scaling(status_label)
         # Add status indicator based on message type
         if "error" in message.lower() or "failed" in message.lower():
             status_icon = "❌"
@@ -3349,41 +4278,39 @@ def update_status(message):
         except:
             pass  # Fallback if animation fails
 
-    print(f"🧠 SentriGuide: {message}")
-
+@on_ui_thread()
 def update_context_panel():
     """Update conversation context panel"""
     if context_panel:
-        context_panel.config(state=tk.NORMAL)
-        context_panel.delete(1.0, tk.END)
+        segments = []
 
         if conversation_summary:
-            context_panel.insert(tk.END, conversation_summary)
+            segments.append((conversation_summary, None))
         else:
             # Display helpful context management guide
-            context_panel.insert(tk.END, "🎯 CONTEXT MANAGER - CONVERSATION TRACKING\n\n")
-            context_panel.insert(tk.END, "💡 WHAT THIS DOES:\n")
-            context_panel.insert(tk.END, "• Summarizes long conversations to prevent context loss\n")
-            context_panel.insert(tk.END, "• Identifies main customer issues and conversation state\n")
-            context_panel.insert(tk.END, "• Tracks conversation progress and escalation needs\n")
-            context_panel.insert(tk.END, "• Provides customer communication profile analysis\n\n")
+            segments.append(("🎯 CONTEXT MANAGER - CONVERSATION TRACKING\n\n", None))
+            segments.append(("💡 WHAT THIS DOES:\n", None))
+            segments.append(("• Summarizes long conversations to prevent context loss\n", None))
+            segments.append(("• Identifies main customer issues and conversation state\n", None))
+            segments.append(("• Tracks conversation progress and escalation needs\n", None))
+            segments.append(("• Provides customer communication profile analysis\n\n", None))
 
-            context_panel.insert(tk.END, "📋 CONVERSATION ANALYSIS INCLUDES:\n")
-            context_panel.insert(tk.END, "• Main issue identification (virus, performance, email, etc.)\n")
-            context_panel.insert(tk.END, "• Total message count and conversation state\n")
-            context_panel.insert(tk.END, "• Customer communication style assessment\n")
-            context_panel.insert(tk.END, "• Latest customer concerns and progress notes\n")
-            context_panel.insert(tk.END, "• Escalation recommendations for long conversations\n\n")
+            segments.append(("📋 CONVERSATION ANALYSIS INCLUDES:\n", None))
+            segments.append(("• Main issue identification (virus, performance, email, etc.)\n", None))
+            segments.append(("• Total message count and conversation state\n", None))
+            segments.append(("• Customer communication style assessment\n", None))
+            segments.append(("• Latest customer concerns and progress notes\n", None))
+            segments.append(("• Escalation recommendations for long conversations\n\n", None))
 
-            context_panel.insert(tk.END, "🧠 Start a conversation with a customer to see automatic context analysis and conversation summarization.")
+            segments.append(("🧠 Start a conversation with a customer to see automatic context analysis and conversation summarization.", None))
 
-        context_panel.config(state=tk.DISABLED)
+        render_panel(context_panel, segments)
 
+@on_ui_thread()
 def update_sentiment_panel():
     """Update sentiment analysis panel"""
     if sentiment_panel:
-        sentiment_panel.config(state=tk.NORMAL)
-        sentiment_panel.delete(1.0, tk.END)
+        segments = []
 
         if conversation_history and customer_sentiment.get('analysis'):
             # Sentiment summary
@@ -3391,130 +4318,274 @@ def update_sentiment_panel():
             urgency = customer_sentiment.get('urgency', 'medium')
             satisfaction = customer_sentiment.get('satisfaction', 70)
 
-            sentiment_panel.insert(tk.END, f"😊 EMOTION: {emotion.upper()}\n", "emotion")
-            sentiment_panel.insert(tk.END, f"⚡ URGENCY: {urgency.upper()}\n", "urgency")
-            sentiment_panel.insert(tk.END, f"📊 SATISFACTION: {satisfaction}%\n\n", "satisfaction")
+            segments.append((f"😊 EMOTION: {emotion.upper()}\n", "emotion"))
+            segments.append((f"⚡ URGENCY: {urgency.upper()}\n", "urgency"))
+            segments.append((f"📊 SATISFACTION: {satisfaction}%\n\n", "satisfaction"))
 
             # Full analysis
             analysis = customer_sentiment.get('analysis', 'No analysis yet')
-            sentiment_panel.insert(tk.END, analysis, "analysis")
+            segments.append((analysis, "analysis"))
         else:
             # Display emotion alignment guide
-            sentiment_panel.insert(tk.END, "💝 EMOTION ALIGNMENT - CUSTOMER SENTIMENT ANALYSIS\n\n", "emotion")
-            sentiment_panel.insert(tk.END, "💡 WHAT THIS DOES:\n")
-            sentiment_panel.insert(tk.END, "• Analyzes customer emotion and satisfaction levels\n")
-            sentiment_panel.insert(tk.END, "• Provides tone recommendations for your responses\n")
-            sentiment_panel.insert(tk.END, "• Identifies urgency levels and empathy triggers\n")
-            sentiment_panel.insert(tk.END, "• Suggests response approaches based on customer mood\n\n")
+            segments.append(("💝 EMOTION ALIGNMENT - CUSTOMER SENTIMENT ANALYSIS\n\n", "emotion"))
+            segments.append(("💡 WHAT THIS DOES:\n", None))
+            segments.append(("• Analyzes customer emotion and satisfaction levels\n", None))
+            segments.append(("• Provides tone recommendations for your responses\n", None))
+            segments.append(("• Identifies urgency levels and empathy triggers\n", None))
+            segments.append(("• Suggests response approaches based on customer mood\n\n", None))
 
-            sentiment_panel.insert(tk.END, "😊 EMOTION DETECTION:\n", "emotion")
-            sentiment_panel.insert(tk.END, "• Frustrated: Use empathetic language, acknowledge concerns\n")
-            sentiment_panel.insert(tk.END, "• Urgent: Prioritize quick response, be direct\n")
-            sentiment_panel.insert(tk.END, "• Confused: Use clear, simple language, be patient\n")
-            sentiment_panel.insert(tk.END, "• Satisfied: Maintain professional tone, ensure completeness\n\n")
+            segments.append(("😊 EMOTION DETECTION:\n", "emotion"))
+            segments.append(("• Frustrated: Use empathetic language, acknowledge concerns\n", None))
+            segments.append(("• Urgent: Prioritize quick response, be direct\n", None))
+            segments.append(("• Confused: Use clear, simple language, be patient\n", None))
+            segments.append(("• Satisfied: Maintain professional tone, ensure completeness\n\n", None))
 
-            sentiment_panel.insert(tk.END, "⚡ URGENCY LEVELS:\n", "urgency")
-            sentiment_panel.insert(tk.END, "• High: Emergency/critical issues, immediate action needed\n")
-            sentiment_panel.insert(tk.END, "• Medium: Standard timeline expectations\n")
-            sentiment_panel.insert(tk.END, "• Low: No time pressure, thorough response preferred\n\n")
+            segments.append(("⚡ URGENCY LEVELS:\n", "urgency"))
+            segments.append(("• High: Emergency/critical issues, immediate action needed\n", None))
+            segments.append(("• Medium: Standard timeline expectations\n", None))
+            segments.append(("• Low: No time pressure, thorough response preferred\n\n", None))
 
-            sentiment_panel.insert(tk.END, "🧠 Start chatting with customers to see real-time sentiment analysis and tone recommendations.", "analysis")
+            segments.append(("🧠 Start chatting with customers to see real-time sentiment analysis and tone recommendations.", "analysis"))
 
-        sentiment_panel.config(state=tk.DISABLED)
+        render_panel(sentiment_panel, segments)
 
+@on_ui_thread()
 def update_confidence_panel():
     """Update resolution confidence panel"""
     if confidence_panel:
-        confidence_panel.config(state=tk.NORMAL)
-        confidence_panel.delete(1.0, tk.END)
+        segments = []
 
         if not conversation_history:
             # Display default Resolution Guard guidance when no conversation
-            confidence_panel.insert(tk.END, "🛡️ RESOLUTION GUARD - CASE CLOSURE QUALITY CONTROL\n\n", "header")
-            confidence_panel.insert(tk.END, "💡 READY TO CLOSE A CASE? USE THIS GUIDE:\n\n", "header")
-
-            confidence_panel.insert(tk.END, "✅ CONFIDENCE SCORE GUIDE:\n", "high")
-            confidence_panel.insert(tk.END, "• 90-100%: SAFE TO CLOSE - Customer confirmed satisfaction\n")
-            confidence_panel.insert(tk.END, "• 70-89%: REQUIRES VERIFICATION - Get explicit confirmation\n")
-            confidence_panel.insert(tk.END, "• 0-69%: DO NOT CLOSE - Continue troubleshooting\n\n")
-
-            confidence_panel.insert(tk.END, "🚫 RED FLAGS - NEVER CLOSE WHEN:\n", "low")
-            confidence_panel.insert(tk.END, "• Customer says 'I'll try this later' without testing\n")
-            confidence_panel.insert(tk.END, "• Customer stops responding mid-conversation\n")
-            confidence_panel.insert(tk.END, "• Multiple solutions provided but none confirmed working\n")
-            confidence_panel.insert(tk.END, "• Customer asks follow-up questions about solution\n")
-            confidence_panel.insert(tk.END, "• Customer expresses frustration or dissatisfaction\n\n")
-
-            confidence_panel.insert(tk.END, "✅ GREEN SIGNALS - SAFE TO CLOSE:\n", "high")
-            confidence_panel.insert(tk.END, "• 'Yes, that fixed it completely'\n")
-            confidence_panel.insert(tk.END, "• 'Everything is working perfectly now'\n")
-            confidence_panel.insert(tk.END, "• 'Thank you, my issue is resolved'\n")
-            confidence_panel.insert(tk.END, "• Customer demonstrates successful completion\n\n")
-
-            confidence_panel.insert(tk.END, "💬 CONFIRMATION QUESTIONS TO ASK:\n", "medium")
-            confidence_panel.insert(tk.END, "• 'Can you confirm that [issue] is now working correctly?'\n")
-            confidence_panel.insert(tk.END, "• 'Are you able to [action] without any errors?'\n")
-            confidence_panel.insert(tk.END, "• 'Is there anything else I can help you with?'\n")
-            confidence_panel.insert(tk.END, "• 'How would you rate your satisfaction with this resolution?'\n\n")
-
-            confidence_panel.insert(tk.END, "🧠 SentriGuide will analyze your conversation and provide resolution confidence scoring once you start chatting with customers.", "analysis")
+            segments.append(("🛡️ RESOLUTION GUARD - CASE CLOSURE QUALITY CONTROL\n\n", "header"))
+            segments.append(("💡 READY TO CLOSE A CASE? USE THIS GUIDE:\n\n", "header"))
+
+            segments.append(("✅ CONFIDENCE SCORE GUIDE:\n", "high"))
+            segments.append(("• 90-100%: SAFE TO CLOSE - Customer confirmed satisfaction\n", None))
+            segments.append(("• 70-89%: REQUIRES VERIFICATION - Get explicit confirmation\n", None))
+            segments.append(("• 0-69%: DO NOT CLOSE - Continue troubleshooting\n\n", None))
+
+            segments.append(("🚫 RED FLAGS - NEVER CLOSE WHEN:\n", "low"))
+            segments.append(("• Customer says 'I'll try this later' without testing\n", None))
+            segments.append(("• Customer stops responding mid-conversation\n", None))
+            segments.append(("• Multiple solutions provided but none confirmed working\n", None))
+            segments.append(("• Customer asks follow-up questions about solution\n", None))
+            segments.append(("• Customer expresses frustration or dissatisfaction\n\n", None))
+
+            segments.append(("✅ GREEN SIGNALS - SAFE TO CLOSE:\n", "high"))
+            segments.append(("• 'Yes, that fixed it completely'\n", None))
+            segments.append(("• 'Everything is working perfectly now'\n", None))
+            segments.append(("• 'Thank you, my issue is resolved'\n", None))
+            segments.append(("• Customer demonstrates successful completion\n\n", None))
+
+            segments.append(("💬 CONFIRMATION QUESTIONS TO ASK:\n", "medium"))
+            segments.append(("• 'Can you confirm that [issue] is now working correctly?'\n", None))
+            segments.append(("• 'Are you able to [action] without any errors?'\n", None))
+            segments.append(("• 'Is there anything else I can help you with?'\n", None))
+            segments.append(("• 'How would you rate your satisfaction with this resolution?'\n\n", None))
+
+            segments.append(("🧠 SentriGuide will analyze your conversation and provide resolution confidence scoring once you start chatting with customers.", "analysis"))
         else:
             # Display actual confidence analysis when conversation exists
             color = "high" if resolution_confidence >= 80 else "medium" if resolution_confidence >= 60 else "low"
 
-            confidence_panel.insert(tk.END, f"🎯 RESOLUTION CONFIDENCE\n", "header")
-            confidence_panel.insert(tk.END, f"{resolution_confidence}%\n\n", color)
+            segments.append((f"🎯 RESOLUTION CONFIDENCE\n", "header"))
+            segments.append((f"{resolution_confidence}%\n\n", color))
 
             # Analysis
             analysis = globals().get('resolution_analysis', 'No analysis yet')
-            confidence_panel.insert(tk.END, analysis, "analysis")
+            segments.append((analysis, "analysis"))
 
-        confidence_panel.config(state=tk.DISABLED)
+        render_panel(confidence_panel, segments)
 
+@on_ui_thread()
 def update_knowledge_panel():
     """Update knowledge suggestions panel"""
     if knowledge_panel:
-        knowledge_panel.config(state=tk.NORMAL)
-        knowledge_panel.delete(1.0, tk.END)
+        segments = []
 
         if knowledge_suggestions:
-            knowledge_panel.insert(tk.END, knowledge_suggestions)
+            segments.append((knowledge_suggestions, None))
         else:
             # Display knowledge efficiency guide
-            knowledge_panel.insert(tk.END, "📚 TREND MICRO HELP CENTER - KNOWLEDGE EFFICIENCY\n\n")
-            knowledge_panel.insert(tk.END, "💡 WHAT THIS DOES:\n")
-            knowledge_panel.insert(tk.END, "• Automatically searches Trend Micro Help Center based on customer queries\n")
-            knowledge_panel.insert(tk.END, "• Provides detailed, actionable solutions instead of generic links\n")
-            knowledge_panel.insert(tk.END, "• Prioritizes specific issue types (renewal, installation, billing, etc.)\n")
-            knowledge_panel.insert(tk.END, "• Tracks solution history for reference and consistency\n\n")
-
-            knowledge_panel.insert(tk.END, "🎯 PRIORITY DETECTION FOR:\n")
-            knowledge_panel.insert(tk.END, "• 🔄 Renewal & Subscription Issues - Step-by-step renewal guides\n")
-            knowledge_panel.insert(tk.END, "• 💻 Installation & Activation - Complete setup procedures\n")
-            knowledge_panel.insert(tk.END, "• 🛡️ ID Protection & Password Manager - Security feature setup\n")
-            knowledge_panel.insert(tk.END, "• 🌐 VPN & Web Protection - Network security configuration\n")
-            knowledge_panel.insert(tk.END, "• 💳 Billing & Refunds - Payment and refund procedures\n")
-            knowledge_panel.insert(tk.END, "• ⚠️ Technical Errors - Troubleshooting and error resolution\n")
-            knowledge_panel.insert(tk.END, "• 🔐 Account Portal Issues - Login and account access problems\n")
-            knowledge_panel.insert(tk.END, "• ✅ Resolution Guard - Case closure and quality control\n\n")
-
-            knowledge_panel.insert(tk.END, "📋 COMPREHENSIVE SOLUTIONS INCLUDE:\n")
-            knowledge_panel.insert(tk.END, "• Detailed step-by-step instructions\n")
-            knowledge_panel.insert(tk.END, "• Common troubleshooting scenarios\n")
-            knowledge_panel.insert(tk.END, "• Error resolution procedures\n")
-            knowledge_panel.insert(tk.END, "• Contact information for escalation\n")
-            knowledge_panel.insert(tk.END, "• Best practices and preventive measures\n\n")
-
-            knowledge_panel.insert(tk.END, "🧠 Start a customer conversation to see automatic knowledge surfacing and solution recommendations.")
-
-        knowledge_panel.config(state=tk.DISABLED)
+            segments.append(("📚 TREND MICRO HELP CENTER - KNOWLEDGE EFFICIENCY\n\n", None))
+            segments.append(("💡 WHAT THIS DOES:\n", None))
+            segments.append(("• Automatically searches Trend Micro Help Center based on customer queries\n", None))
+            segments.append(("• Provides detailed, actionable solutions instead of generic links\n", None))
+            segments.append(("• Prioritizes specific issue types (renewal, installation, billing, etc.)\n", None))
+            segments.append(("• Tracks solution history for reference and consistency\n\n", None))
+
+            segments.append(("🎯 PRIORITY DETECTION FOR:\n", None))
+            segments.append(("• 🔄 Renewal & Subscription Issues - Step-by-step renewal guides\n", None))
+            segments.append(("• 💻 Installation & Activation - Complete setup procedures\n", None))
+            segments.append(("• 🛡️ ID Protection & Password Manager - Security feature setup\n", None))
+            segments.append(("• 🌐 VPN & Web Protection - Network security configuration\n", None))
+            segments.append(("• 💳 Billing & Refunds - Payment and refund procedures\n", None))
+            segments.append(("• ⚠️ Technical Errors - Troubleshooting and error resolution\n", None))
+            segments.append(("• 🔐 Account Portal Issues - Login and account access problems\n", None))
+            segments.append(("• ✅ Resolution Guard - Case closure and quality control\n\n", None))
+
+            segments.append(("📋 COMPREHENSIVE SOLUTIONS INCLUDE:\n", None))
+            segments.append(("• Detailed step-by-step instructions\n", None))
+            segments.append(("• Common troubleshooting scenarios\n", None))
+            segments.append(("• Error resolution procedures\n", None))
+            segments.append(("• Contact information for escalation\n", None))
+            segments.append(("• Best practices and preventive measures\n\n", None))
+
+            segments.append(("🧠 Start a customer conversation to see automatic knowledge surfacing and solution recommendations.", None))
+
+        render_panel(knowledge_panel, segments)
+
+class VirtualTranscript:
+    """Chat transcript that renders only a window of messages from a backing message list
+
+    At most `window` messages are kept in the Text widget, so memory and redraw
+    cost stay flat however long the chat gets. The scrollbar spans the whole
+    transcript; scrolling to the edge of the rendered window moves the window by
+    `step` messages. New messages are appended while the view follows the end of
+    the chat, and a cleared or replaced message list is re-rendered from its tail.
+    """
+
+    def __init__(self, parent, engineer_label="You", window=TRANSCRIPT_WINDOW_MESSAGES, step=TRANSCRIPT_SCROLL_STEP, **text_options):
+        self.engineer_label = engineer_label
+        self.window = window
+        self.step = step
+        self.frame = tk.Frame(parent, bg=text_options.get('bg'))
+        self.scrollbar = tk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.on_scrollbar)
+        self.scrollbar.pack(side='right', fill='y')
+        self.text = tk.Text(self.frame, yscrollcommand=self.on_text_scroll, **text_options)
+        self.text.pack(side='left', fill='both', expand=True)
+        self.text.config(state=tk.DISABLED)
+        self.pack = self.frame.pack
+        self.tag_config = self.text.tag_config
+        self._shift_pending = False
+        self.messages = None
+        self.known = 0  # Messages of the backing list seen so far
+        self._last_message = None
+        self.first = 0  # Index of the first rendered message
+        self.line_starts = []  # Text line on which each rendered message starts
+
+    def is_current(self, messages):
+        """Whether every message in `messages` has already been seen"""
+        return (messages is self.messages and len(messages) == self.known
+                and (not messages or messages[-1] is self._last_message))
+
+    def sync(self, messages):
+        """Show the messages appended to `messages` since the last sync; returns False when there was nothing new"""
+        if self.is_current(messages):
+            return False
+
+        if (messages is not self.messages or len(messages) < self.known
+                or (self.known and messages[self.known - 1] is not self._last_message)):
+            self.messages = messages
+            self._mark_seen()
+            self.render_window(max(0, self.known - self.window))
+            return True
+
+        following = self.first + len(self.line_starts) == self.known and self.text.yview()[1] >= 1.0
+        previously_known = self.known
+        self._mark_seen()
+        if not following:
+            self.on_text_scroll(*self.text.yview())  # Only the scrollbar changes until the user scrolls down
+        elif self.known - previously_known >= self.window:
+            self.render_window(self.known - self.window)
+        else:
+            self.text.config(state=tk.NORMAL)
+            for message in itertools.islice(self.messages, previously_known, self.known):
+                self._insert(message)
+            self._trim_top(len(self.line_starts) - self.window)
+            self.text.config(state=tk.DISABLED)
+            self.text.see(tk.END)
+        return True
+
+    def render_window(self, first, anchor=None):
+        """Render the messages from `first` on; `anchor` is the message to scroll to the top, else the end is shown"""
+        self.first = first
+        self.text.config(state=tk.NORMAL)
+        self.text.delete(1.0, tk.END)
+        self.line_starts = []
+        for message in itertools.islice(self.messages or (), first, min(self.known, first + self.window)):
+            self._insert(message)
+        self.text.config(state=tk.DISABLED)
+
+        if anchor is not None and self.line_starts:
+            self.text.yview(f"{self.line_starts[min(max(anchor - first, 0), len(self.line_starts) - 1)]}.0")
+        else:
+            self.text.see(tk.END)
+
+    def top_message(self):
+        """Index of the message at the top of the view"""
+        line = int(self.text.index("@0,0").split(".")[0])
+        return self.first + max(0, bisect.bisect_right(self.line_starts, line) - 1)
+
+    def on_text_scroll(self, lo, hi):
+        """Mirror the text view onto the transcript-wide scrollbar and move the window at its edges"""
+        lo, hi = float(lo), float(hi)
+        rendered = len(self.line_starts)
+        total = max(self.known, 1)
+        self.scrollbar.set((self.first + lo * rendered) / total, (self.first + hi * rendered) / total)
+
+        at_window_top = lo <= 0.0 and self.first > 0
+        at_window_bottom = hi >= 1.0 and self.first + rendered < self.known
+        if (at_window_top or at_window_bottom) and not self._shift_pending:
+            self._shift_pending = True
+            self.text.after_idle(self._shift_window)
+
+    def on_scrollbar(self, *args):
+        """Scrollbar command: jumps outside the rendered window re-render around the target message"""
+        if args[0] != "moveto" or not self.line_starts:
+            self.text.yview(*args)
+            return
+
+        target = min(int(float(args[1]) * self.known), max(self.known - 1, 0))
+        rendered = len(self.line_starts)
+        if self.first <= target < self.first + rendered:
+            self.text.yview_moveto((target - self.first) / rendered)
+        else:
+            self.render_window(max(0, min(target - self.window // 2, self.known - self.window)), anchor=target)
+
+    def _shift_window(self):
+        self._shift_pending = False
+        lo, hi = self.text.yview()
+        top = self.top_message()
+        if lo <= 0.0 and self.first > 0:
+            self.render_window(max(0, self.first - self.step), anchor=top)
+        elif hi >= 1.0 and self.first + len(self.line_starts) < self.known:
+            self.render_window(min(self.first + self.step, max(0, self.known - self.window), top), anchor=top)
+
+    def _mark_seen(self):
+        self.known = len(self.messages)
+        self._last_message = self.messages[-1] if self.messages else None
+
+    def _insert(self, message):
+        self.line_starts.append(int(self.text.index("end-1c").split(".")[0]))
+        timestamp = message.get('timestamp', datetime.datetime.now().strftime("%H:%M"))
+        if message["role"] == "customer":
+            self.text.insert(tk.END, f"\n[{timestamp}] ", "timestamp")
+            self.text.insert(tk.END, "Customer", "customer_name")
+            self.text.insert(tk.END, f": {message['content']}\n", "customer_message")
+        elif message["role"] == "engineer":
+            self.text.insert(tk.END, f"\n[{timestamp}] ", "timestamp")
+            self.text.insert(tk.END, self.engineer_label, "engineer_name")
+            self.text.insert(tk.END, f": {message['content']}\n", "engineer_message")
+        elif message["role"] == "system":
+            self.text.insert(tk.END, f"\n[{timestamp}] {message['content']}\n\n", "system")
+
+    def _trim_top(self, count):
+        """Drop the first `count` rendered messages"""
+        if count <= 0:
+            return
+        removed_lines = self.line_starts[count] - self.line_starts[0]
+        self.text.delete(1.0, f"{self.line_starts[count]}.0")
+        self.line_starts = [line - removed_lines for line in self.line_starts[count:]]
+        self.first += count
 
 # =============================
 # Conversation Management
 # =============================
 def end_conversation():
     """End current conversation and reset all analysis"""
-    global conversation_history, conversation_summary, customer_sentiment, resolution_confidence, knowledge_suggestions, is_processing, conversation_ended
+    global conversation_history, conversation_summary, customer_sentiment, resolution_confidence, knowledge_suggestions, knowledge_generation, conversation_ended
 
     if not conversation_history:
         messagebox.showinfo("No Conversation", "There is no active conversation to end.")
@@ -3540,45 +4611,19 @@ def end_conversation():
         final_conversation = conversation_history.copy()
 
         # Update both chat windows with the final state
-        if engineer_chat_window:
-            engineer_chat_window.config(state=tk.NORMAL)
-            engineer_chat_window.delete(1.0, tk.END)
-
-            for msg in final_conversation:
-                msg_timestamp = msg.get('timestamp', datetime.datetime.now().strftime("%H:%M"))
-                if msg["role"] == "customer":
-                    engineer_chat_window.insert(tk.END, f"[{msg_timestamp}] Customer: {msg['content']}\n", "customer")
-                elif msg["role"] == "engineer":
-                    engineer_chat_window.insert(tk.END, f"[{msg_timestamp}] You: {msg['content']}\n", "engineer")
-                elif msg["role"] == "system":
-                    engineer_chat_window.insert(tk.END, f"\n[{msg_timestamp}] {msg['content']}\n\n", "system")
-
-            engineer_chat_window.config(state=tk.DISABLED)
-            engineer_chat_window.see(tk.END)
-
-        if customer_simulation_window:
-            customer_simulation_window.config(state=tk.NORMAL)
-            customer_simulation_window.delete(1.0, tk.END)
-
-            for msg in final_conversation:
-                msg_timestamp = msg.get('timestamp', datetime.datetime.now().strftime("%H:%M"))
-                if msg["role"] == "customer":
-                    customer_simulation_window.insert(tk.END, f"[{msg_timestamp}] Customer: {msg['content']}\n", "customer")
-                elif msg["role"] == "engineer":
-                    customer_simulation_window.insert(tk.END, f"[{msg_timestamp}] Support: {msg['content']}\n", "engineer")
-                elif msg["role"] == "system":
-                    customer_simulation_window.insert(tk.END, f"\n[{msg_timestamp}] {msg['content']}\n\n", "system")
-
-            customer_simulation_window.config(state=tk.DISABLED)
-            customer_simulation_window.see(tk.END)
+        for transcript in (engineer_chat_window, customer_simulation_window):
+            if transcript:
+                transcript.sync(final_conversation)
 
         # Clear all analysis data
         conversation_history.clear()
+        conversation_summarizer.reset()
+        conversation_compactor.reset()
         conversation_summary = ""
         customer_sentiment = {"emotion": "neutral", "urgency": "medium", "satisfaction": 70}
         resolution_confidence = 0
         knowledge_suggestions = ""
-        is_processing = False
+        knowledge_generation += 1  # Ignore article pages still loading for the ended conversation
 
         # Set flag to indicate conversation has ended (prevent auto-refresh from clearing)
         globals()['conversation_ended'] = True
@@ -3610,6 +4655,7 @@ def create_customer_simulation():
     global customer_simulation_window
 
     sim_window = tk.Toplevel()
+    ensure_ui_scaling(sim_window)
     sim_window.title("Customer Chat Simulation - SentriGuide AI")
 
     # Calculate responsive dimensions
@@ -3691,12 +4737,11 @@ def create_customer_simulation():
     chat_height = max(18, int(22 * SCALE_FACTOR))
     chat_width = max(55, int(75 * SCALE_FACTOR))
 
-    chat_display = scrolledtext.ScrolledText(chat_container, height=chat_height, width=chat_width,
-                                            bg=SENTRIGUIDE_THEME['bg_surface'], fg=SENTRIGUIDE_THEME['text_primary'],
-                                            font=(SENTRIGUIDE_THEME['font_primary'], SENTRIGUIDE_THEME['font_size_medium']),
-                                            relief='flat', bd=0, wrap='word', padx=SENTRIGUIDE_THEME['spacing_md'], pady=SENTRIGUIDE_THEME['spacing_sm'])
+    chat_display = VirtualTranscript(chat_container, engineer_label="Support", height=chat_height, width=chat_width,
+                                     bg=SENTRIGUIDE_THEME['bg_surface'], fg=SENTRIGUIDE_THEME['text_primary'],
+                                     font=(SENTRIGUIDE_THEME['font_primary'], SENTRIGUIDE_THEME['font_size_medium']),
+                                     relief='flat', bd=0, wrap='word', padx=SENTRIGUIDE_THEME['spacing_md'], pady=SENTRIGUIDE_THEME['spacing_sm'])
     chat_display.pack(fill='both', expand=True, padx=SENTRIGUIDE_THEME['spacing_lg'], pady=(SENTRIGUIDE_THEME['spacing_sm'], SENTRIGUIDE_THEME['spacing_md']))
-    chat_display.config(state=tk.DISABLED)
 
     customer_simulation_window = chat_display
 
@@ -3748,12 +4793,7 @@ def create_customer_simulation():
             conversation_history.append({"role": "customer", "content": message, "timestamp": timestamp})
 
             # Update chat display with modern message styling
-            chat_display.config(state=tk.NORMAL)
-            chat_display.insert(tk.END, f"\n[{timestamp}] ", "timestamp")
-            chat_display.insert(tk.END, "Customer", "customer_name")
-            chat_display.insert(tk.END, f": {message}\n", "customer_message")
-            chat_display.config(state=tk.DISABLED)
-            chat_display.see(tk.END)
+            chat_display.sync(conversation_history)
 
             customer_entry.delete(0, tk.END)
             typing_label.config(text="")
@@ -3823,6 +4863,7 @@ def create_ai_analysis_popup(parent_window):
 
     # Create popup window
     popup = tk.Toplevel(parent_window)
+    ensure_ui_scaling(popup)
     popup.title("SentriGuide AI Analysis Dashboard")
     popup.geometry("1000x700")
     popup.configure(bg=SENTRIGUIDE_THEME['bg_primary'])
@@ -3883,6 +4924,8 @@ def create_analysis_notebook(container):
     global context_panel, sentiment_panel, confidence_panel, knowledge_panel, coaching_panel
     global solution_history_panel, solution_history_var, solution_history_dropdown
 
+    ensure_ui_scaling(container)
+
     # Modern notebook for AI panels with custom styling
     style = ttk.Style()
     try:
@@ -3909,6 +4952,8 @@ def create_analysis_panels(notebook, parent_window):
     global context_panel, sentiment_panel, confidence_panel, knowledge_panel, coaching_panel
     global solution_history_panel, solution_history_var, solution_history_dropdown
 
+    ensure_ui_scaling(parent_window)
+
     # Calculate responsive dimensions for analysis panels
     panel_height = max(20, int(25 * SCALE_FACTOR))
     panel_width = max(60, int(70 * SCALE_FACTOR))
@@ -4059,7 +5104,7 @@ def create_analysis_panels(notebook, parent_window):
     knowledge_panel.config(state=tk.DISABLED)
 
 def update_all_panels():
-    """Update all analysis panels with current data"""
+    """Update all analysis panels with current data (unchanged panels are left untouched)"""
     update_context_panel()
     update_sentiment_panel()
     update_confidence_panel()
@@ -4076,6 +5121,8 @@ def create_sentriguide_interface():
 
     main_window = tk.Tk()
     main_window.title("SentriGuide AI - Support Engineer Conscience")
+    ui_updates.attach(main_window)  # Worker threads paint panels through the main loop from here on
+    ensure_ui_scaling(main_window)  # Measure the screen through the real root, not a throwaway one
 
     # Calculate responsive dimensions for main window
     base_width, base_height = 1500, 950
@@ -4170,15 +5217,14 @@ def create_sentriguide_interface():
     engineer_height = max(22, int(28 * SCALE_FACTOR))
     engineer_width = max(55, int(70 * SCALE_FACTOR))
 
-    engineer_chat_window = scrolledtext.ScrolledText(left_panel, height=engineer_height, width=engineer_width,
-                                                    bg=SENTRIGUIDE_THEME['bg_surface'], fg=SENTRIGUIDE_THEME['text_primary'],
-                                                    font=(SENTRIGUIDE_THEME['font_primary'], SENTRIGUIDE_THEME['font_size_medium']),
-                                                    relief='flat', bd=0, wrap='word',
-                                                    padx=SENTRIGUIDE_THEME['spacing_md'], pady=SENTRIGUIDE_THEME['spacing_sm'],
-                                                    highlightthickness=1, highlightcolor=SENTRIGUIDE_THEME['primary'],
-                                                    highlightbackground=SENTRIGUIDE_THEME['divider'])
+    engineer_chat_window = VirtualTranscript(left_panel, height=engineer_height, width=engineer_width,
+                                             bg=SENTRIGUIDE_THEME['bg_surface'], fg=SENTRIGUIDE_THEME['text_primary'],
+                                             font=(SENTRIGUIDE_THEME['font_primary'], SENTRIGUIDE_THEME['font_size_medium']),
+                                             relief='flat', bd=0, wrap='word',
+                                             padx=SENTRIGUIDE_THEME['spacing_md'], pady=SENTRIGUIDE_THEME['spacing_sm'],
+                                             highlightthickness=1, highlightcolor=SENTRIGUIDE_THEME['primary'],
+                                             highlightbackground=SENTRIGUIDE_THEME['divider'])
     engineer_chat_window.pack(fill='both', expand=True, padx=SENTRIGUIDE_THEME['spacing_lg'], pady=(0, SENTRIGUIDE_THEME['spacing_md']))
-    engineer_chat_window.config(state=tk.DISABLED)
 
     # Modern engineer input section
     engineer_input_frame = tk.Frame(left_panel, bg=SENTRIGUIDE_THEME['bg_surface'])
@@ -4227,20 +5273,9 @@ def create_sentriguide_interface():
             conversation_history.append({"role": "engineer", "content": message, "timestamp": timestamp})
 
             # Update both chat windows with modern styling
-            engineer_chat_window.config(state=tk.NORMAL)
-            engineer_chat_window.insert(tk.END, f"\n[{timestamp}] ", "timestamp")
-            engineer_chat_window.insert(tk.END, "You", "engineer_name")
-            engineer_chat_window.insert(tk.END, f": {message}\n", "engineer_message")
-            engineer_chat_window.config(state=tk.DISABLED)
-            engineer_chat_window.see(tk.END)
-
+            engineer_chat_window.sync(conversation_history)
             if customer_simulation_window:
-                customer_simulation_window.config(state=tk.NORMAL)
-                customer_simulation_window.insert(tk.END, f"\n[{timestamp}] ", "timestamp")
-                customer_simulation_window.insert(tk.END, "Support", "engineer_name")
-                customer_simulation_window.insert(tk.END, f": {message}\n", "engineer_message")
-                customer_simulation_window.config(state=tk.DISABLED)
-                customer_simulation_window.see(tk.END)
+                customer_simulation_window.sync(conversation_history)
 
             engineer_entry.delete(0, tk.END)
             response_status.config(text="")
@@ -4419,35 +5454,13 @@ def create_sentriguide_interface():
     engineer_chat_window.tag_config("customer", foreground=SENTRIGUIDE_THEME['primary'], font=(SENTRIGUIDE_THEME['font_primary'], SENTRIGUIDE_THEME['font_size_medium'], 'bold'))
     engineer_chat_window.tag_config("engineer", foreground=SENTRIGUIDE_THEME['success'], font=(SENTRIGUIDE_THEME['font_primary'], SENTRIGUIDE_THEME['font_size_medium'], 'bold'))
 
-    # Auto-refresh conversation display
+    # Auto-refresh conversation display: only messages added since the last tick are inserted
     def refresh_conversation():
-        global conversation_ended, ended_conversation_display
-
         # Skip refresh if conversation has ended (display is already set)
-        if conversation_ended:
-            main_window.after(2000, refresh_conversation)
-            return
-
-        engineer_chat_window.config(state=tk.NORMAL)
-        engineer_chat_window.delete(1.0, tk.END)
-
-        for msg in conversation_history:
-            timestamp = msg.get('timestamp', datetime.datetime.now().strftime("%H:%M"))
-            if msg["role"] == "customer":
-                engineer_chat_window.insert(tk.END, f"\n[{timestamp}] ", "timestamp")
-                engineer_chat_window.insert(tk.END, "Customer", "customer_name")
-                engineer_chat_window.insert(tk.END, f": {msg['content']}\n", "customer_message")
-            elif msg["role"] == "engineer":
-                engineer_chat_window.insert(tk.END, f"\n[{timestamp}] ", "timestamp")
-                engineer_chat_window.insert(tk.END, "You", "engineer_name")
-                engineer_chat_window.insert(tk.END, f": {msg['content']}\n", "engineer_message")
-            elif msg["role"] == "system":
-                engineer_chat_window.insert(tk.END, f"\n[{timestamp}] {msg['content']}\n\n", "system")
-
-        engineer_chat_window.config(state=tk.DISABLED)
-        engineer_chat_window.see(tk.END)
+        if not conversation_ended:
+            engineer_chat_window.sync(conversation_history)
 
-        main_window.after(2000, refresh_conversation)
+        main_window.after(CHAT_REFRESH_MS, refresh_conversation)
 
     refresh_conversation()
 
@@ -4471,7 +5484,6 @@ def main():
     print("   3. Premature case resolution")
     print("   4. Inefficient Trend Micro knowledge searching")
     print("   5. Performance coaching and real-time feedback")
-    print(f"📱 Responsive UI scaling: {SCALE_FACTOR:.2f}x ({SCREEN_INFO['screen_width']}x{SCREEN_INFO['screen_height']})")
     print(f"🎨 Modern design system with 8px grid and improved spacing")
 
     # Setup system (no API required)
@@ -4482,6 +5494,7 @@ def main():
     try:
         # Create main interface
         main_window = create_sentriguide_interface()
+        print(f"📱 Responsive UI scaling: {SCALE_FACTOR:.2f}x ({SCREEN_INFO['screen_width']}x{SCREEN_INFO['screen_height']})")
 
         # Automatically create customer simulation window
         main_window.after(500, create_customer_simulation)
@@ -4508,5 +5521,60 @@ def main():
         print(f"❌ Application error: {str(e)}")
         messagebox.showerror("SentriGuide Error", f"Application error: {str(e)}")
 
+def run_cli(argv=None):
+    """Command-line entry point: the desktop app by default, or a maintenance subcommand"""
+    parser = argparse.ArgumentParser(prog="SentriGuide_AI.py", description="SentriGuide AI support engineer conscience")
+    subcommands = parser.add_subparsers(dest="command")
+
+    pack_parser = subcommands.add_parser("build-knowledge-pack", help="write the bundled guides to a knowledge pack")
+    pack_parser.add_argument("path", nargs="?", default=KNOWLEDGE_PACK_PATH)
+
+    standin_parser = subcommands.add_parser("serve-llm-standin", help="run a local messages API stand-in")
+    standin_parser.add_argument("port", nargs="?", type=int, default=8765)
+
+    helpcenter_parser = subcommands.add_parser("serve-help-center", help="run a local Help Center stand-in serving recorded pages")
+    helpcenter_parser.add_argument("port", nargs="?", type=int, default=8766)
+    helpcenter_parser.add_argument("--fixtures", default=HELP_CENTER_FIXTURES_PATH, help="directory of HTML fixtures")
+    helpcenter_parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    helpcenter_parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with a 503")
+    helpcenter_parser.add_argument("--page-size", type=int, default=0, help="minimum page size in bytes")
+
+    replay_parser = subcommands.add_parser("replay", help="re-score JSONL transcripts headlessly")
+    replay_parser.add_argument("paths", nargs="+", help="JSONL transcript files or directories of them")
+    replay_parser.add_argument("-o", "--output", default="-", help="file for per-message results (default: stdout)")
+    replay_parser.add_argument("-w", "--workers", type=int, default=REPLAY_WORKERS, help="worker processes")
+    replay_parser.add_argument("--offline", action="store_true", help="never contact the Help Center")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build-knowledge-pack":
+        from SentriGuide_Articles import FALLBACK_ARTICLES
+        print(f"📦 Wrote {build_knowledge_pack(args.path, FALLBACK_ARTICLES)} articles to {args.path}")
+    elif args.command == "serve-llm-standin":
+        standin = LocalMessagesServer(port=args.port)
+        print(f"🧪 Local messages API stand-in listening on {standin.url} (Ctrl+C to stop)")
+        try:
+            standin.httpd.serve_forever()
+        except KeyboardInterrupt:
+            standin.stop()
+    elif args.command == "serve-help-center":
+        standin = LocalHelpCenterServer(port=args.port, fixtures_path=args.fixtures, latency=args.latency,
+                                        error_rate=args.error_rate, page_size=args.page_size)
+        print(f"🧪 Local Help Center stand-in listening on {standin.url} (Ctrl+C to stop)")
+        try:
+            standin.httpd.serve_forever()
+        except KeyboardInterrupt:
+            standin.stop()
+    elif args.command == "replay":
+        if args.output == "-":
+            stats = replay_transcripts(args.paths, sys.stdout, args.workers, args.offline)
+        else:
+            with open(args.output, "w", encoding="utf-8") as output:
+                stats = replay_transcripts(args.paths, output, args.workers, args.offline)
+        print(f"🔁 Replayed {stats['conversations']} conversations ({stats['messages']} messages) in {stats['elapsed_s']}s: "
+              f"{stats['messages_per_s']} msg/s, p50 {stats.get('p50_ms', 0)}ms, p99 {stats.get('p99_ms', 0)}ms", file=sys.stderr)
+    else:
+        main()
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_cli()
@@ -0,0 +1,1456 @@
+"""Built-in fallback Trend Micro help articles for SentriGuide AI
+
+Imported lazily by SentriGuide_AI when no knowledge pack is available, and used
+as the source for `python SentriGuide_AI.py build-knowledge-pack`.
+"""
+
+FALLBACK_ARTICLES = [
+    {
+        'title': 'How to Renew Your Trend Micro Product',
+        'link': 'https://helpcenter.trendmicro.com/en-us/how-to-renew/',
+        'snippet': '''DETAILED RENEWAL GUIDE FOR CUSTOMERS:
+
+📋 PREPARATION (Share with Customer):
+• Have your activation code ready
+• Ensure stable internet connection
+• Have payment method available
+• Know your Trend Micro account credentials
+
+🔄 METHOD 1: Using Activation Code
+1. Open your Trend Micro product
+2. Look for "Renew" or "Enter Activation Code" option
+3. Enter your activation code in the designated field
+4. Click "Submit" or "Activate"
+5. Follow on-screen instructions to complete renewal
+6. Confirm subscription details and proceed to payment
+7. Wait for confirmation email
+
+🌐 METHOD 2: Through Trend Micro Account Portal
+1. Visit https://account.trendmicro.com
+2. Sign in with your account credentials
+3. Navigate to "Licenses" or "Subscriptions" tab
+4. Locate the subscription you want to renew
+5. Click "Renew Now" button
+6. If you see "Manage Subscription", auto-renewal is already enabled
+7. Follow the secure checkout process
+8. Complete payment and save confirmation
+
+⚠️ SPECIAL SCENARIOS:
+• Best Buy purchases: Direct customer to call 1-888-237-8289
+• ISP bundled subscriptions: Contact internet service provider
+• Corporate licenses: Refer to IT administrator
+
+🔧 TROUBLESHOOTING STEPS:
+• Error messages during renewal: Clear browser cache, try different browser
+• Payment issues: Verify card details, try alternative payment method
+• Activation code problems: Check for typos, ensure code hasn't expired
+• Account access issues: Use password reset option
+• Still having issues: Escalate to Trend Micro Support Team
+
+✅ POST-RENEWAL VERIFICATION:
+1. Check that subscription shows as "Active" in account portal
+2. Verify new expiration date
+3. Ensure real-time protection is running
+4. Save renewal confirmation for records'''
+    },
+    {
+        'title': 'Installing and Activating Trend Micro Products',
+        'link': 'https://helpcenter.trendmicro.com/en-us/installation/',
+        'snippet': '''COMPREHENSIVE INSTALLATION GUIDE FOR CUSTOMERS:
+
+📋 PRE-INSTALLATION REQUIREMENTS:
+• Windows 10/11 (32-bit or 64-bit) or macOS 10.15+
+• Minimum 1.5 GB free disk space
+• Stable internet connection for download and activation
+• Administrator privileges on the computer
+• Valid Trend Micro license or activation code
+
+💻 STEP-BY-STEP INSTALLATION PROCESS:
+
+1️⃣ DOWNLOAD THE INSTALLER:
+   • Visit https://account.trendmicro.com
+   • Sign in with your Trend Micro account credentials
+   • Navigate to the "Downloads" tab
+   • Select "Maximum Security" or your product
+   • Click "Download to this Device"
+   • Save the installer file to your desktop
+
+2️⃣ RUN THE INSTALLATION:
+   • Right-click the downloaded installer file
+   • Select "Run as Administrator" (Windows) or double-click (Mac)
+   • Click "Yes" if prompted by User Account Control
+   • Follow the installation wizard prompts
+   • Accept the license agreement
+   • Choose installation directory (default recommended)
+
+3️⃣ PRODUCT ACTIVATION:
+   • Enter your activation code when prompted
+   • Or sign in with your Trend Micro account
+   • Wait for online activation to complete
+   • Restart computer if prompted
+
+4️⃣ INITIAL SETUP:
+   • Complete the product setup wizard
+   • Configure scan settings (recommended: use defaults)
+   • Enable real-time protection
+   • Set up automatic updates
+   • Create recovery tools if offered
+
+✅ POST-INSTALLATION VERIFICATION:
+   • Check that Trend Micro icon appears in system tray
+   • Verify "Protection Status: Secured" in main interface
+   • Run initial system scan to ensure everything works
+   • Confirm automatic updates are enabled
+
+🔧 COMMON INSTALLATION ISSUES & SOLUTIONS:
+   • "Installation failed" error: Uninstall competing antivirus first
+   • "Activation failed" error: Check internet connection, verify code
+   • "Insufficient space" error: Free up disk space, clear temp files
+   • Installation freezes: Disable Windows Defender temporarily during install
+   • Permission errors: Ensure running installer as Administrator
+
+📱 MOBILE DEVICE INSTALLATION:
+   • Android: Download from Google Play Store
+   • iOS: Download from Apple App Store
+   • Search for "Trend Micro Mobile Security"
+   • Sign in with same Trend Micro account for license sync
+
+🆘 IF INSTALLATION CONTINUES TO FAIL:
+   • Use Trend Micro Diagnostic Toolkit to clean previous installations
+   • Temporarily disable Windows Firewall during installation
+   • Contact Trend Micro Support with error codes/screenshots'''
+    },
+    {
+        'title': 'Troubleshooting Common Issues',
+        'link': 'https://helpcenter.trendmicro.com/en-us/troubleshooting/',
+        'snippet': 'Solutions for common problems including installation errors, scanning issues, and performance problems.'
+    },
+    {
+        'title': 'Configuring Real-time Protection',
+        'link': 'https://helpcenter.trendmicro.com/en-us/protection-settings/',
+        'snippet': 'Learn how to configure and optimize real-time protection settings for maximum security.'
+    },
+    {
+        'title': 'Managing Quarantined Files',
+        'link': 'https://helpcenter.trendmicro.com/en-us/quarantine/',
+        'snippet': 'How to review, restore, or permanently delete files in quarantine to manage detected threats.'
+    },
+    {
+        'title': 'Email Security Configuration',
+        'link': 'https://helpcenter.trendmicro.com/en-us/email-security/',
+        'snippet': 'Configure email protection settings to block spam, phishing, and malicious attachments.'
+    },
+    {
+        'title': 'Web Protection and Browsing Safety',
+        'link': 'https://helpcenter.trendmicro.com/en-us/web-protection/',
+        'snippet': 'Enable web filtering and safe browsing features to protect against malicious websites.'
+    },
+    {
+        'title': 'Firewall Settings and Network Protection',
+        'link': 'https://helpcenter.trendmicro.com/en-us/firewall/',
+        'snippet': 'Configure firewall rules and network protection to secure your internet connection.'
+    },
+    {
+        'title': 'Performance Optimization Tips',
+        'link': 'https://helpcenter.trendmicro.com/en-us/performance/',
+        'snippet': 'Optimize Trend Micro settings to minimize system impact while maintaining security.'
+    },
+    {
+        'title': 'Virus and Malware Removal Guide',
+        'link': 'https://helpcenter.trendmicro.com/en-us/malware-removal/',
+        'snippet': 'Step-by-step instructions for removing detected threats and cleaning infected systems.'
+    },
+    {
+        'title': 'Scheduled Scan Configuration',
+        'link': 'https://helpcenter.trendmicro.com/en-us/scheduled-scans/',
+        'snippet': 'Set up automated scans to regularly check your system for threats and vulnerabilities.'
+    },
+    {
+        'title': 'Mobile Device Protection Setup',
+        'link': 'https://helpcenter.trendmicro.com/en-us/mobile-security/',
+        'snippet': 'Protect your mobile devices with Trend Micro Mobile Security features and settings.'
+    },
+    {
+        'title': 'Password Manager Configuration',
+        'link': 'https://helpcenter.trendmicro.com/en-us/password-manager/',
+        'snippet': 'Set up and use the built-in password manager to secure your online accounts.'
+    },
+    {
+        'title': 'Privacy and Data Protection',
+        'link': 'https://helpcenter.trendmicro.com/en-us/privacy-protection/',
+        'snippet': 'Configure privacy settings and data protection features to safeguard personal information.'
+    },
+    {
+        'title': 'Parental Controls Setup',
+        'link': 'https://helpcenter.trendmicro.com/en-us/parental-controls/',
+        'snippet': 'Configure parental controls to protect children online and manage screen time.'
+    },
+    {
+        'title': 'Backup and Restore Settings',
+        'link': 'https://helpcenter.trendmicro.com/en-us/backup-restore/',
+        'snippet': 'Backup your Trend Micro settings and restore configurations after reinstallation.'
+    },
+    {
+        'title': 'Enterprise and Business Solutions',
+        'link': 'https://helpcenter.trendmicro.com/en-us/business/',
+        'snippet': 'Deployment and management guides for Trend Micro business and enterprise products.'
+    },
+    {
+        'title': 'Technical Support Resources',
+        'link': 'https://helpcenter.trendmicro.com/en-us/support/',
+        'snippet': 'Access diagnostic tools, log collection, and contact information for technical support.'
+    },
+    {
+        'title': 'License Management and Transfer',
+        'link': 'https://helpcenter.trendmicro.com/en-us/license-management/',
+        'snippet': 'Manage your licenses, transfer them between devices, and resolve activation issues.'
+    },
+    {
+        'title': 'Cloud Security Best Practices',
+        'link': 'https://helpcenter.trendmicro.com/en-us/cloud-security/',
+        'snippet': 'Secure cloud services and protect data stored in cloud environments with Trend Micro.'
+    },
+    {
+        'title': 'Password Manager Setup and Import Guide',
+        'link': 'https://helpcenter.trendmicro.com/en-us/password-manager/',
+        'snippet': '''COMPREHENSIVE PASSWORD MANAGER GUIDE:
+
+🔐 SETTING UP PASSWORD MANAGER:
+• Open Trend Micro Maximum Security or ID Protection
+• Navigate to "Password Manager" section
+• Click "Get Started" or "Enable Password Manager"
+• Create a master password (remember this - it cannot be recovered!)
+• Confirm master password and security questions
+• Enable browser extension when prompted
+
+📥 IMPORTING PASSWORDS FROM OTHER MANAGERS:
+1️⃣ FROM CHROME/EDGE BROWSER:
+   • Open Password Manager → Settings → Import
+   • Select "Browser" as source
+   • Choose Chrome/Edge from dropdown
+   • Click "Import Now" - passwords will sync automatically
+
+2️⃣ FROM OTHER PASSWORD MANAGERS:
+   • Export passwords from old manager as CSV file
+   • In Trend Micro: Settings → Import → "CSV File"
+   • Select exported CSV file
+   • Map fields if needed (username, password, website)
+   • Click "Import" to transfer all passwords
+
+3️⃣ MANUAL ENTRY:
+   • Click "Add New" in Password Manager
+   • Enter website URL, username, password
+   • Add notes if needed
+   • Save entry
+
+🛡️ SECURITY FEATURES:
+• Password Generator: Create strong, unique passwords
+• Auto-Fill: Automatically fill login forms
+• Secure Notes: Store sensitive information safely
+• Security Audit: Check for weak/reused passwords
+• Dark Web Monitoring: Alert if passwords are compromised
+
+🔧 TROUBLESHOOTING COMMON ISSUES:
+• Import failed: Check CSV format, ensure no special characters
+• Auto-fill not working: Enable browser extension, check permissions
+• Forgot master password: Cannot be recovered - will need to reset (loses all data)
+• Sync issues: Sign out and back into Trend Micro account
+• Browser extension missing: Reinstall from Trend Micro dashboard'''
+    },
+    {
+        'title': 'ID Protection and Privacy Setup',
+        'link': 'https://helpcenter.trendmicro.com/en-us/id-protection/',
+        'snippet': '''COMPLETE ID PROTECTION SETUP GUIDE:
+
+🛡️ IDENTITY PROTECTION FEATURES:
+• Social Security Number monitoring
+• Credit report monitoring
+• Dark web monitoring for personal data
+• Identity theft insurance coverage
+• Personal information cleanup
+• Identity restoration services
+
+📋 INITIAL SETUP PROCESS:
+1. Open Trend Micro ID Protection
+2. Complete identity verification with SSN and personal details
+3. Connect bank accounts and credit cards for monitoring
+4. Set up alerts for suspicious activity
+5. Enable dark web monitoring
+6. Configure privacy settings
+
+🔍 MONITORING SERVICES:
+• Credit Score Tracking: Monthly updates and alerts
+• Bank Account Monitoring: Unusual transaction alerts
+• Social Media Scanning: Check for unauthorized use of personal info
+• Public Records Monitoring: Track when your info appears online
+• Data Breach Notifications: Immediate alerts if your data is found
+
+⚠️ IDENTITY THEFT RESPONSE:
+• Immediate notification of suspicious activity
+• Step-by-step guidance for reporting theft
+• Access to identity restoration specialists
+• Help with freezing credit reports
+• Assistance with fraud alerts and credit disputes
+
+🔧 PRIVACY TOOLS:
+• Personal Data Removal: Remove info from data broker sites
+• Social Media Privacy Checkup: Secure your online profiles
+• Email Monitoring: Track if email appears in breaches
+• Phone Number Protection: Monitor for unauthorized use
+
+💡 BEST PRACTICES:
+• Review alerts promptly and take recommended actions
+• Keep personal information updated in your profile
+• Use strong, unique passwords for all accounts
+• Enable two-factor authentication where possible
+• Regularly check credit reports and bank statements'''
+    },
+    {
+        'title': 'VPN and Secure Connection Setup',
+        'link': 'https://helpcenter.trendmicro.com/en-us/vpn/',
+        'snippet': '''TREND MICRO VPN SETUP AND USAGE:
+
+🌐 VPN BENEFITS:
+• Hide your IP address and location
+• Encrypt internet traffic on public Wi-Fi
+• Access geo-restricted content safely
+• Protect against online tracking
+• Secure browsing on untrusted networks
+
+⚙️ VPN SETUP PROCESS:
+1. Open Trend Micro Maximum Security
+2. Navigate to "Privacy" or "VPN" section
+3. Click "Enable VPN" or "Get Started"
+4. Choose server location (or use "Auto-Select")
+5. Click "Connect" to establish secure connection
+6. Verify connection with green "Connected" status
+
+🗺️ SERVER LOCATIONS:
+• United States (multiple cities)
+• United Kingdom • Germany • Japan
+• Canada • Australia • Netherlands
+• Auto-Select: Chooses fastest available server
+• Specialized servers for streaming and gaming
+
+📱 MOBILE VPN SETUP:
+• Download Trend Micro Mobile Security app
+• Sign in with your Trend Micro account
+• Tap "VPN" → "Enable VPN"
+• Allow VPN configuration when prompted
+• Select server location and connect
+
+🔧 TROUBLESHOOTING VPN ISSUES:
+• Connection fails: Try different server location
+• Slow speeds: Use Auto-Select or nearest server
+• Can't access local sites: Disconnect VPN temporarily
+• Mobile VPN not working: Check app permissions
+• Netflix/streaming blocked: Try different server region
+
+💡 OPTIMAL USAGE TIPS:
+• Use VPN on public Wi-Fi networks always
+• Disconnect when using banking apps (some block VPN)
+• Choose nearest server location for best speed
+• Enable "Auto-Connect" for automatic protection
+• Monitor data usage on mobile devices'''
+    },
+    {
+        'title': 'Email Security and Anti-Spam Configuration',
+        'link': 'https://helpcenter.trendmicro.com/en-us/email-security/',
+        'snippet': '''EMAIL SECURITY COMPREHENSIVE SETUP:
+
+📧 EMAIL PROTECTION FEATURES:
+• Spam filtering and blocking
+• Phishing email detection
+• Malicious attachment scanning
+• Link protection and URL filtering
+• Email encryption capabilities
+• Anti-spoofing protection
+
+⚙️ OUTLOOK INTEGRATION SETUP:
+1. Install Trend Micro Maximum Security
+2. Open Outlook → File → Options → Add-ins
+3. Verify "Trend Micro Email Security" is enabled
+4. Configure scan settings in Trend Micro main interface
+5. Set spam sensitivity level (Low/Medium/High)
+6. Enable real-time email scanning
+
+🛡️ ANTI-SPAM CONFIGURATION:
+• Spam Sensitivity: Adjust based on false positive rate
+• Whitelist: Add trusted senders to never block
+• Blacklist: Block specific domains or email addresses
+• Quarantine: Review blocked emails before deletion
+• Custom Rules: Create advanced filtering criteria
+
+🔍 PHISHING PROTECTION:
+• Automatic suspicious link scanning
+• Warning messages for potential phishing
+• Safe browser redirection for protected links
+• Real-time URL reputation checking
+• Email header analysis for spoofing detection
+
+📎 ATTACHMENT SCANNING:
+• Real-time malware detection in attachments
+• Quarantine suspicious files automatically
+• Safe file type allowlists
+• Password-protected archive scanning
+• Cloud-based threat intelligence integration
+
+🔧 TROUBLESHOOTING EMAIL ISSUES:
+• Legitimate emails in spam: Add sender to whitelist
+• Outlook integration not working: Reinstall Trend Micro
+• Email scanning slow: Adjust real-time scan settings
+• Missing email toolbar: Enable Trend Micro add-in in Outlook
+• False phishing warnings: Report false positive to support'''
+    },
+    {
+        'title': 'Parental Controls and Family Protection',
+        'link': 'https://helpcenter.trendmicro.com/en-us/parental-controls/',
+        'snippet': '''COMPREHENSIVE PARENTAL CONTROLS SETUP:
+
+👨‍👩‍👧‍👦 FAMILY PROTECTION FEATURES:
+• Content filtering by age-appropriate categories
+• Screen time management and schedules
+• App usage monitoring and restrictions
+• Location tracking and geofencing alerts
+• Social media activity monitoring
+• Cyberbullying detection and alerts
+
+⚙️ INITIAL SETUP PROCESS:
+1. Open Trend Micro Family → Create family account
+2. Add child profiles with names and ages
+3. Install Trend Micro Mobile Security on child devices
+4. Configure content filtering levels by age group
+5. Set screen time limits and schedules
+6. Enable location tracking with child consent
+
+🕐 SCREEN TIME MANAGEMENT:
+• Daily time limits for device usage
+• Scheduled "bedtime" hours with device lockdown
+• App-specific time restrictions
+• Homework mode: Block entertainment apps during study time
+• Weekend vs weekday different schedules
+• Instant pause/resume device access
+
+🌐 CONTENT FILTERING OPTIONS:
+• Age-based preset filters (Young Child, Tween, Teen)
+• Custom category blocking (Social Media, Gaming, Adult Content)
+• Website whitelist/blacklist management
+• Safe search enforcement on search engines
+• YouTube restricted mode activation
+• Social media platform monitoring
+
+📱 MOBILE DEVICE CONTROLS:
+• App installation approval requirements
+• In-app purchase restrictions
+• Contact management and stranger blocking
+• Text message monitoring for inappropriate content
+• Call log tracking and unknown number alerts
+• Emergency contact always-available settings
+
+🔧 TROUBLESHOOTING FAMILY ISSUES:
+• Child bypassing controls: Enable strict enforcement mode
+• Legitimate sites blocked: Add to whitelist or adjust filter level
+• Location not updating: Check GPS permissions on child device
+• App blocks not working: Verify Mobile Security is installed and active
+• Schedule conflicts: Review overlapping time restrictions'''
+    },
+    {
+        'title': 'Cashback Claims and Refund Requests',
+        'link': 'https://helpcenter.trendmicro.com/en-us/billing-refunds/',
+        'snippet': '''COMPREHENSIVE BILLING AND REFUND GUIDE:
+
+💰 CASHBACK CLAIM PROCESS:
+• Cashback offers are typically promotional and time-limited
+• Check original purchase email or promotional materials for cashback terms
+• Visit the retailer's cashback portal (Best Buy, Amazon, etc.)
+• Submit cashback claim within specified timeframe (usually 30-90 days)
+• Provide proof of purchase (receipt, order confirmation)
+• Track claim status through retailer's cashback system
+
+📋 REFUND REQUEST PROCESS:
+1️⃣ DIRECT TREND MICRO PURCHASES:
+   • Visit https://account.trendmicro.com
+   • Sign in to your account
+   • Go to "Billing" or "Subscriptions" section
+   • Click "Request Refund" or "Cancel Subscription"
+   • Select refund reason from dropdown
+   • Submit refund request with order details
+
+2️⃣ RETAIL STORE PURCHASES:
+   • Return to original point of purchase (Best Buy, Amazon, etc.)
+   • Bring receipt and activation code/packaging
+   • Follow retailer's return policy (usually 15-30 days)
+   • Contact retailer customer service for assistance
+
+3️⃣ DIGITAL MARKETPLACE PURCHASES:
+   • App Store: Request refund through Apple Support
+   • Google Play: Use Google Play refund process
+   • Microsoft Store: Contact Microsoft support
+   • Steam/Epic: Follow digital platform refund policies
+
+⏰ REFUND TIMEFRAMES:
+• Trend Micro Direct: 30-day money-back guarantee
+• Retail stores: Varies by retailer (typically 15-30 days)
+• Digital platforms: 14-48 hours for digital refunds
+• Processing time: 5-10 business days after approval
+
+💳 BILLING DISPUTE RESOLUTION:
+• Unauthorized charges: Contact Trend Micro billing support immediately
+• Duplicate charges: Provide transaction IDs for investigation
+• Auto-renewal disputes: Show cancellation attempts/proof
+• Proration requests: Explain downgrade/service change needs
+
+📞 BILLING SUPPORT CONTACTS:
+• Trend Micro Billing: 1-855-891-0011 (US/Canada)
+• Live Chat: Available 24/7 through account portal
+• Email Support: billing@trendmicro.com
+• International: Check region-specific contact numbers
+
+🔧 COMMON BILLING ISSUES:
+• Can't find purchase: Check email, account history, credit card statements
+• Refund not processed: Allow 10 business days, then contact support
+• Auto-renewal unexpected: Disable in account settings for future
+• Wrong product purchased: Exchange may be possible within 30 days
+• Payment method failed: Update card info in account billing section
+
+📝 REQUIRED INFORMATION FOR SUPPORT:
+• Order number or transaction ID
+• Email address used for purchase
+• Last 4 digits of payment method
+• Approximate purchase date
+• Reason for refund request'''
+    },
+    {
+        'title': 'Billing Account Management and Payment Issues',
+        'link': 'https://helpcenter.trendmicro.com/en-us/billing-management/',
+        'snippet': '''COMPLETE BILLING ACCOUNT MANAGEMENT:
+
+💳 PAYMENT METHOD MANAGEMENT:
+• Update credit card information before expiration
+• Add backup payment methods for auto-renewal
+• Remove old or expired payment methods
+• Set up automatic payment notifications
+• Configure billing address and tax information
+
+🔄 SUBSCRIPTION MANAGEMENT:
+• View current subscription status and expiration
+• Manage auto-renewal settings (enable/disable)
+• Upgrade or downgrade subscription plans
+• Transfer licenses between devices
+• Monitor device usage against license limits
+
+📧 BILLING NOTIFICATIONS:
+• Renewal reminders (30, 15, 7 days before expiration)
+• Payment confirmation emails
+• Failed payment alerts and retry attempts
+• Receipt and invoice downloads
+• Promotional offer notifications
+
+🛠️ PAYMENT TROUBLESHOOTING:
+• "Payment failed" errors: Check card expiration, available balance
+• "Invalid payment method": Verify billing address matches bank records
+• International payment issues: Contact bank about international transactions
+• Declined transactions: Ensure card allows online/international purchases
+• Currency conversion problems: Check if card supports foreign transactions
+
+📊 BILLING HISTORY ACCESS:
+• Download invoices and receipts from account portal
+• View payment history for tax/expense reporting
+• Track refunds and credits applied to account
+• Monitor subscription changes and modifications
+• Export billing data for accounting purposes
+
+🔒 BILLING SECURITY:
+• Use secure payment methods (avoid debit cards for subscriptions)
+• Monitor credit card statements for Trend Micro charges
+• Report unauthorized charges immediately
+• Enable two-factor authentication on account
+• Never share account credentials or payment information
+
+💡 BILLING BEST PRACTICES:
+• Set calendar reminders before auto-renewal dates
+• Keep payment methods updated to avoid service interruption
+• Review charges monthly for accuracy
+• Download receipts immediately after purchase
+• Contact support before charges if canceling subscription'''
+    },
+    {
+        'title': 'Subscription Cancellation and Service Management',
+        'link': 'https://helpcenter.trendmicro.com/en-us/cancel-subscription/',
+        'snippet': '''SUBSCRIPTION CANCELLATION COMPREHENSIVE GUIDE:
+
+❌ CANCELLATION PROCESS:
+1. Sign in to https://account.trendmicro.com
+2. Navigate to "Subscriptions" or "My Products"
+3. Find active subscription to cancel
+4. Click "Manage Subscription" or "Cancel"
+5. Select cancellation reason (required)
+6. Confirm cancellation and save changes
+7. Receive cancellation confirmation email
+
+⏰ CANCELLATION TIMING:
+• Cancel anytime during subscription period
+• Service continues until current period expires
+• No prorated refunds for partial months (check specific terms)
+• Auto-renewal stops immediately upon cancellation
+• Reactivation possible before expiration date
+
+🔄 ALTERNATIVE OPTIONS BEFORE CANCELING:
+• Pause subscription: Temporary hold for up to 6 months
+• Downgrade plan: Switch to lower-tier service
+• Transfer to family member: Change account ownership
+• Seasonal suspension: For temporary travel/non-use
+• Contact retention team: May offer discounts or incentives
+
+📱 MOBILE SUBSCRIPTION CANCELLATION:
+• App Store subscriptions: Cancel through iOS Settings → Subscriptions
+• Google Play subscriptions: Cancel through Play Store → Subscriptions
+• Direct mobile billing: Use account portal cancellation process
+
+💰 POST-CANCELLATION CONSIDERATIONS:
+• Download software installers before expiration
+• Export password manager data and settings
+• Save important security reports and history
+• Note expiration date for potential renewal
+• Consider data backup before service ends
+
+🔧 CANCELLATION TROUBLESHOOTING:
+• "Cancel" button missing: May be retail/partner subscription - contact seller
+• Cancellation not processed: Clear browser cache, try different browser
+• Still charged after cancellation: Verify cancellation email, contact billing
+• Want to cancel immediately: Request refund separately from cancellation
+• Multiple subscriptions: Cancel each subscription individually
+
+🆘 EMERGENCY CANCELLATION:
+• Contact billing support for immediate assistance: 1-855-891-0011
+• Use live chat for urgent cancellation needs
+• Email billing@trendmicro.com with "URGENT CANCELLATION" in subject
+• Dispute charges with bank if other methods fail
+• Request manager escalation for complex situations
+
+📋 CANCELLATION CHECKLIST:
+✓ Export important data (passwords, reports, settings)
+✓ Note current subscription expiration date
+✓ Save cancellation confirmation email
+✓ Remove auto-renewal from payment method if desired
+✓ Consider alternative security solution before expiration
+✓ Update password manager with new security software plans'''
+    },
+    {
+        'title': 'Installation Error Troubleshooting Guide',
+        'link': 'https://helpcenter.trendmicro.com/en-us/installation-errors/',
+        'snippet': '''COMPREHENSIVE INSTALLATION ERROR SOLUTIONS:
+
+❌ COMMON INSTALLATION ERRORS:
+
+🔧 ERROR: "Installation Failed" or "Setup Error"
+• Close all running programs and antivirus software
+• Run installer as Administrator (right-click → "Run as administrator")
+• Temporarily disable Windows Defender Real-time protection
+• Clear Windows temp files: %temp% and delete all contents
+• Download fresh installer from account portal
+• Restart computer and try installation again
+
+🔧 ERROR: "Another version already installed"
+• Uninstall previous Trend Micro products completely
+• Use Trend Micro Diagnostic Toolkit to remove remnants
+• Clear registry entries with official uninstaller
+• Restart computer before installing new version
+• Run Windows Registry cleaner if issues persist
+
+🔧 ERROR: "Insufficient privileges" or "Access denied"
+• Right-click installer → "Run as administrator"
+• Disable User Account Control temporarily
+• Log in with administrator account
+• Check folder permissions for installation directory
+• Ensure account has administrative rights
+
+🔧 ERROR: "Installation package corrupt" or "Cannot access installer"
+• Download installer again from trusted source
+• Verify file integrity and size
+• Disable antivirus during download
+• Try downloading on different network/computer
+• Use different browser or clear browser cache
+
+💻 SYSTEM COMPATIBILITY ISSUES:
+• Windows version not supported: Check system requirements
+• Insufficient disk space: Free up at least 2GB space
+• Missing system updates: Install latest Windows updates
+• Conflicting software: Uninstall competing antivirus products
+• Architecture mismatch: Ensure 32-bit/64-bit compatibility
+
+🌐 NETWORK AND DOWNLOAD ISSUES:
+• Slow/interrupted download: Use stable internet connection
+• Firewall blocking: Add Trend Micro to firewall exceptions
+• Proxy settings: Configure proxy in installer if needed
+• VPN interference: Temporarily disconnect VPN during installation
+• Corporate network: Contact IT for installation permissions
+
+🔄 POST-INSTALLATION ACTIVATION ERRORS:
+• "Activation failed": Check internet connection and try again
+• "Invalid activation code": Verify code spelling and expiration
+• "Code already used": Contact support for new activation code
+• "Server unavailable": Wait and retry, or try different time
+• "Region mismatch": Ensure code matches your geographic region
+
+🛠️ ADVANCED TROUBLESHOOTING STEPS:
+1. Boot in Safe Mode and attempt installation
+2. Create new Windows user account with admin rights
+3. Use Windows System File Checker: sfc /scannow
+4. Check Windows Event Viewer for detailed error messages
+5. Disable startup programs that may interfere
+6. Update device drivers, especially network and storage
+
+📞 ESCALATION PROCEDURES:
+• Collect installation logs from %temp% folder
+• Note exact error messages and error codes
+• Document system specifications and OS version
+• Contact Trend Micro Technical Support: 1-888-762-8736
+• Use remote assistance tools if offered by support team'''
+    },
+    {
+        'title': 'Application Error and Crash Troubleshooting',
+        'link': 'https://helpcenter.trendmicro.com/en-us/app-errors/',
+        'snippet': '''COMPLETE APPLICATION ERROR RESOLUTION:
+
+💥 APPLICATION CRASHES AND FREEZES:
+
+🔧 ERROR: "Application has stopped working" or Sudden Crashes
+• Update Trend Micro to latest version
+• Restart Trend Micro services: Services.msc → Trend Micro services → Restart
+• Run Windows Memory Diagnostic to check RAM
+• Check for corrupted system files: sfc /scannow
+• Disable conflicting software (other security tools)
+• Reset Trend Micro settings to default
+
+🔧 ERROR: Application Won't Start or "Failed to launch"
+• Check if Trend Micro services are running
+• Verify product license is active and not expired
+• Run Trend Micro as Administrator
+• Temporarily disable Windows Firewall
+• Check for Windows updates and install
+• Reinstall Trend Micro if issues persist
+
+🔧 ERROR: Interface Freezes or Becomes Unresponsive
+• Force close Trend Micro: Ctrl+Alt+Del → Task Manager → End Process
+• Clear Trend Micro cache and temporary files
+• Disable unnecessary Windows visual effects
+• Check available system memory and close other programs
+• Update graphics drivers
+• Restart computer and relaunch application
+
+🌐 WEBSITE AND WEB PROTECTION ERRORS:
+
+🔧 ERROR: "Website blocked incorrectly" or False Positives
+• Add website to Web Reputation exceptions
+• Adjust Web Reputation sensitivity level
+• Clear browser cache and cookies
+• Disable Web Reputation temporarily for testing
+• Report false positive to Trend Micro support
+• Check if website is actually malicious using online scanners
+
+🔧 ERROR: "Cannot access websites" or Connection Issues
+• Check if Web Reputation is blocking access
+• Verify internet connection without Trend Micro
+• Flush DNS cache: ipconfig /flushdns
+• Reset browser settings to default
+• Disable proxy settings in browser
+• Try accessing websites in incognito/private mode
+
+🔧 ERROR: Browser Integration Not Working
+• Reinstall browser extensions/add-ons
+• Check browser compatibility with Trend Micro version
+• Enable browser add-ons if disabled
+• Update browser to latest version
+• Clear browser cache and restart browser
+• Run browser as administrator
+
+📧 EMAIL AND SCANNING ERRORS:
+
+🔧 ERROR: "Scan failed" or "Cannot complete scan"
+• Check available disk space (need at least 1GB free)
+• Close other resource-intensive programs
+• Exclude scanning of very large files temporarily
+• Update virus definition files
+• Run scan in Safe Mode if persistent
+• Check for file system errors: chkdsk /f
+
+🔧 ERROR: Email Integration Problems
+• Verify Outlook version compatibility
+• Reinstall Trend Micro Email Security add-in
+• Check if Outlook is running in administrator mode
+• Disable other email security add-ins
+• Repair Microsoft Office installation
+• Reset Outlook profile if necessary
+
+🔄 UPDATE AND SYNCHRONIZATION ERRORS:
+
+🔧 ERROR: "Update failed" or "Cannot download updates"
+• Check internet connection stability
+• Verify Windows date and time settings
+• Clear Trend Micro update cache
+• Temporarily disable firewall during update
+• Try manual update download from website
+• Contact ISP if persistent connectivity issues
+
+🔧 ERROR: "Sync error" or Cloud Synchronization Issues
+• Verify Trend Micro account credentials
+• Check account subscription status
+• Clear sync cache and restart synchronization
+• Ensure stable internet connection
+• Try logging out and back into account
+• Contact support if account shows as suspended
+
+🆘 CRITICAL ERROR RECOVERY:
+• Safe Mode troubleshooting steps
+• System restore to point before issues began
+• Complete uninstall and fresh installation
+• Contact Technical Support with error logs
+• Remote assistance session setup if needed'''
+    },
+    {
+        'title': 'Website and Connectivity Technical Issues',
+        'link': 'https://helpcenter.trendmicro.com/en-us/connectivity-issues/',
+        'snippet': '''WEBSITE AND CONNECTIVITY TROUBLESHOOTING:
+
+🌐 TREND MICRO WEBSITE ACCESS ISSUES:
+
+🔧 ERROR: "Cannot access account.trendmicro.com"
+• Clear browser cache and cookies completely
+• Try different browser (Chrome, Firefox, Edge)
+• Disable browser extensions temporarily
+• Check if corporate firewall is blocking access
+• Try accessing from different network (mobile hotspot)
+• Use incognito/private browsing mode
+
+🔧 ERROR: "Page won't load" or "Connection timeout"
+• Check internet connection with other websites
+• Flush DNS cache: ipconfig /flushdns (Windows) or sudo dscacheutil -flushcache (Mac)
+• Change DNS servers to 8.8.8.8 and 8.8.4.4 (Google DNS)
+• Disable VPN if connected
+• Try accessing website using IP address instead of domain
+• Contact ISP if issues persist across multiple sites
+
+🔧 ERROR: "Login failed" or "Session expired"
+• Verify username and password accuracy
+• Check Caps Lock and ensure correct keyboard layout
+• Clear cookies for trendmicro.com domain
+• Disable password manager auto-fill temporarily
+• Try password reset if login consistently fails
+• Check if account is locked due to multiple failed attempts
+
+🔒 SSL AND SECURITY CERTIFICATE ERRORS:
+
+🔧 ERROR: "Your connection is not private" or SSL Certificate Error
+• Check system date and time settings (must be accurate)
+• Clear browser SSL state: Settings → Advanced → Clear browsing data
+• Add security exception for trendmicro.com if trusted
+• Update browser to latest version
+• Disable antivirus SSL scanning temporarily
+• Try accessing via https:// explicitly
+
+🔧 ERROR: "Certificate has expired" or "Certificate not trusted"
+• Update Windows certificates: Windows Update
+• Clear certificate cache in browser
+• Import Trend Micro root certificates manually
+• Check if corporate network has certificate filtering
+• Try accessing from personal network instead of corporate
+
+📱 MOBILE APP CONNECTIVITY ISSUES:
+
+🔧 ERROR: Mobile app won't connect or sync
+• Check mobile data/WiFi connection
+• Force close and restart Trend Micro mobile app
+• Clear app cache: Settings → Apps → Trend Micro → Storage → Clear Cache
+• Update mobile app to latest version
+• Sign out and back into Trend Micro account
+• Restart mobile device
+
+🔧 ERROR: "Server unavailable" or "Network error"
+• Switch between WiFi and mobile data
+• Check if mobile carrier blocks certain connections
+• Disable mobile VPN if connected
+• Allow Trend Micro through mobile firewall/security apps
+• Check mobile date and time settings
+• Reinstall mobile app if persistent
+
+🔄 ACCOUNT PORTAL AND WEB INTERFACE ISSUES:
+
+🔧 ERROR: Dashboard not loading or "Internal server error"
+• Wait 15-30 minutes and try again (may be temporary server issue)
+• Try accessing specific sections directly via bookmarks
+• Disable ad blockers and privacy extensions
+• Clear all browser data for trendmicro.com
+• Try different device or network
+• Contact support if error persists over 2 hours
+
+🔧 ERROR: Features missing or "Access denied"
+• Verify subscription includes requested features
+• Check if account has proper permissions
+• Log out completely and log back in
+• Clear browser session data
+• Try accessing from account owner's login
+• Contact billing if features should be available
+
+🛠️ ADVANCED NETWORK TROUBLESHOOTING:
+
+• Network trace: tracert account.trendmicro.com
+• DNS lookup test: nslookup account.trendmicro.com
+• Port connectivity test: telnet account.trendmicro.com 443
+• Disable Windows firewall temporarily for testing
+• Check router/modem firewall settings
+• Test with ethernet cable instead of WiFi
+• Contact network administrator for corporate environments
+
+📞 ESCALATION FOR CONNECTIVITY ISSUES:
+• Document specific error messages and codes
+• Note time of day when issues occur
+• Test from multiple devices and networks
+• Collect network diagnostic information
+• Contact ISP to verify no service issues
+• Report to Trend Micro if widespread connectivity problems'''
+    },
+    {
+        'title': 'Account Portal Access and Login Issues',
+        'link': 'https://helpcenter.trendmicro.com/en-us/account-access/',
+        'snippet': '''COMPREHENSIVE ACCOUNT PORTAL TROUBLESHOOTING:
+
+🔐 LOGIN AND AUTHENTICATION ISSUES:
+
+🔧 ERROR: "Invalid username or password" or Login Failed
+• Verify email address spelling and format
+• Check password for correct case sensitivity
+• Ensure Caps Lock is OFF and correct keyboard layout
+• Try typing password manually (don't copy/paste)
+• Clear browser saved passwords and try again
+• Use password reset if multiple attempts fail
+
+🔧 ERROR: "Account locked" or "Too many failed attempts"
+• Wait 30 minutes before attempting login again
+• Use "Forgot Password" to reset and unlock account
+• Contact support if lockout persists after reset
+• Check for automated login attempts or malware
+• Verify account hasn't been compromised
+
+🔧 ERROR: "Account not found" or "Email not recognized"
+• Double-check email address spelling
+• Try alternative email addresses you may have used
+• Check if account was created with phone number instead
+• Look for original purchase/activation emails for correct account
+• Contact support with proof of purchase if account missing
+
+🔄 PASSWORD RESET AND RECOVERY:
+
+🔧 PASSWORD RESET PROCESS:
+1. Visit https://account.trendmicro.com
+2. Click "Forgot your password?" link
+3. Enter email address associated with account
+4. Check email inbox AND spam folder for reset link
+5. Click reset link within 24 hours (expires)
+6. Create new password meeting requirements
+7. Log in with new password immediately
+
+🔧 ERROR: "Password reset email not received"
+• Check spam/junk folder thoroughly
+• Verify email address spelling when requesting reset
+• Wait up to 15 minutes for email delivery
+• Add noreply@trendmicro.com to contacts/whitelist
+• Try requesting reset from different browser/device
+• Contact support if email still not received after 30 minutes
+
+🔧 ERROR: "Reset link expired" or "Invalid reset link"
+• Request new password reset (links expire in 24 hours)
+• Use link from most recent reset email only
+• Don't click link multiple times
+• Clear browser cache before clicking reset link
+• Try opening link in incognito/private browser window
+
+🌐 ACCOUNT PORTAL NAVIGATION ISSUES:
+
+🔧 ERROR: Dashboard blank or not loading completely
+• Clear browser cache and cookies for trendmicro.com
+• Disable browser extensions (ad blockers, privacy tools)
+• Try different browser (Chrome, Firefox, Edge, Safari)
+• Check if JavaScript is enabled in browser settings
+• Disable VPN or proxy connections temporarily
+• Try accessing from different network
+
+🔧 ERROR: "Session expired" or Frequent logouts
+• Enable cookies for trendmicro.com domain
+• Clear existing cookies and log in fresh
+• Check browser privacy settings aren't too restrictive
+• Disable "Clear cookies on exit" browser setting
+• Stay active in portal (don't leave idle too long)
+• Contact support if sessions expire within minutes
+
+🔧 ERROR: Missing features or "Access denied" messages
+• Verify subscription is active and not expired
+• Check if account has proper license level for feature
+• Log out completely and log back in
+• Clear browser session data
+• Try accessing feature from main dashboard
+• Contact billing to verify subscription includes feature
+
+📱 MOBILE ACCOUNT ACCESS:
+
+🔧 MOBILE BROWSER ISSUES:
+• Use mobile browser in desktop mode for full portal
+• Clear mobile browser cache and cookies
+• Try Trend Micro mobile app instead of browser
+• Switch between WiFi and mobile data
+• Update mobile browser to latest version
+• Use different mobile browser if available
+
+🔧 MOBILE APP ACCOUNT ISSUES:
+• Force close and restart Trend Micro mobile app
+• Update mobile app to latest version
+• Clear app cache and data in device settings
+• Sign out and back into account within app
+• Reinstall mobile app if persistent issues
+• Check mobile device date/time settings
+
+👥 MULTIPLE ACCOUNT ISSUES:
+
+🔧 ERROR: "Multiple accounts found" or Account confusion
+• Identify which email was used for original purchase
+• Check credit card statements for billing email
+• Try all possible email addresses you might have used
+• Look for activation emails in old email accounts
+• Contact support with proof of purchase to merge accounts
+• Use most recent/active account going forward
+
+🔧 FAMILY/SHARED ACCOUNT ACCESS:
+• Verify you're using correct family member credentials
+• Check if main account holder restricted your access
+• Contact primary account holder for permission changes
+• Don't share login credentials between family members
+• Set up separate accounts if appropriate
+
+🆘 ACCOUNT RECOVERY AND ESCALATION:
+
+📞 WHEN TO CONTACT SUPPORT:
+• Account completely inaccessible after all troubleshooting
+• Suspicious account activity or potential compromise
+• Need to merge multiple accounts with same email
+• Billing/subscription shows but can't access features
+• Account shows suspended/terminated unexpectedly
+
+📋 INFORMATION TO PROVIDE SUPPORT:
+• Email address(es) associated with account
+• Approximate account creation date
+• Last successful login date/time
+• Order number or transaction ID from original purchase
+• Last 4 digits of payment method used
+• Detailed description of error messages
+• Screenshots of error screens if possible
+
+🔒 ACCOUNT SECURITY BEST PRACTICES:
+• Use unique, strong password (12+ characters)
+• Enable two-factor authentication if available
+• Don't share account credentials with others
+• Log out when using public/shared computers
+• Monitor account activity regularly
+• Update password if security breach suspected'''
+    },
+    {
+        'title': 'Account Management and Profile Issues',
+        'link': 'https://helpcenter.trendmicro.com/en-us/account-management/',
+        'snippet': '''COMPLETE ACCOUNT MANAGEMENT TROUBLESHOOTING:
+
+👤 PROFILE AND PERSONAL INFORMATION:
+
+🔧 ERROR: "Cannot update profile" or Profile changes not saving
+• Clear browser cache and cookies completely
+• Try updating one field at a time instead of all at once
+• Ensure all required fields are filled out correctly
+• Check for special characters that might not be accepted
+• Use different browser or incognito mode
+• Contact support if profile changes critical for service
+
+🔧 ERROR: "Invalid email format" or Email update issues
+• Verify new email address is spelled correctly
+• Ensure email format includes @ and proper domain
+• Check that new email isn't already associated with another account
+• Complete email verification process if required
+• Use different email provider if format issues persist
+
+🔧 ERROR: "Phone number invalid" or SMS verification problems
+• Enter phone number with proper country code format
+• Remove dashes, spaces, or special characters
+• Verify mobile number can receive SMS messages
+• Check if phone number already used on another account
+• Try landline number if mobile SMS not working
+• Contact support for manual verification if needed
+
+🏠 ADDRESS AND BILLING INFORMATION:
+
+🔧 ERROR: "Billing address mismatch" or Payment failures
+• Ensure address exactly matches credit card billing address
+• Include apartment/unit numbers in correct fields
+• Use same format as on bank/credit card statements
+• Verify zip/postal code is correct for country
+• Contact bank if address format requirements unclear
+
+🔧 ERROR: "Country/region cannot be changed" or Location restrictions
+• Contact support for legitimate country changes (moved residence)
+• Some subscription types may be region-locked
+• May need to cancel and repurchase if moving countries
+• Check if VPN is affecting detected location
+• Provide proof of residence change if required
+
+🔐 SECURITY AND PRIVACY SETTINGS:
+
+🔧 TWO-FACTOR AUTHENTICATION ISSUES:
+• Verify mobile number can receive SMS codes
+• Check if authentication app (Google Authenticator) is synced
+• Keep backup codes in secure location
+• Contact support immediately if locked out due to 2FA
+• Don't disable 2FA unless absolutely necessary
+
+🔧 PRIVACY AND NOTIFICATION SETTINGS:
+• Review email notification preferences regularly
+• Opt out of marketing emails if desired (won't affect service)
+• Check spam folder for important account notifications
+• Update communication preferences after email changes
+• Set mobile push notification preferences in app
+
+📊 SUBSCRIPTION AND DEVICE MANAGEMENT:
+
+🔧 ERROR: "Device limit exceeded" or Cannot add new device
+• Remove old/unused devices from account first
+• Check device list for duplicates or renamed devices
+• Verify subscription allows additional devices
+• Upgrade subscription if more devices needed
+• Contact support if device count appears incorrect
+
+🔧 DEVICE MANAGEMENT ISSUES:
+• Refresh device list if recently removed devices still showing
+• Rename devices with clear, identifiable names
+• Remove devices before selling/disposing of hardware
+• Transfer licenses between devices if moving to new computer
+• Check device status and last sync times regularly
+
+💳 PAYMENT METHOD AND BILLING:
+
+🔧 ERROR: "Payment method declined" or Billing failures
+• Verify credit card hasn't expired
+• Check available credit limit/account balance
+• Ensure billing address matches card exactly
+• Try different payment method if primary fails
+• Contact bank about international transaction blocks
+• Update payment method before auto-renewal date
+
+🔧 RECURRING BILLING MANAGEMENT:
+• Review auto-renewal settings before each billing cycle
+• Update payment methods proactively before expiration
+• Set calendar reminders for subscription renewals
+• Monitor credit card statements for Trend Micro charges
+• Contact billing support for payment disputes immediately
+
+👨‍👩‍👧‍👦 FAMILY AND SHARED ACCOUNTS:
+
+🔧 FAMILY ACCOUNT SETUP AND MANAGEMENT:
+• Designate primary account holder for billing/administration
+• Set up individual profiles for each family member
+• Configure appropriate permissions for child accounts
+• Review family sharing settings and restrictions
+• Monitor usage across all family devices regularly
+
+🔧 SHARED ACCOUNT ACCESS ISSUES:
+• Don't share login credentials between users
+• Set up separate sub-accounts if available
+• Use family sharing features instead of credential sharing
+• Contact support for guidance on multi-user setups
+• Consider individual accounts for business/professional use
+
+🔄 ACCOUNT TRANSFER AND MIGRATION:
+
+🔧 TRANSFERRING ACCOUNT TO NEW EMAIL:
+• Update email address in account settings first
+• Verify new email address access before changing
+• Update email in all Trend Micro products/apps
+• Check that old email won't be reused by others
+• Keep record of account transfer date/confirmation
+
+🔧 ACCOUNT CLOSURE AND DATA EXPORT:
+• Export important data before closing account
+• Download password manager data and security reports
+• Cancel recurring billing before account closure
+• Contact support for complete account deletion
+• Allow 30-90 days for complete data removal from systems
+
+🆘 ESCALATION AND ADVANCED SUPPORT:
+
+📞 WHEN TO CONTACT ACCOUNT SUPPORT:
+• Critical account access issues affecting service
+• Billing disputes or unauthorized charges
+• Account compromise or security concerns
+• Complex family/business account configurations
+• Account transfer between users/organizations
+
+📋 ACCOUNT SUPPORT CONTACT INFORMATION:
+• General Account Support: 1-888-762-8736
+• Billing Support: 1-855-891-0011
+• Live Chat: Available through account portal
+• Email Support: accountsupport@trendmicro.com
+• Business/Enterprise: Contact dedicated business support team'''
+    },
+    {
+        'title': 'Resolution Guard - Case Closure Quality Control',
+        'link': 'https://helpcenter.trendmicro.com/en-us/resolution-guard/',
+        'snippet': '''COMPREHENSIVE RESOLUTION GUARD FRAMEWORK:
+
+✅ CASE CLOSURE READINESS ASSESSMENT:
+
+🎯 RESOLUTION CONFIDENCE SCORING (0-100):
+• 90-100: HIGH CONFIDENCE - Safe to close
+  - Customer explicitly confirms satisfaction
+  - All requested actions completed successfully
+  - No follow-up questions or concerns raised
+  - Clear understanding demonstrated by customer
+
+• 70-89: MEDIUM CONFIDENCE - Requires verification
+  - Solution provided but no clear confirmation from customer
+  - Customer responded positively but not explicitly satisfied
+  - Minor follow-up items may exist
+  - Consider proactive follow-up before closure
+
+• 0-69: LOW CONFIDENCE - DO NOT CLOSE
+  - Customer has not confirmed resolution
+  - Additional questions or concerns raised
+  - Solution only partially implemented
+  - Customer expressed confusion or frustration
+
+📋 MANDATORY PRE-CLOSURE CHECKLIST:
+
+☑️ CUSTOMER CONFIRMATION REQUIREMENTS:
+• Customer explicitly states issue is resolved
+• Customer confirms they can successfully perform the action
+• Customer indicates no additional assistance needed
+• Customer expresses satisfaction with support provided
+
+☑️ TECHNICAL VALIDATION REQUIREMENTS:
+• All troubleshooting steps completed successfully
+• Customer confirmed successful testing of solution
+• No error messages or technical issues remain
+• Follow-up verification completed where applicable
+
+☑️ DOCUMENTATION REQUIREMENTS:
+• Complete record of troubleshooting steps taken
+• Customer responses and confirmations documented
+• Final resolution clearly documented for future reference
+• Any escalation paths or alternative solutions noted
+
+🚫 PREMATURE CLOSURE PREVENTION:
+
+⚠️ RED FLAGS - NEVER CLOSE WHEN:
+• Customer says "I'll try this later" without confirming success
+• Customer stops responding mid-conversation
+• Multiple solutions provided but none confirmed working
+• Customer asks follow-up questions about the solution
+• Technical error messages still present
+• Customer expresses frustration or dissatisfaction
+
+⚠️ YELLOW FLAGS - VERIFY BEFORE CLOSING:
+• Customer says "okay" or "thanks" without specific confirmation
+• Solution provided recently without time for testing
+• Complex multi-step solution may need verification
+• Previous similar cases required follow-up
+• Customer is new to technology or product
+
+✅ GREEN SIGNALS - SAFE TO CLOSE:
+• "Yes, that fixed it completely"
+• "Everything is working perfectly now"
+• "Thank you, my issue is resolved"
+• "I can now [specific action] without problems"
+• Customer demonstrates successful completion
+
+🔄 FOLLOW-UP AND QUALITY ASSURANCE:
+
+📞 PROACTIVE FOLLOW-UP SCENARIOS:
+• Complex technical solutions (follow up in 24-48 hours)
+• Installation or configuration changes (verify after 1 week)
+• Account or billing changes (confirm next billing cycle)
+• Security-related fixes (ensure continued protection)
+• First-time customers (extra verification for satisfaction)
+
+📊 RESOLUTION QUALITY METRICS:
+• Customer satisfaction score confirmation
+• Time to resolution tracking
+• First contact resolution rate
+• Escalation avoidance rate
+• Follow-up requirement analysis
+
+💬 CUSTOMER COMMUNICATION BEST PRACTICES:
+
+🎯 CONFIRMATION QUESTIONS TO ASK:
+• "Can you confirm that [specific issue] is now working correctly?"
+• "Are you able to [specific action] without any errors?"
+• "Is there anything else I can help you with regarding this issue?"
+• "How would you rate your satisfaction with this resolution?"
+• "Do you feel confident using [solution] going forward?"
+
+📝 CLOSURE COMMUNICATION TEMPLATE:
+"Before I close this case, I want to confirm:
+1. Your [specific issue] has been resolved
+2. You can successfully [specific action]
+3. You have no additional questions
+4. You're satisfied with the support provided
+
+Please confirm each point so I can properly close your case with confidence."
+
+🔧 CASE REOPENING PROCEDURES:
+
+⏰ AUTOMATIC REOPENING TRIGGERS:
+• Customer contacts within 48 hours with same issue
+• Related error reports detected within 1 week
+• Solution verification fails during follow-up
+• Customer satisfaction score below threshold
+
+📋 REOPENING REQUIREMENTS:
+• Reference original case number and solution provided
+• Document what aspect of solution failed or was incomplete
+• Identify if issue is continuation or new related problem
+• Assign appropriate priority based on business impact
+
+🆘 ESCALATION CRITERIA:
+
+🔺 IMMEDIATE ESCALATION REQUIRED:
+• Customer explicitly requests manager/supervisor
+• Resolution attempts exceed 3 different approaches
+• Technical issue beyond current knowledge/tools
+• Customer reports urgent business impact
+• Potential security or compliance concerns
+
+📈 QUALITY IMPROVEMENT PROCESS:
+• Analyze patterns in premature closures
+• Identify training needs for support staff
+• Update knowledge base based on resolution gaps
+• Monitor customer feedback and satisfaction trends
+• Implement process improvements based on metrics'''
+    },
+    {
+        'title': 'Case Closure Confidence Analysis',
+        'link': 'https://helpcenter.trendmicro.com/en-us/case-closure-confidence/',
+        'snippet': '''ADVANCED CASE CLOSURE CONFIDENCE ASSESSMENT:
+
+🧠 AI-POWERED CONFIDENCE ANALYSIS:
+
+📊 CONVERSATION ANALYSIS FACTORS:
+• Customer language sentiment and tone progression
+• Frequency and nature of follow-up questions
+• Explicit confirmation vs. implicit acceptance
+• Time elapsed between solution and response
+• Customer expertise level and technical understanding
+
+🔍 CONFIDENCE INDICATORS BY CATEGORY:
+
+💚 HIGH CONFIDENCE INDICATORS (Score: 85-100):
+• "Perfect! That solved everything."
+• "It's working exactly as expected now."
+• "Thank you so much, you've been incredibly helpful."
+• Customer provides detailed confirmation of successful testing
+• Customer asks about unrelated topics (indicates current issue resolved)
+
+🟡 MEDIUM CONFIDENCE INDICATORS (Score: 60-84):
+• "Okay, I'll try that."
+• "That seems to have worked."
+• "I think that fixed it."
+• Brief acknowledgment without detailed confirmation
+• Customer responds quickly without testing time
+
+🔴 LOW CONFIDENCE INDICATORS (Score: 0-59):
+• "I'll let you know if it doesn't work."
+• "I'm still not sure what happened."
+• "What if this happens again?"
+• Customer asking clarifying questions about the solution
+• Silence after solution provided
+
+📈 RESOLUTION TRAJECTORY ANALYSIS:
+
+⬆️ POSITIVE TRAJECTORY SIGNS:
+• Customer frustration decreasing over time
+• Questions becoming more specific and actionable
+• Customer showing understanding of solution steps
+• Positive language increasing in recent messages
+• Customer taking ownership of solution implementation
+
+⬇️ NEGATIVE TRAJECTORY SIGNS:
+• Customer frustration maintaining or increasing
+• Repeated questions about same concepts
+• Customer expressing doubt about solution viability
+• Negative language persisting in conversation
+• Customer delegating to others instead of implementing
+
+🎯 CONTEXTUAL CONFIDENCE MODIFIERS:
+
+📞 COMMUNICATION CHANNEL FACTORS:
+• Phone: Higher confidence due to real-time verification
+• Chat: Medium confidence, good for quick confirmations
+• Email: Lower baseline confidence, requires explicit confirmation
+• Self-service: Lowest confidence, needs follow-up verification
+
+⏰ TIMING FACTORS:
+• Immediate response to solution: Lower confidence (insufficient testing time)
+• 15-30 minutes after solution: Optimal confidence window
+• Hours later: Higher confidence if positive
+• Days later: Highest confidence for complex solutions
+
+👤 CUSTOMER TYPE MODIFIERS:
+• Technical users: Higher confidence with technical confirmations
+• Business users: Medium confidence, need practical confirmations
+• Home users: Lower baseline, need simple language confirmations
+• First-time users: Lowest baseline, require extra verification
+
+🔄 DYNAMIC CONFIDENCE SCORING:
+
+📋 REAL-TIME ASSESSMENT ALGORITHM:
+1. Baseline confidence: 50 points
+2. Add/subtract based on customer language sentiment
+3. Modify based on solution complexity and customer expertise
+4. Adjust for communication channel and timing
+5. Factor in conversation trajectory and resolution pattern
+
+⚡ CONFIDENCE SCORE TRIGGERS:
+• Score 85+: Approve for closure with standard follow-up
+• Score 70-84: Require additional confirmation before closure
+• Score 55-69: Mandatory verification call/email before closure
+• Score <55: Do not close, continue troubleshooting or escalate
+
+🛡️ QUALITY SAFEGUARDS:
+
+🔒 AUTOMATED CLOSURE PREVENTION:
+• Block closure if confidence score below threshold
+• Require supervisor override for low-confidence closures
+• Flag cases with declining confidence trajectories
+• Alert for unusual closure patterns or timing
+
+📊 CONFIDENCE CALIBRATION:
+• Regular review of confidence scores vs. actual outcomes
+• Adjustment of scoring algorithms based on reopening rates
+• Training data improvement from successful resolutions
+• Feedback loop integration from customer satisfaction surveys
+
+🎖️ BEST PRACTICES FOR HIGH-CONFIDENCE CLOSURES:
+
+✅ PROACTIVE VERIFICATION TECHNIQUES:
+• Ask specific action-based confirmation questions
+• Request customer to demonstrate solution working
+• Provide clear success criteria for customer to verify
+• Offer specific timeframe for testing before closure
+• Set expectations for follow-up communication
+
+📝 DOCUMENTATION EXCELLENCE:
+• Record exact customer confirmation language
+• Document all verification steps completed
+• Note any remaining concerns or follow-up items
+• Include confidence score rationale in case notes
+• Prepare handoff information for potential reopening
+
+🔮 PREDICTIVE CLOSURE SUCCESS:
+• Historical pattern analysis for similar issues
+• Customer behavior profiling for closure preferences
+• Solution complexity correlation with success rates
+• Follow-up requirement prediction based on case characteristics'''
+    }
+]
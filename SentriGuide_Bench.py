@@ -0,0 +1,233 @@
+"""SentriGuide benchmark suite
+
+Times the analysis hot paths on synthetic conversations of 5, 50 and 500 turns
+and reports ops/sec, p50/p99 latency and peak memory. Results can be saved as a
+JSON baseline and compared against a later run:
+
+    python SentriGuide_Bench.py --save baseline.json
+    python SentriGuide_Bench.py --compare baseline.json
+"""
+import sys
+import time
+import json
+import random
+import argparse
+import platform
+import tracemalloc
+
+import SentriGuide_AI as sg
+
+# =============================
+# Benchmark Configuration
+# =============================
+BENCH_SIZES = (5, 50, 500)  # Conversation lengths in turns
+BENCH_ITERATIONS = 200  # Timed calls per benchmark
+BENCH_WARMUP = 10  # Untimed calls before timing starts
+BENCH_SEED = 1234  # Seed for synthetic conversations
+BENCH_REGRESSION_THRESHOLD = 0.10  # p50 slowdown reported as a regression when comparing
+BENCH_FORMAT_VERSION = 1
+
+CUSTOMER_LINES = (
+    "My antivirus scan keeps failing with an error",
+    "I need to renew my subscription before it expires",
+    "The VPN won't start after the last update",
+    "I'm really frustrated, this is the third time I've contacted support!",
+    "This is urgent, I think my computer has a virus",
+    "Thanks, that worked perfectly",
+    "It's still not working, the scan is stuck at 40%",
+    "How do I install Maximum Security on a new laptop?",
+    "I want a refund for the duplicate charge on my card",
+    "My computer is really slow since installing the security update"
+)
+# Every conversation ends on this message, which takes the general Help Center search route
+FINAL_CUSTOMER_LINE = "My antivirus found malware and the scan is slow"
+
+ENGINEER_LINES = (
+    "I understand how frustrating that is. Let me help you: first open the main console, then click Scan.",
+    "Please navigate to your account portal and select Renew, then enter your activation code.",
+    "Step 1: download the installer. Step 2: run it and follow these steps to activate your license.",
+    "I'm sorry for the trouble. Could you check whether real-time protection is enabled?",
+    "Is the issue resolved now, or are you still seeing the error?",
+    "Let me check the quarantine settings and configure the firewall for you."
+)
+
+# =============================
+# Synthetic Conversations
+# =============================
+def build_conversation(turns, seed=BENCH_SEED):
+    """Return a reproducible conversation_history of `turns` messages ending with a customer message"""
+    rng = random.Random(f"{seed}-{turns}")
+    history = []
+    for index in range(turns):
+        role = "customer" if (turns - index) % 2 == 1 else "engineer"
+        lines = CUSTOMER_LINES if role == "customer" else ENGINEER_LINES
+        content = FINAL_CUSTOMER_LINE if index == turns - 1 else rng.choice(lines)
+        history.append({"role": role, "content": content, "timestamp": f"{9 + index // 60 % 12:02d}:{index % 60:02d}"})
+    return history
+
+def build_engine(history):
+    """Return a headless engine holding `history`"""
+    engine = sg.SentriGuideEngine()
+    engine.llm_backend = None  # Benchmarks time the local confidence model only
+    for message in history:
+        engine.add_message(message["role"], message["content"], message["timestamp"])
+    return engine
+
+def build_operations(turns):
+    """Return {benchmark name: zero-argument callable} for a conversation of `turns` messages"""
+    history = build_conversation(turns)
+    engine = build_engine(history)
+    latest_engineer_msg = next(message["content"] for message in reversed(history) if message["role"] == "engineer")
+    knowledge_text = sg.build_knowledge_suggestions(FINAL_CUSTOMER_LINE)
+
+    def summarize_cold():
+        engine.summarizer = sg.IncrementalSummarizer()
+        engine.compactor = sg.ConversationCompactor()
+        engine.update_conversation_summary()
+
+    def surface_knowledge_uncached():
+        sg.help_center_cache.clear()
+        engine.solution_history.clear()
+        engine.surface_dynamic_knowledge()
+
+    def search_help_center_uncached():
+        sg.help_center_cache.clear()
+        sg.fetch_trend_micro_articles("scan malware")
+
+    return {
+        "analyze_sentiment_and_tone": engine.analyze_sentiment_and_tone,
+        "update_conversation_summary": summarize_cold,
+        "surface_dynamic_knowledge": surface_knowledge_uncached,
+        "calculate_resolution_confidence": engine.calculate_resolution_confidence,
+        "analyze_coaching_performance": engine.analyze_coaching_performance,
+        "analyze_empathy_level": lambda: sg.analyze_empathy_level(latest_engineer_msg, "frustrated"),
+        "analyze_technical_accuracy": lambda: sg.analyze_technical_accuracy(latest_engineer_msg),
+        "analyze_communication_clarity": lambda: sg.analyze_communication_clarity(latest_engineer_msg),
+        "analyze_session_progress": lambda: sg.analyze_session_progress(engine.conversation_history, engine.resolution_confidence),
+        "get_solution_summary": lambda: sg.get_solution_summary(knowledge_text),
+        "fetch_trend_micro_articles": search_help_center_uncached,
+        "get_solution_bullets": lambda: sg.get_solution_bullets(f"{sg.HELP_CENTER_BASE_URL}/en-us/article/tmka-19521", "Full Scan")
+    }
+
+# =============================
+# Measurement
+# =============================
+def measure(operation, iterations=BENCH_ITERATIONS, warmup=BENCH_WARMUP):
+    """Time an operation; returns ops/sec, p50/p99 latency and peak traced memory
+
+    Memory is traced in a separate call so tracing overhead stays out of the timings.
+    """
+    for _ in range(warmup):
+        operation()
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        operation()
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    samples.sort()
+    return {
+        "ops_per_s": round(len(samples) / sum(samples), 1) if sum(samples) else 0.0,
+        "p50_us": round(samples[len(samples) // 2] * 1e6, 1),
+        "p99_us": round(samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1e6, 1),
+        "peak_kib": round(peak_bytes / 1024, 1)
+    }
+
+def run_benchmarks(sizes=BENCH_SIZES, iterations=BENCH_ITERATIONS, only=None, latency=0.0, page_size=0):
+    """Run every benchmark against a local Help Center stand-in; returns {"<name>/<turns>": stats}"""
+    help_center = sg.LocalHelpCenterServer(latency=latency, page_size=page_size).start()
+    sg.HELP_CENTER_OFFLINE = False
+    sg.help_center_cache = sg.HelpCenterCache(path=None)
+    sg.set_help_center_base_url(help_center.url)
+    sg.get_knowledge_index()
+
+    results = {}
+    try:
+        for turns in sizes:
+            for name, operation in build_operations(turns).items():
+                if only and not any(pattern in name for pattern in only):
+                    continue
+                results[f"{name}/{turns}"] = measure(operation, iterations)
+    finally:
+        help_center.stop()
+    return results
+
+def build_baseline(results):
+    """Wrap benchmark results with the environment they were measured in"""
+    return {
+        "format": BENCH_FORMAT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results
+    }
+
+def compare_results(baseline, results, threshold=BENCH_REGRESSION_THRESHOLD):
+    """Compare results with a saved baseline; returns [(name, old p50, new p50, change, regressed)]"""
+    rows = []
+    for name, stats in results.items():
+        old_stats = baseline["results"].get(name)
+        if old_stats is None or not old_stats["p50_us"]:
+            continue
+        change = stats["p50_us"] / old_stats["p50_us"] - 1
+        rows.append((name, old_stats["p50_us"], stats["p50_us"], change, change > threshold))
+    return rows
+
+# =============================
+# Reporting
+# =============================
+def print_results(results):
+    print(f"{'benchmark':<42} {'ops/s':>12} {'p50 µs':>10} {'p99 µs':>10} {'peak KiB':>10}")
+    for name, stats in results.items():
+        print(f"{name:<42} {stats['ops_per_s']:>12,.1f} {stats['p50_us']:>10,.1f} {stats['p99_us']:>10,.1f} {stats['peak_kib']:>10,.1f}")
+
+def print_comparison(rows, threshold):
+    print(f"\n{'benchmark':<42} {'base p50':>10} {'p50':>10} {'change':>8}")
+    for name, old_p50, new_p50, change, regressed in rows:
+        print(f"{name:<42} {old_p50:>10,.1f} {new_p50:>10,.1f} {change:>+8.1%}{'  ⚠️ regression' if regressed else ''}")
+    regressions = sum(1 for row in rows if row[4])
+    if regressions:
+        print(f"❌ {regressions} benchmark(s) slowed down by more than {threshold:.0%}")
+    else:
+        print(f"✅ No p50 regressions beyond {threshold:.0%}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the SentriGuide analysis hot paths")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(BENCH_SIZES), help="conversation lengths in turns")
+    parser.add_argument("--iterations", type=int, default=BENCH_ITERATIONS, help="timed calls per benchmark")
+    parser.add_argument("--only", nargs="+", help="run benchmarks whose name contains any of these")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds the stand-in Help Center adds to each response")
+    parser.add_argument("--page-size", type=int, default=0, help="minimum Help Center page size in bytes")
+    parser.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a saved JSON baseline")
+    parser.add_argument("--threshold", type=float, default=BENCH_REGRESSION_THRESHOLD, help="p50 slowdown treated as a regression")
+    args = parser.parse_args(argv)
+
+    print(f"⏱️ SentriGuide benchmarks: sizes {args.sizes}, {args.iterations} iterations each")
+    results = run_benchmarks(args.sizes, args.iterations, args.only, args.latency, args.page_size)
+    print_results(results)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as baseline_file:
+            json.dump(build_baseline(results), baseline_file, indent=2)
+        print(f"💾 Baseline saved to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        rows = compare_results(baseline, results, args.threshold)
+        print_comparison(rows, args.threshold)
+        if any(row[4] for row in rows):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import SentriGuide_AI as sg
+
+ARTICLES = [
+    {'title': "Renew your subscription", 'link': "", 'snippet': "Renew a Trend Micro subscription from your account portal."},
+    {'title': "Install Maximum Security", 'link': "", 'snippet': "Download the installer and follow the setup steps."},
+    {'title': "Renewal billing questions", 'link': "", 'snippet': "Renew or cancel automatic renewal and review billing."},
+    {'title': "Run a full scan", 'link': "", 'snippet': "Scan your computer for viruses and malware."}
+]
+
+def test_search_scores_are_positive_and_best_first():
+    index = sg.KnowledgeIndex(ARTICLES)
+    results = index.search_scores("renew subscription", limit=3)
+
+    assert results
+    scores = [score for score, _ in results]
+    assert all(score > 0 for score in scores)
+    assert scores == sorted(scores, reverse=True)
+    assert results[0][1] == 0
+
+def test_search_scores_ties_keep_corpus_order():
+    articles = [{'title': "Scan help", 'link': "", 'snippet': "scan"} for _ in range(3)]
+    results = sg.KnowledgeIndex(articles).search_scores("scan", limit=3)
+
+    assert [doc_id for _, doc_id in results] == [0, 1, 2]
+    assert len({score for score, _ in results}) == 1
+
+def test_search_matches_search_scores_order():
+    index = sg.KnowledgeIndex(ARTICLES)
+
+    assert index.search("renew subscription") == [ARTICLES[doc_id] for _, doc_id in index.search_scores("renew subscription")]
@@ -0,0 +1,48 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import SentriGuide_AI as sg
+from SentriGuide_Articles import FALLBACK_ARTICLES
+
+def build_pack(tmp_path):
+    path = str(tmp_path / "knowledge.sgkp")
+    sg.run_cli(["build-knowledge-pack", path])
+    return path
+
+def test_built_pack_reads_back_the_same_articles(tmp_path):
+    pack = sg.KnowledgePack(build_pack(tmp_path))
+    try:
+        assert len(pack) == len(FALLBACK_ARTICLES)
+        for packed, article in zip(pack.articles, FALLBACK_ARTICLES):
+            assert {field: packed[field] for field in sg.KNOWLEDGE_PACK_FIELDS} == {field: str(article[field]) for field in sg.KNOWLEDGE_PACK_FIELDS}
+    finally:
+        pack.close()
+
+def test_wrong_magic_falls_back_to_built_in_articles(tmp_path):
+    path = build_pack(tmp_path)
+    with open(path, "r+b") as pack_file:
+        pack_file.write(b"XXXX")
+
+    assert sg.load_fallback_articles(path) is FALLBACK_ARTICLES
+
+def test_wrong_version_falls_back_to_built_in_articles(tmp_path):
+    path = build_pack(tmp_path)
+    with open(path, "r+b") as pack_file:
+        pack_file.seek(len(sg.KNOWLEDGE_PACK_MAGIC))
+        pack_file.write((sg.KNOWLEDGE_PACK_VERSION + 1).to_bytes(2, "little"))
+
+    assert sg.load_fallback_articles(path) is FALLBACK_ARTICLES
+
+def test_truncated_pack_falls_back_to_built_in_articles(tmp_path, monkeypatch):
+    path = build_pack(tmp_path)
+    with open(path, "r+b") as pack_file:
+        pack_file.truncate(os.path.getsize(path) - 2000)
+
+    monkeypatch.setattr(sg, "KNOWLEDGE_PACK_PATH", path)
+    monkeypatch.setattr(sg, "_fallback_corpus", None)
+    corpus = sg.get_fallback_corpus()
+
+    assert not any(isinstance(article, sg.PackedArticle) for article in corpus.articles)
+    assert [dict(article) for article in corpus.articles] == [dict(article) for article in FALLBACK_ARTICLES]